@@ -14,6 +14,7 @@ from covsirphy.util.plotting import line_plot
 from covsirphy.util.map import jpn_map
 from covsirphy.util.optimize import Optimizer
 from covsirphy.util.stopwatch import StopWatch
+from covsirphy.util.worker_pool import WorkerPool
 from covsirphy.util.error import deprecate
 from covsirphy.util.error import SubsetNotFoundError, ScenarioNotFoundError, UnExecutedError
 from covsirphy.util.error import PCRIncorrectPreconditionError
@@ -42,17 +43,23 @@ from covsirphy.ode.sewirf import SEWIRF
 # simulation
 from covsirphy.simulation.estimator import Estimator
 from covsirphy.simulation.simulator import ODESimulator
+from covsirphy.simulation.grid_simulator import GridSimulator
 # phase
 from covsirphy.phase.trend import Trend
 from covsirphy.phase.sr_change import ChangeFinder
 from covsirphy.phase.phase_unit import PhaseUnit
+from covsirphy.phase.phase_index import PhaseIndex
 from covsirphy.phase.phase_series import PhaseSeries
 from covsirphy.phase.phase_estimator import MPEstimator
+from covsirphy.phase.record_store import SharedRecordStore
+from covsirphy.phase.checkpoint import EstimationCheckpoint
+from covsirphy.phase.telemetry import EstimationTelemetry, JSONLinesSink, PrometheusSink
 # analysis
 from covsirphy.analysis.example_data import ExampleData
 from covsirphy.analysis.data_handler import DataHandler
 from covsirphy.analysis.param_tracker import ParamTracker
 from covsirphy.analysis.scenario import Scenario
+from covsirphy.analysis.backtester import Backtester
 from covsirphy.analysis.model_validator import ModelValidator
 # worldwide
 from covsirphy.worldwide.policy import PolicyMeasures
@@ -66,16 +73,17 @@ def get_version():
 
 
 __all__ = [
-    "ExampleData", "Scenario", "ModelValidator", "ParamTracker",
-    "ODESimulator", "ChangeFinder", "DataHandler",
-    "PhaseSeries", "PhaseUnit", "MPEstimator",
+    "ExampleData", "Scenario", "Backtester", "ModelValidator", "ParamTracker",
+    "ODESimulator", "GridSimulator", "ChangeFinder", "DataHandler",
+    "PhaseSeries", "PhaseUnit", "PhaseIndex", "MPEstimator", "SharedRecordStore",
+    "EstimationCheckpoint", "EstimationTelemetry", "JSONLinesSink", "PrometheusSink",
     "Term", "CleaningBase", "DataLoader", "COVID19DataHub",
     "JHUData", "CountryData", "PopulationData", "OxCGRTData",
     "LinelistData", "PCRData", "JapanData", "JHUDataComplementHandler",
     "ModelBase", "SIR", "SIRD", "SIRF", "SIRFV", "SEWIRF",
     "Estimator", "Trend", "Optimizer",
     "line_plot", "jpn_map", "StopWatch", "deprecate", "find_args",
-    "save_dataframe",
+    "save_dataframe", "WorkerPool",
     "PolicyMeasures",
     "SubsetNotFoundError", "ScenarioNotFoundError", "UnExecutedError",
     "PCRIncorrectPreconditionError",
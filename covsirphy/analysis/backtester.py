@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import functools
+from multiprocessing import cpu_count, Pool
+import numpy as np
+import pandas as pd
+from covsirphy.cleaning.term import Term
+from covsirphy.ode.mbase import ModelBase
+from covsirphy.util.argument import find_args
+from covsirphy.util.worker_pool import WorkerPool
+from covsirphy.phase.sr_change import ChangeFinder
+from covsirphy.analysis.param_tracker import ParamTracker
+
+
+class Backtester(Term):
+    """
+    Rolling-origin backtesting of S-R trend analysis, parameter estimation and simulation.
+
+    Args:
+        record_df (pandas.DataFrame): records, refer to covsirphy.ParamTracker
+            Index:
+                reset index
+            Columns:
+                - Date (pd.TimeStamp): Observation date
+                - Confirmed (int): the number of confirmed cases
+                - Infected (int): the number of currently infected cases
+                - Fatal (int): the number of fatal cases
+                - Recovered (int): the number of recovered cases
+                - Susceptible (int): the number of susceptible cases
+        population (int): population value
+        area (str or None): area name, like Japan/Tokyo, or empty string
+        tau (int or None): tau value [min]
+
+    Notes:
+        For each forecast origin, records until the origin will be used to create a phase series
+        with S-R trend analysis and parameter estimation. Then the parameter values of the last phase
+        will be used to forecast the number of cases after the origin.
+
+    Examples:
+        >>> backtester = cs.Backtester(record_df, population=1_000_000, tau=720)
+        >>> backtester.run(cs.SIRF, origins=["01Jun2020", "01Jul2020"], horizons=[7, 14, 28])
+    """
+
+    def __init__(self, record_df, population, area=None, tau=None):
+        self._record_df = self.ensure_dataframe(record_df, name="record_df", columns=self.SUB_COLUMNS)
+        self._population = self.ensure_natural_int(population, name="population")
+        self._area = area or ""
+        self._tau = self.ensure_tau(tau)
+        dates = self._record_df[self.DATE]
+        self._first_date = dates.min().strftime(self.DATE_FORMAT)
+        self._last_date = dates.max().strftime(self.DATE_FORMAT)
+
+    def run(self, model, origins, horizons, metrics="RMSLE", variables=None, n_jobs=-1, pool=None, **kwargs):
+        """
+        Forecast the number of cases from the origins and evaluate the errors with the records.
+
+        Args:
+            model (covsirphy.ModelBase): ODE model
+            origins (list[str]): forecast origins, the last dates of the records to use
+            horizons (list[int]): how many days after the origins to evaluate, natural integers
+            metrics (str): "MAE", "MSE", "MSLE", "RMSE" or "RMSLE"
+            variables (list[str] or None): variables to use in calculation
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            kwargs: keyword arguments of ChangeFinder() and covsirphy.Estimator.run()
+
+        Raises:
+            ValueError: some origins are not in the range of the records
+
+        Returns:
+            tuple(pandas.DataFrame, dict[str, str]):
+                - scores of the origins and the horizons
+                    Index:
+                        reset index
+                    Columns:
+                        - Origin (str): forecast origin
+                        - Horizon (int): the number of days after the origin
+                        - metrics name (float): score of the forecast from the next date of the origin to the horizon
+                - error messages of the failed origins
+
+        Notes:
+            If @variables is None, ["Infected", "Fatal", "Recovered"] will be used.
+            Scores will be NaN when the records do not cover the horizon.
+            Each origin will be analysed in a worker process and parameter estimation will be done serially there.
+            When @pool is applied, @n_jobs will be ignored and the pool will not be closed here.
+            Failure of an origin (e.g. too few records) does not stop the analysis of the other origins.
+        """
+        model = self.ensure_subclass(model, ModelBase, name="model")
+        origins = self.ensure_list(origins, name="origins")
+        for origin in origins:
+            self.ensure_date_order(self._first_date, origin, name="origins")
+            self.ensure_date_order(origin, self._last_date, name="origins")
+        horizons = [
+            self.ensure_natural_int(horizon, name="horizons") for horizon in self.ensure_list(horizons, name="horizons")]
+        if metrics not in ParamTracker.METRICS_DICT:
+            metrics_str = ", ".join(list(ParamTracker.METRICS_DICT.keys()))
+            raise ValueError(f"@metrics must be selected from {metrics_str}, but {metrics} was applied.")
+        variables = self.ensure_list(variables or [self.CI, self.F, self.R], self.VALUE_COLUMNS, name="variables")
+        if pool is not None:
+            pool = self.ensure_instance(pool, WorkerPool, name="pool")
+            n_jobs = pool.n_jobs
+        n_jobs = cpu_count() if n_jobs == -1 else self.ensure_natural_int(n_jobs, name="n_jobs")
+        run_f = functools.partial(
+            self._run_origin, model=model, horizons=horizons, metrics=metrics, variables=variables, **kwargs)
+        # Later origins (with more phases) first to balance the load of the workers
+        jobs = sorted(set(origins), key=self.date_ordinal, reverse=True)
+        if n_jobs == 1 and pool is None:
+            results = [run_f(job) for job in jobs]
+        elif pool is None:
+            with Pool(min(n_jobs, max(len(jobs), 1))) as p:
+                results = list(p.imap_unordered(run_f, jobs, chunksize=1))
+        else:
+            results = list(pool.imap_unordered(run_f, jobs, chunksize=1))
+        score_dict = {origin: scores for (origin, scores, _) in results if scores is not None}
+        error_dict = {origin: errmsg for (origin, _, errmsg) in results if errmsg is not None}
+        records = [
+            {"Origin": origin, "Horizon": horizon, metrics: score}
+            for origin in dict.fromkeys(origins) if origin in score_dict
+            for (horizon, score) in zip(horizons, score_dict[origin])
+        ]
+        df = pd.DataFrame(records, columns=["Origin", "Horizon", metrics])
+        return (df, error_dict)
+
+    def _run_origin(self, origin, model, horizons, metrics, variables, **kwargs):
+        """
+        Forecast the number of cases from the origin and evaluate the errors.
+
+        Args:
+            origin (str): forecast origin
+            model (covsirphy.ModelBase): ODE model
+            horizons (list[int]): how many days after the origin to evaluate
+            metrics (str): "MAE", "MSE", "MSLE", "RMSE" or "RMSLE"
+            variables (list[str]): variables to use in calculation
+            kwargs: keyword arguments of ChangeFinder() and covsirphy.Estimator.run()
+
+        Returns:
+            tuple(str, list[float] or None, str or None): origin, scores of the horizons and error message
+        """
+        trend_kwargs = find_args(ChangeFinder, **kwargs)
+        est_kwargs = {k: v for (k, v) in kwargs.items() if k not in trend_kwargs}
+        try:
+            record_df = self._record_df.loc[self._record_df[self.DATE] <= self.date_obj(origin)]
+            series = ParamTracker.create_series(
+                first_date=self._first_date, last_date=origin, population=self._population)
+            tracker = ParamTracker(record_df=record_df, phase_series=series, area=self._area, tau=self._tau)
+            tracker.trend(force=True, show_figure=False, **trend_kwargs)
+            tracker.estimate(model, n_jobs=1, **est_kwargs)
+            tracker.add(days=max(horizons))
+            sim_df = tracker.simulate().set_index(self.DATE)
+        except Exception as e:
+            return (origin, None, f"{type(e).__name__}: {e}")
+        rec_df = self._record_df.set_index(self.DATE)
+        start_obj = self.date_obj(self.tomorrow(origin))
+        scores = []
+        for horizon in horizons:
+            end_date = self.date_change(origin, days=horizon)
+            if self.date_ordinal(end_date) > self.date_ordinal(self._last_date):
+                scores.append(np.nan)
+                continue
+            end_obj = self.date_obj(end_date)
+            scores.append(ParamTracker.METRICS_DICT[metrics](
+                rec_df.loc[start_obj:end_obj, variables], sim_df.loc[start_obj:end_obj, variables]))
+        return (origin, scores, None)
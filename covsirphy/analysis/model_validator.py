@@ -45,7 +45,7 @@ class ModelValidator(Term):
         # To avoid "imported but unused"
         self.__swifter = swifter
 
-    def run(self, model, timeout=180, allowance=(0.98, 1.02), n_jobs=-1):
+    def run(self, model, timeout=180, allowance=(0.98, 1.02), n_jobs=-1, pool=None):
         """
         Execute model validation.
 
@@ -54,6 +54,7 @@ class ModelValidator(Term):
             timeout (int): time-out of run
             allowance (tuple(float, float)): the allowance of the predicted value
             n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
 
         Returns:
             covsirphy.ModelValidator: self
@@ -67,7 +68,7 @@ class ModelValidator(Term):
         processor = self._processor(model, df)
         # Parameter estimation
         units_estimated = processor.run(
-            timeout=timeout, allowance=allowance, n_jobs=n_jobs)
+            timeout=timeout, allowance=allowance, n_jobs=n_jobs, pool=pool)
         # Get estimated parameters
         self._results.append(self._get_result(model, df, units_estimated))
         return self
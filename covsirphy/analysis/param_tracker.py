@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
 import numpy as np
 import sklearn
 from covsirphy.util.error import UnExecutedError
@@ -45,10 +46,35 @@ class ParamTracker(Term):
             phase_series, PhaseSeries, name="phase_seres")
         self.area = area or ""
         self.tau = self.ensure_tau(tau)
+        # Memo of simulation: version of the phase series and {y0_dict: simulated records}
+        self._sim_version = None
+        self._sim_dict = {}
 
     def __len__(self):
         return len(self._series)
 
+    def copy(self, phase_series=None):
+        """
+        Return a copy of the tracker, sharing the records and the phase units with this tracker.
+
+        Args:
+            phase_series (covsirphy.PhaseSeries or None): phase series to register or None (copy of the current series)
+
+        Returns:
+            covsirphy.ParamTracker: copied tracker
+
+        Notes:
+            Records will not be changed by trackers and will be shared without copying.
+            Phase units will be copied when they are changed (copy-on-write). Please refer to PhaseSeries.copy().
+            Simulated records memoized with ParamTracker.simulate() will be shared until the phases are changed.
+        """
+        tracker = copy.copy(self)
+        if phase_series is None:
+            tracker._series = self._series.copy()
+        else:
+            tracker._series = self.ensure_instance(phase_series, PhaseSeries, name="phase_series")
+        return tracker
+
     @staticmethod
     def create_series(first_date, last_date, population):
         """
@@ -72,6 +98,28 @@ class ParamTracker(Term):
         """
         return self._series
 
+    @property
+    def version(self):
+        """
+        int: version of the phases, which will be updated when phases are changed with add(), delete() etc.
+        """
+        return self._series.version
+
+    @property
+    def sr_df(self):
+        """
+        pandas.DataFrame: susceptible and recovered records in the period of the phase series
+            Index:
+                Date (pd.TimeStamp): Observation date
+            Columns:
+                - Recovered (int): the number of recovered cases
+                - Susceptible (int): the number of susceptible cases
+        """
+        df = self.record_df.set_index(self.DATE).loc[:, [self.R, self.S]]
+        sta = self.date_obj(self._series.first_date)
+        end = self.date_obj(self._series.last_date)
+        return df.loc[(df.index >= sta) & (df.index <= end), :]
+
     def trend(self, force=True, show_figure=False, filename=None, **kwargs):
         """
         Split the records with trend analysis.
@@ -85,7 +133,7 @@ class ParamTracker(Term):
         Returns:
             covsirphy.PhaseSeries
         """
-        sr_df = self.record_df.set_index(self.DATE).loc[:, [self.R, self.S]]
+        sr_df = self.sr_df
         if force or not self._series:
             self._series.trend(sr_df=sr_df, **kwargs)
         if show_figure:
@@ -114,12 +162,11 @@ class ParamTracker(Term):
         """
         self._ensure_phase_setting()
         self.ensure_date(date)
-        phase_nest = [
-            (self.num2str(i), unit) for (i, unit) in enumerate(self._series) if date in unit]
-        try:
-            return phase_nest[0]
-        except IndexError:
-            raise IndexError(f"Phase on {date} is not registered.") from None
+        position = self._series.phase_index.find(date)
+        if position is None:
+            raise IndexError(f"Phase on {date} is not registered.")
+        phase = self.num2str(position)
+        return (phase, self._series.unit(phase))
 
     def change_dates(self):
         """
@@ -299,14 +346,15 @@ class ParamTracker(Term):
             covsirphy.PhaseSeries
         """
         phase, old = self.find_phase(date)
-        if date in self.near_change_dates():
+        ordinal = self.date_ordinal(date)
+        if ordinal - old.start_ordinal <= 1 or old.end_ordinal - ordinal <= 1:
             raise ValueError(
                 f"Cannot be separated on {date} because this date is too close to registered change dates.")
         new_pre = PhaseUnit(
             old.start_date, self.yesterday(date), old.population)
         setting_dict = old.to_dict()
         setting_dict.update(kwargs)
-        new_pre.set_ode(**setting_dict)
+        new_pre.set_ode(model=old.model, **setting_dict)
         new_fol = PhaseUnit(date, old.end_date, population or old.population)
         new_fol.set_ode(model=old.model, **setting_dict)
         self._series.replaces(phase, [new_pre, new_fol])
@@ -336,14 +384,13 @@ class ParamTracker(Term):
             for (num, unit) in enumerate(self._series)
             if unit and unit <= last_date
         ]
-        past_phases, past_units = zip(*past_nest)
+        past_phases, _ = zip(*past_nest)
         # Select phases to use
         selected_phases = self.ensure_list(
             phases or past_phases, candidates=past_phases, name="phases")
-        final_phases = list(set(selected_phases) & set(past_phases))
-        # Convert phase names to phase units
-        selected_units = [self._series.unit(ph) for ph in selected_phases]
-        final_units = list(set(selected_units) & set(past_units))
+        selected_set = set(selected_phases)
+        final_nest = [[ph, unit] for (ph, unit) in past_nest if ph in selected_set]
+        final_phases, final_units = [list(values) for values in zip(*final_nest)]
         return (final_phases, final_units)
 
     def future_phases(self):
@@ -368,7 +415,7 @@ class ParamTracker(Term):
             return ([], [])
         return tuple(zip(*future_nest))
 
-    def estimate(self, model, phases=None, n_jobs=-1, **kwargs):
+    def estimate(self, model, phases=None, n_jobs=-1, pool=None, **kwargs):
         """
         Perform parameter estimation for each phases.
 
@@ -376,6 +423,7 @@ class ParamTracker(Term):
             model (covsirphy.ModelBase): ODE model
             phases (list[str]): list of phase names, like 1st, 2nd...
             n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
             kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
 
         Returns:
@@ -389,7 +437,7 @@ class ParamTracker(Term):
         self._ensure_phase_setting()
         model = self.ensure_subclass(model, ModelBase, "model")
         units = [
-            unit.set_id(phase=phase)
+            unit.copy().set_id(phase=phase)
             for (phase, unit) in zip(*self.past_phases(phases=phases))
             if unit.id_dict is None
         ]
@@ -400,7 +448,7 @@ class ParamTracker(Term):
             record_df=self.record_df, model=model, tau=self.tau, **kwargs
         )
         mp_estimator.add(units)
-        results = mp_estimator.run(n_jobs=n_jobs, **kwargs)
+        results = mp_estimator.run(n_jobs=n_jobs, pool=pool, **kwargs)
         self.tau = mp_estimator.tau
         # Register the results
         self._series.replaces(phase=None, new_list=results, keep_old=True)
@@ -422,12 +470,21 @@ class ParamTracker(Term):
                     - Country (str): country/region name
                     - Province (str): province/prefecture/state name
                     - Variables of the model and dataset (int): Confirmed etc.
+
+        Notes:
+            Results will be memoized with the version of the phases and @y0_dict
+            and re-used until the phases are changed.
         """
         self._ensure_phase_setting()
-        try:
-            return self._series.simulate(record_df=self.record_df, y0_dict=y0_dict)
-        except NameError:
-            raise UnExecutedError(".estimate()")
+        if self._sim_version != self.version:
+            self._sim_version, self._sim_dict = self.version, {}
+        key = None if y0_dict is None else tuple(sorted(y0_dict.items()))
+        if key not in self._sim_dict:
+            try:
+                self._sim_dict[key] = self._series.simulate(record_df=self.record_df, y0_dict=y0_dict)
+            except NameError:
+                raise UnExecutedError(".estimate()")
+        return self._sim_dict[key].copy()
 
     def _compare_with_actual(self, variables, y0_dict=None):
         """
@@ -1,13 +1,22 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-import copy
+from concurrent.futures import CancelledError
+import json
+from pathlib import Path
 import warnings
 import numpy as np
 import pandas as pd
+from covsirphy.__version__ import __version__
 from covsirphy.util.error import deprecate, ScenarioNotFoundError, UnExecutedError
+from covsirphy.util.file import save_table, load_table
+from covsirphy.util.cancellable import submit_cancellable
 from covsirphy.util.plotting import line_plot, box_plot
+from covsirphy.cleaning.jhu_data import JHUData
+from covsirphy.simulation.grid_simulator import GridSimulator
+from covsirphy.phase.phase_unit import PhaseUnit
 from covsirphy.analysis.param_tracker import ParamTracker
+from covsirphy.analysis.backtester import Backtester
 from covsirphy.analysis.data_handler import DataHandler
 
 
@@ -55,8 +64,9 @@ class Scenario(DataHandler):
             key (str): scenario name
             value (covsirphy.PhaseSeries): phase series object
         """
-        self._tracker_dict[key] = ParamTracker(
-            self.record_df, value, area=self.area, tau=self.tau)
+        tracker = self._tracker_dict.get(key, self._tracker_dict[self.MAIN]).copy(phase_series=value)
+        tracker.tau = self.tau
+        self._tracker_dict[key] = tracker
 
     @property
     def first_date(self):
@@ -135,7 +145,7 @@ class Scenario(DataHandler):
         # Un-registered and create it
         if template not in self._tracker_dict:
             raise ScenarioNotFoundError(template)
-        tracker = copy.deepcopy(self._tracker_dict[template])
+        tracker = self._tracker_dict[template].copy()
         self._tracker_dict[name] = tracker
         return tracker
 
@@ -414,7 +424,7 @@ class Scenario(DataHandler):
             self[name] = tracker.disable(phases=["0th"])
         return self
 
-    def estimate(self, model, phases=None, name="Main", n_jobs=-1, **kwargs):
+    def estimate(self, model, phases=None, name="Main", n_jobs=-1, pool=None, **kwargs):
         """
         Perform parameter estimation for each phases.
 
@@ -423,6 +433,7 @@ class Scenario(DataHandler):
             phases (list[str]): list of phase names, like 1st, 2nd...
             name (str): phase series name
             n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
             kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
 
         Notes:
@@ -436,7 +447,43 @@ class Scenario(DataHandler):
             raise ValueError(
                 "@tau must be specified when scenario = Scenario(), and cannot be specified here.")
         self.tau, self[name] = self._tracker(name).estimate(
-            model=model, phases=phases, n_jobs=n_jobs, **kwargs)
+            model=model, phases=phases, n_jobs=n_jobs, pool=pool, **kwargs)
+
+    def estimate_async(self, model, phases=None, name="Main", n_jobs=-1, executor=None, task_timeout=None, **kwargs):
+        """
+        Perform parameter estimation for each phases asynchronously.
+
+        Args:
+            model (covsirphy.ModelBase): ODE model
+            phases (list[str]): list of phase names, like 1st, 2nd...
+            name (str): phase series name
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            executor (concurrent.futures.Executor or None): thread-based executor or None (default thread pool)
+            task_timeout (float or None): time-out of the task [sec] or None (un-limited)
+            kwargs: keyword arguments of Scenario.estimate()
+
+        Returns:
+            concurrent.futures.Future: future which resolves to covsirphy.ParamTracker of the phase series
+
+        Notes:
+            The phase series will be copied and the result will be registered when estimation completed.
+            Future.cancel() stops estimation even while running. When timed out, TimeoutError will be raised.
+            In asyncio, please use "await asyncio.wrap_future(future)".
+        """
+        if self.TAU in kwargs:
+            raise ValueError(
+                "@tau must be specified when scenario = Scenario(), and cannot be specified here.")
+        tracker = self._tracker(name).copy()
+
+        def _estimate(cancel_event):
+            tau, series = tracker.estimate(
+                model=model, phases=phases, n_jobs=n_jobs, cancel_event=cancel_event, **kwargs)
+            if cancel_event.is_set():
+                raise CancelledError("Estimation was cancelled.")
+            self.tau, self[name] = tau, series
+            return self._tracker_dict[name]
+
+        return submit_cancellable(_estimate, executor=executor, timeout=task_timeout)
 
     def phase_estimator(self, phase, name="Main"):
         """
@@ -526,6 +573,94 @@ class Scenario(DataHandler):
         )
         return sim_df
 
+    def simulate_async(self, name="Main", y0_dict=None, executor=None, task_timeout=None):
+        """
+        Simulate ODE models with set/estimated parameter values asynchronously.
+
+        Args:
+            name (str): phase series name. If 'Main', main PhaseSeries will be used
+            y0_dict(dict[str, float] or None): dictionary of initial values of variables
+            executor (concurrent.futures.Executor or None): thread-based executor or None (default thread pool)
+            task_timeout (float or None): time-out of the task [sec] or None (un-limited)
+
+        Returns:
+            concurrent.futures.Future: future which resolves to the returned value of Scenario.simulate()
+
+        Notes:
+            Figure will not be shown.
+            Future.cancel() is effective before the simulation starts. When timed out, TimeoutError will be raised.
+        """
+        return submit_cancellable(
+            lambda _: self.simulate(name=name, y0_dict=y0_dict, show_figure=False),
+            executor=executor, timeout=task_timeout)
+
+    def what_if(self, param_grid, date=None, end_date=None, days=None, relative=False, name="Main"):
+        """
+        Simulate the number of cases with a grid of parameter sets from the date at once.
+
+        Args:
+            param_grid (dict[str, list[float]] or pandas.DataFrame): parameter sets to apply from @date
+                - dict: candidates of the values for each parameter, all combinations will be used
+                - pandas.DataFrame: parameter values (columns) of each set (rows)
+            date (str or None): the first date of the parameter sets or None (the next date of the last record)
+            end_date (str or None): the last date of simulation
+            days (int or None): the number of days to simulate, including @date
+            relative (bool): if True, values of @param_grid are ratios to the parameter values of the base phase
+            name (str): phase series name to get the number of cases on @date and the base phase
+
+        Raises:
+            ValueError: neither @end_date nor @days was applied or @date is not in the simulated period
+
+        Returns:
+            pandas.DataFrame: refer to covsirphy.GridSimulator.run()
+                Index:
+                    reset index
+                Columns:
+                    - parameter names of the model (float): parameter values of the sets
+                    - max(Infected) (int): max value of Infected
+                    - argmax(Infected) (str): the date when Infected shows max value
+                    - Confirmed on {end_date} (int): Confirmed on the end date
+                    - Infected on {end_date} (int): Infected on the end date
+                    - Fatal on {end_date} (int): Fatal on the end date
+
+        Notes:
+            The base phase is the last enabled phase which starts on or before @date.
+            Model, population value and tau value of the base phase will be used.
+            Parameter values not included in @param_grid are those of the base phase.
+            The number of cases on @date is the simulated value with the phase series.
+
+        Examples:
+            >>> snl.what_if({"rho": [0.5, 0.7, 0.9], "sigma": [1.0, 1.2]}, end_date="31Dec2020", relative=True)
+        """
+        if end_date is None and days is None:
+            raise ValueError("Either @end_date or @days must be applied.")
+        tracker = self._tracker(name)
+        sim_df = tracker.simulate()
+        date = date or self.tomorrow(self._last_date)
+        end_date = end_date or self.date_change(date, days=days - 1)
+        self.ensure_date_order(date, end_date, name="end_date")
+        record_df = sim_df.loc[sim_df[self.DATE] == self.date_obj(date)]
+        if record_df.empty:
+            raise ValueError(f"@date must be in the simulated period of {name} scenario, but {date} was applied.")
+        units = list(tracker.series)
+        unit = [units[i] for i in tracker.series.phase_index.between(end_date=date) if units[i]][-1]
+        model, population = unit.model, unit.population
+        # Initial values
+        y0_df = model.tau_free(record_df, population, tau=None)
+        y0_dict = {var: y0_df[var].iloc[0] for var in model.VARIABLES}
+        # Parameter sets
+        if isinstance(param_grid, dict):
+            param_grid = GridSimulator.grid(**param_grid)
+        self.ensure_dataframe(param_grid, name="param_grid")
+        self.ensure_list(param_grid.columns.tolist(), candidates=model.PARAMETERS, name="param_grid")
+        base_dict = unit.to_dict()
+        param_df = pd.DataFrame(
+            {param: base_dict[param] for param in model.PARAMETERS}, index=param_grid.index, dtype=np.float64)
+        for param in param_grid.columns:
+            param_df[param] = param_grid[param] * (base_dict[param] if relative else 1)
+        simulator = GridSimulator(model, population, unit.tau, date, y0_dict)
+        return simulator.run(param_df.reset_index(drop=True), end_date=end_date)
+
     def get(self, param, phase="last", name="Main"):
         """
         Get the parameter value of the phase.
@@ -730,17 +865,20 @@ class Scenario(DataHandler):
                     - day parameter values (float)
         """
         df = self.summary(name=name).replace(self.UNKNOWN, None)
+        series = self[name]
         # Date range to dates
-        df[self.START] = pd.to_datetime(df[self.START])
-        df[self.END] = pd.to_datetime(df[self.END])
-        df[self.DATE] = df[[self.START, self.END]].apply(
-            lambda x: pd.date_range(x[0], x[1]).tolist(), axis=1)
-        df = df.reset_index(drop=True).explode(self.DATE)
+        dates = pd.date_range(
+            self.date_obj(df[self.START].iloc[0]), self.date_obj(df[self.END].iloc[-1]), freq="D", name=self.DATE)
+        # Positions of the phases to rows of the summary (-1: disabled or not registered)
+        # The last element is for position -1 (dates not registered)
+        row_array = np.full(len(list(series)) + 1, -1)
+        row_array[[self.str2num(phase) for phase in df.index]] = np.arange(len(df))
+        rows = row_array[series.phase_index.locate(dates)]
         # Columns
         df = df.drop(
             [self.TENSE, self.START, self.END, self.ODE, self.TAU, *self.EST_COLS],
             axis=1, errors="ignore")
-        df = df.set_index(self.DATE)
+        df = df.iloc[rows[rows >= 0]].set_index(dates[rows >= 0])
         for col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
         df[self.N] = df[self.N].astype(np.int64)
@@ -979,9 +1117,135 @@ class Scenario(DataHandler):
                 pass
             # Ge the list of target phases
             phases = [
-                self.num2str(num) for (num, unit)
-                in enumerate(tracker.series)
-                if unit >= beginning_date
-            ]
+                self.num2str(num) for num in tracker.series.phase_index.between(beginning_date, self._last_date)]
         return tracker.score(
             metrics=metrics, variables=variables, phases=phases, y0_dict=y0_dict)
+
+    def backtest(self, model, origins, horizons, metrics="RMSLE", variables=None, n_jobs=-1, pool=None, **kwargs):
+        """
+        Evaluate forecast skill with rolling-origin backtesting.
+        For each origin, S-R trend analysis and parameter estimation will be done with the records until the origin
+        and the number of cases after the origin will be forecasted with the parameter values of the last phase.
+
+        Args:
+            model (covsirphy.ModelBase): ODE model
+            origins (list[str]): forecast origins, the last dates of the records to use
+            horizons (list[int]): how many days after the origins to evaluate, natural integers
+            metrics (str): "MAE", "MSE", "MSLE", "RMSE" or "RMSLE"
+            variables (list[str] or None): variables to use in calculation
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            kwargs: keyword arguments of ChangeFinder() and covsirphy.Estimator.run()
+
+        Returns:
+            pandas.DataFrame: refer to covsirphy.Backtester.run()
+                Index:
+                    reset index
+                Columns:
+                    - Origin (str): forecast origin
+                    - Horizon (int): the number of days after the origin
+                    - metrics name (float): score of the forecast from the next date of the origin to the horizon
+
+        Notes:
+            If @variables is None, ["Infected", "Fatal", "Recovered"] will be used.
+            Scores will be NaN when the records do not cover the horizon.
+            Origins will be analysed in parallel and the registered scenarios will not be changed.
+            When analysis of some origins failed, UserWarning will be raised and they will not be included.
+        """
+        backtester = Backtester(self.record_df, population=self.population, area=self.area, tau=self.tau)
+        df, error_dict = backtester.run(
+            model, origins=origins, horizons=horizons, metrics=metrics, variables=variables,
+            n_jobs=n_jobs, pool=pool, **kwargs)
+        if error_dict:
+            errors = ", ".join(f"{origin} ({errmsg})" for (origin, errmsg) in error_dict.items())
+            warnings.warn(f"Backtesting failed with some origins: {errors}", UserWarning)
+        return df
+
+    def save(self, directory):
+        """
+        Save the records, phases, parameter values and summary of estimation of all scenarios.
+
+        Args:
+            directory (str or pathlib.Path): directory to save the files (will be created if not exist)
+
+        Returns:
+            pathlib.Path: filename of the manifest
+
+        Notes:
+            Records and phases will be saved as Parquet files (or CSV files when pyarrow is not installed)
+            with manifest.json (information of the area and scenarios). Estimators of the phases will not be saved.
+        """
+        dirpath = Path(directory)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        records = [
+            {self.SERIES: name, **unit.to_record()}
+            for (name, tracker) in self._tracker_dict.items() for unit in tracker.series]
+        phase_df = pd.DataFrame(records, columns=[self.SERIES, self.START, self.END] if not records else None)
+        series_dict = {
+            name: {
+                "first_date": tracker.series.first_date,
+                "last_date": tracker.series.last_date,
+                self.N.lower(): int(tracker.series.init_population),
+                self.TAU: tracker.tau,
+            }
+            for (name, tracker) in self._tracker_dict.items()
+        }
+        manifest_dict = {
+            "version": __version__,
+            "country": self.country,
+            "province": self.province,
+            self.N.lower(): int(self.population),
+            self.TAU: self.tau,
+            "auto_complement": self._auto_complement,
+            "complemented": self._complemented,
+            "first_date": self._first_date,
+            "last_date": self._last_date,
+            "records": save_table(self.record_df, dirpath.joinpath("records")).name,
+            "phases": save_table(phase_df, dirpath.joinpath("phases")).name,
+            "scenarios": series_dict,
+        }
+        filepath = dirpath.joinpath("manifest.json")
+        filepath.write_text(json.dumps(manifest_dict, indent=4, default=PhaseUnit._convert))
+        return filepath
+
+    @classmethod
+    def load(cls, directory, jhu_data=None):
+        """
+        Load the scenarios saved with Scenario.save().
+
+        Args:
+            directory (str or pathlib.Path): directory of the saved files
+            jhu_data (covsirphy.JHUData or None): object of records, if necessary
+
+        Returns:
+            covsirphy.Scenario: the loaded scenarios
+
+        Notes:
+            @jhu_data is necessary to change the first/last date of the records or complement the records.
+        """
+        dirpath = Path(directory)
+        manifest_dict = json.loads(dirpath.joinpath("manifest.json").read_text())
+        snl = cls.__new__(cls)
+        snl.jhu_data = None if jhu_data is None else cls.ensure_instance(jhu_data, JHUData, name="jhu_data")
+        snl.population = manifest_dict[cls.N.lower()]
+        snl.country = manifest_dict["country"]
+        snl.province = manifest_dict["province"]
+        snl.area = JHUData.area_name(snl.country, snl.province)
+        snl._auto_complement = manifest_dict["auto_complement"]
+        snl._complemented = manifest_dict["complemented"]
+        snl._first_date = manifest_dict["first_date"]
+        snl._last_date = manifest_dict["last_date"]
+        snl.tau = manifest_dict[cls.TAU]
+        snl.record_df = load_table(dirpath.joinpath(manifest_dict["records"]), date_columns=[cls.DATE])
+        phase_df = load_table(dirpath.joinpath(manifest_dict["phases"]))
+        snl._tracker_dict = {}
+        for (name, series_dict) in manifest_dict["scenarios"].items():
+            series = ParamTracker.create_series(
+                first_date=series_dict["first_date"], last_date=series_dict["last_date"],
+                population=series_dict[cls.N.lower()])
+            records = phase_df.loc[phase_df[cls.SERIES] == name].to_dict(orient="records")
+            if records:
+                series.replaces(phase=None, new_list=[PhaseUnit.from_record(record) for record in records])
+            snl._tracker_dict[name] = ParamTracker(
+                record_df=snl.record_df, phase_series=series, area=snl.area, tau=series_dict[cls.TAU])
+        return snl
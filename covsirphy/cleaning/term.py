@@ -2,17 +2,50 @@
 # -*- coding: utf-8 -*-
 
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 import math
 import numpy as np
 import pandas as pd
 from covsirphy.util.error import deprecate
 
 
+@lru_cache(maxsize=8192)
+def _str2ordinal(date_str, date_format):
+    """
+    Convert a string to ordinal of the date, caching the results.
+
+    Args:
+        date_str (str): string, like 22Jan2020
+        date_format (str): format of the string
+
+    Returns:
+        int: the number of days since 01Jan0001
+    """
+    return datetime.strptime(date_str, date_format).toordinal()
+
+
+@lru_cache(maxsize=8192)
+def _ordinal2str(ordinal, date_format):
+    """
+    Convert ordinal of a date to a string, caching the results.
+
+    Args:
+        ordinal (int): the number of days since 01Jan0001
+        date_format (str): format of the string
+
+    Returns:
+        str: string, like 22Jan2020
+    """
+    return datetime.fromordinal(ordinal).strftime(date_format)
+
+
 class Term(object):
     """
     Term definition.
     """
+    # No instance attributes are defined here and sub-classes can use __slots__
+    __slots__ = ()
     # Variables of SIR-derived model
     N = "Population"
     S = "Susceptible"
@@ -401,7 +434,36 @@ class Term(object):
         """
         if date_str is None:
             return default
-        return datetime.strptime(date_str, cls.DATE_FORMAT)
+        return datetime.fromordinal(cls.date_ordinal(date_str))
+
+    @classmethod
+    def date_ordinal(cls, date_str):
+        """
+        Convert a string to ordinal of the date.
+
+        Args:
+            date_str (str): string, like 22Jan2020
+
+        Returns:
+            int: the number of days since 01Jan0001
+
+        Notes:
+            Results will be cached because the same dates are converted repeatedly.
+        """
+        return _str2ordinal(date_str, cls.DATE_FORMAT)
+
+    @classmethod
+    def ordinal_date(cls, ordinal):
+        """
+        Convert ordinal of a date to a string.
+
+        Args:
+            ordinal (int): the number of days since 01Jan0001
+
+        Returns:
+            str: string, like 22Jan2020
+        """
+        return _ordinal2str(int(ordinal), cls.DATE_FORMAT)
 
     @classmethod
     def date_change(cls, date_str, days=0):
@@ -418,8 +480,7 @@ class Term(object):
         if not isinstance(days, int):
             raise TypeError(
                 f"@days must be integer, but {type(days)} was applied.")
-        date = cls.date_obj(date_str) + timedelta(days=days)
-        return date.strftime(cls.DATE_FORMAT)
+        return cls.ordinal_date(cls.date_ordinal(date_str) + days)
 
     @classmethod
     def tomorrow(cls, date_str):
@@ -457,10 +518,9 @@ class Term(object):
             end_date (str): end date, like 01Jan2020
             tau (int): tau value [min]
         """
-        sta = cls.date_obj(start_date)
-        end = cls.date_obj(end_date)
+        days = cls.date_ordinal(end_date) - cls.date_ordinal(start_date)
         tau = cls.ensure_tau(tau)
-        return math.ceil((end - sta) / timedelta(minutes=tau))
+        return math.ceil(days * 1440 / tau)
 
     @classmethod
     def ensure_date_order(cls, previous_date, following_date, name="following_date"):
@@ -475,8 +535,8 @@ class Term(object):
         Raises:
             ValueError: @previous_date > @following_date
         """
-        previous = cls.date_obj(previous_date)
-        following = cls.date_obj(following_date)
+        previous = cls.date_ordinal(previous_date)
+        following = cls.date_ordinal(following_date)
         if previous <= following:
             return None
         raise ValueError(
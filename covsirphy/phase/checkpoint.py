@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+from pathlib import Path
+from covsirphy.cleaning.term import Term
+from covsirphy.ode.mbase import ModelBase
+
+
+class EstimationCheckpoint(Term):
+    """
+    Checkpoint file (JSON lines) of parameter estimation, saving the result of each phase as soon as it is finished.
+
+    Args:
+        filename (str or pathlib.Path): filename of the checkpoint
+        config (dict[str, object] or None): configuration of the run, like fixed parameter values and
+            keyword arguments of covsirphy.Estimator.run()
+
+    Notes:
+        If the file exists, the saved results will be read and can be restored with EstimationCheckpoint.restore().
+        One line will be appended to the file with EstimationCheckpoint.save() for each finished phase.
+        The hash value of @config is a part of the keys of the phases. Results saved with different configuration
+        will be ignored.
+    """
+
+    def __init__(self, filename, config=None):
+        self._path = Path(filename)
+        self._config = self._digest(config or {})
+        # {key: dictionary of the result}
+        self._result_dict = {}
+        if self._path.exists():
+            with self._path.open("r") as fh:
+                for line in fh:
+                    if not line.strip():
+                        continue
+                    try:
+                        result_dict = json.loads(line)
+                    except json.JSONDecodeError:
+                        # The last line may be broken when the process was killed
+                        continue
+                    self._result_dict[result_dict["key"]] = result_dict
+
+    def __len__(self):
+        return len(self._result_dict)
+
+    @property
+    def filename(self):
+        """
+        str: filename of the checkpoint
+        """
+        return str(self._path)
+
+    @classmethod
+    def _digest(cls, config):
+        """
+        Return the hash value of the configuration.
+
+        Args:
+            config (dict[str, object]): configuration of the run
+
+        Returns:
+            str: SHA-256 hash value
+        """
+        config_str = json.dumps(config, sort_keys=True, default=cls._convert)
+        return hashlib.sha256(config_str.encode()).hexdigest()
+
+    def _key(self, unit, model):
+        """
+        Return the key of the phase.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            model (covsirphy.ModelBase): ODE model
+
+        Returns:
+            str: key of the phase, including model name, identifiers, start/end date, population value
+                and hash value of the configuration
+        """
+        elements = [
+            model.NAME, unit.id_dict or {}, unit.start_date, unit.end_date, int(unit.population), self._config]
+        return json.dumps(elements, sort_keys=True)
+
+    @staticmethod
+    def _convert(value):
+        """
+        Convert numpy objects to JSON serializable values.
+
+        Args:
+            value (object): numpy object
+
+        Returns:
+            object: Python object
+        """
+        return value.item() if hasattr(value, "item") else str(value)
+
+    def save(self, unit):
+        """
+        Save the result of parameter estimation of the phase.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit with estimated parameter values
+        """
+        model = self.ensure_subclass(unit.model, ModelBase, name="unit.model")
+        ode_dict = {k: v for (k, v) in unit.to_dict().items() if k in model.PARAMETERS}
+        result_dict = {
+            "key": self._key(unit, model),
+            self.TAU: unit.tau,
+            "param": ode_dict,
+            "estimation": unit.est_dict,
+            "y0": unit.y0_dict,
+        }
+        line = json.dumps(result_dict, default=self._convert)
+        with self._path.open("a") as fh:
+            fh.write(f"{line}\n")
+            fh.flush()
+        self._result_dict[result_dict["key"]] = json.loads(line)
+
+    def restore(self, unit, model, tau=None):
+        """
+        Restore the result of parameter estimation of the phase, if saved.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            model (covsirphy.ModelBase): ODE model
+            tau (int or None): tau value [min] to check, if not None
+
+        Returns:
+            bool: whether the result was restored or not
+
+        Notes:
+            The result will not be restored when the saved tau value is different from @tau.
+        """
+        model = self.ensure_subclass(model, ModelBase, name="model")
+        result_dict = self._result_dict.get(self._key(unit, model))
+        if result_dict is None:
+            return False
+        if tau is not None and result_dict[self.TAU] != tau:
+            return False
+        unit.set_ode(model=model, tau=result_dict[self.TAU], **result_dict["param"])
+        unit.est_dict.update(result_dict["estimation"])
+        unit.y0_dict = result_dict["y0"].copy()
+        return True
@@ -1,14 +1,23 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import CancelledError, FIRST_COMPLETED, wait
 import functools
-from multiprocessing import cpu_count, Pool
+from itertools import groupby
+from multiprocessing import cpu_count, Pool, TimeoutError as PoolTimeoutError
+from pathlib import Path
+import signal
+import threading
 from covsirphy.util.stopwatch import StopWatch
+from covsirphy.util.worker_pool import WorkerPool
 from covsirphy.cleaning.term import Term
 from covsirphy.cleaning.jhu_data import JHUData
 from covsirphy.cleaning.population import PopulationData
 from covsirphy.ode.mbase import ModelBase
 from covsirphy.phase.phase_unit import PhaseUnit
+from covsirphy.phase.record_store import SharedRecordStore
+from covsirphy.phase.checkpoint import EstimationCheckpoint
+from covsirphy.phase.telemetry import EstimationTelemetry
 
 
 class MPEstimator(Term):
@@ -35,6 +44,8 @@ class MPEstimator(Term):
     Notes:
         When @record_df is None, @jhu_data and @population_data must be specified.
     """
+    # Units which took longer than median runtime multiplied by this value will be reported as stragglers
+    STRAGGLER_RATIO = 2.0
 
     def __init__(self, model, jhu_data=None, population_data=None,
                  record_df=None, tau=None, **kwargs):
@@ -56,6 +67,12 @@ class MPEstimator(Term):
         self.param_dict = {
             k: v for (k, v) in kwargs.items() if k in model.PARAMETERS}
         self._units = []
+        # Records of areas, {(country, province): pandas.DataFrame}
+        self._record_dict = {}
+        # Failed phases in the last run, {name of the phase: error message}
+        self._failure_dict = {}
+        # Runtime of finished estimation in the previous runs, {(model name, tau, days): (heuristic cost, runtime [sec])}
+        self._runtime_cache = {}
 
     @property
     def tau(self):
@@ -85,74 +102,647 @@ class MPEstimator(Term):
         self._units.extend(units)
         return self
 
-    def _run(self, unit, tau, auto_complement=False, **kwargs):
+    def _area_key(self, unit):
         """
-        Run estimation for one phase.
+        Return the key of the area where the phase belongs.
 
         Args:
             unit (covsirphy.PhaseUnit): unit of one phase
-            tau (int or None): tau value [min], a divisor of 1440
+
+        Returns:
+            tuple(str, str or None) or None: country name and province name, or None (@record_df was used)
+        """
+        if not self.from_dataset:
+            return None
+        id_dict = unit.id_dict.copy()
+        try:
+            country = id_dict["country"]
+        except KeyError:
+            raise KeyError(
+                "PhaseUnit.id_dict['country'] must have country name.")
+        province = id_dict["province"] if "province" in id_dict else None
+        return (country, province)
+
+    def _area_records(self, key, auto_complement=False):
+        """
+        Return the records of the area.
+
+        Args:
+            key (tuple(str, str or None) or None): the returned value of MPEstimator._area_key()
             auto_complement (bool): if True and necessary, the number of cases will be complemented
-            kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
+
+        Returns:
+            pandas.DataFrame
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+
+        Notes:
+            Records of each area will be prepared only once and saved in self._record_dict.
         """
-        # Set tau
-        unit.set_ode(tau=tau)
-        # Parameter estimation
-        if self.from_dataset:
-            id_dict = unit.id_dict.copy()
-            try:
-                country = id_dict["country"]
-            except KeyError:
-                raise KeyError(
-                    "PhaseUnit.id_dict['country'] must have country name.")
-            province = id_dict["province"] if "province" in id_dict else None
+        if key is None:
+            return self.record_df.loc[:, self.NLOC_COLUMNS]
+        if key not in self._record_dict:
+            country, province = key
             population = self.population_data.value(
                 country=country, province=province)
             record_df, _ = self.jhu_data.records(
                 country=country, province=province, population=population,
                 auto_complement=auto_complement)
-        else:
-            record_df = self.record_df.copy()
+            self._record_dict[key] = record_df.loc[:, self.NLOC_COLUMNS]
+        return self._record_dict[key]
+
+    def _records(self, unit, auto_complement=False):
+        """
+        Return the records of the phase, which will be sent to the worker.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            auto_complement (bool): if True and necessary, the number of cases will be complemented
+
+        Returns:
+            pandas.DataFrame
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+        """
+        record_df = self._area_records(
+            self._area_key(unit), auto_complement=auto_complement)
+        sta = self.date_obj(unit.start_date)
+        end = self.date_obj(unit.end_date)
+        series = record_df[self.DATE]
+        return record_df.loc[(series >= sta) & (series <= end)].reset_index(drop=True)
+
+    def _cost_key(self, unit, tau):
+        """
+        Return the key of runtime cache.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            tau (int): tau value [min]
+
+        Returns:
+            tuple(str, int, int): model name, tau value and the number of days of the phase
+        """
+        days = unit.end_ordinal - unit.start_ordinal + 1
+        return (self.model.NAME, tau, days)
+
+    def _cost(self, unit, tau):
+        """
+        Estimate the cost of parameter estimation for the phase.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            tau (int): tau value [min]
+
+        Returns:
+            float: estimated cost
+
+        Notes:
+            Heuristic cost is the number of days multiplied by the number of parameters and steps per day.
+            When runtime of the same model has been recorded, cost will be converted to runtime [sec]
+            and the recorded runtime of the same (model, tau, days) will be used as-is.
+        """
+        key = self._cost_key(unit, tau)
+        _, _, days = key
+        heuristic = days * len(self.model.PARAMETERS) * (1440 / tau)
+        if key in self._runtime_cache:
+            return self._runtime_cache[key][1]
+        records = [v for (k, v) in self._runtime_cache.items() if k[0] == self.model.NAME]
+        if not records:
+            return heuristic
+        h_total, r_total = [sum(values) for values in zip(*records)]
+        return heuristic * r_total / h_total if h_total else heuristic
+
+    def _record_runtime(self, units):
+        """
+        Save runtime of estimation to the cache and report stragglers.
+
+        Args:
+            units (list[covsirphy.PhaseUnit]): units with estimated parameter values
+        """
+        runtime_dict = {}
+        for unit in units:
+            if unit.runtime is None:
+                continue
+            key = self._cost_key(unit, unit.tau)
+            _, _, days = key
+            heuristic = days * len(self.model.PARAMETERS) * (1440 / unit.tau)
+            self._runtime_cache[key] = (heuristic, unit.runtime)
+            runtime_dict[unit] = unit.runtime
+        if len(runtime_dict) < 2:
+            return
+        runtimes = sorted(runtime_dict.values())
+        median = runtimes[len(runtimes) // 2]
+        stragglers = [
+            unit for (unit, runtime) in runtime_dict.items() if runtime > median * self.STRAGGLER_RATIO]
+        for unit in stragglers:
+            runtime = StopWatch.show(runtime_dict[unit])
+            print(f"\t{unit}: straggler ({runtime}, median {StopWatch.show(median)})")
+
+    @classmethod
+    def _run_job(cls, job, func, unit_timeout=None, errors="raise", queue=None, cancel_event=None):
+        """
+        Run the function for one phase with index of the job, for dispatching with imap_unordered().
+
+        Args:
+            job (tuple(int, tuple)): index of the job and the arguments of @func (the first one is the unit)
+            func (callable): function to run
+            unit_timeout (int or None): time-out of the job [sec] or None (un-limited)
+            errors (str): "raise" (raise the exception) or "skip" (return the error message)
+            queue (multiprocessing.managers.BaseProxy or None): queue of covsirphy.EstimationTelemetry
+            cancel_event (threading.Event or None): event to stop estimation when set (in the same process only)
+
+        Raises:
+            TimeoutError: @errors is "raise" and the job was not completed in @unit_timeout seconds
+            concurrent.futures.CancelledError: @cancel_event was set
+
+        Returns:
+            tuple(int, covsirphy.PhaseUnit, str or None):
+                - int: index of the job
+                - covsirphy.PhaseUnit: the returned value of @func, or the unit (when failed)
+                - str or None: error message or None (succeeded)
+
+        Notes:
+            @unit_timeout is effective only when signal.SIGALRM is available in the main thread of the process.
+        """
+        index, args = job
+        unit = args[0]
+        callbacks = []
+        if queue is not None:
+            EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_START, unit)
+            callbacks.append(functools.partial(cls._send_progress, queue=queue, unit=unit))
+        if cancel_event is not None:
+            callbacks.append(functools.partial(cls._check_cancel, cancel_event=cancel_event))
+        if callbacks:
+            func = functools.partial(
+                func, callback=lambda progress_dict: [f(progress_dict) for f in callbacks])
+        use_alarm = unit_timeout is not None and hasattr(signal, "SIGALRM") \
+            and threading.current_thread() is threading.main_thread()
+        if use_alarm:
+            def _handler(signum, frame):
+                raise TimeoutError(f"Estimation was not completed in {unit_timeout} sec.")
+            previous = signal.signal(signal.SIGALRM, _handler)
+            signal.alarm(int(unit_timeout))
+        try:
+            unit_est = func(*args)
+        except CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_FAIL, unit, error=error)
+            if errors == "raise":
+                raise
+            return (index, unit, error)
+        finally:
+            if use_alarm:
+                signal.alarm(0)
+                signal.signal(signal.SIGALRM, previous)
+        if queue is not None:
+            cls._send_progress(
+                {
+                    cls.TRIALS: unit_est.to_dict()[cls.TRIALS],
+                    cls.RUNTIME: unit_est.runtime,
+                    cls.RMSLE: unit_est.to_dict()[cls.RMSLE],
+                },
+                queue=queue, unit=unit_est, event=EstimationTelemetry.UNIT_FINISH)
+        return (index, unit_est, None)
+
+    @staticmethod
+    def _check_cancel(progress_dict, cancel_event):
+        """
+        Stop estimation if cancelled, as a callback of covsirphy.Estimator.run().
+
+        Args:
+            progress_dict (dict[str, object]): progress of estimation (not used)
+            cancel_event (threading.Event): event to stop estimation when set
+
+        Raises:
+            concurrent.futures.CancelledError: @cancel_event was set
+        """
+        if cancel_event.is_set():
+            raise CancelledError("Estimation was cancelled.")
+
+    @classmethod
+    def _send_progress(cls, progress_dict, queue, unit, event=EstimationTelemetry.UNIT_PROGRESS):
+        """
+        Send the progress of estimation to covsirphy.EstimationTelemetry.
+
+        Args:
+            progress_dict (dict[str, object]): the number of trials, runtime [sec] and (the best) RMSLE score
+            queue (multiprocessing.managers.BaseProxy): queue of covsirphy.EstimationTelemetry
+            unit (covsirphy.PhaseUnit): unit of one phase
+            event (str): event name
+        """
+        trials, runtime = progress_dict[cls.TRIALS], progress_dict[cls.RUNTIME]
+        EstimationTelemetry.send(
+            queue, event, unit, trials_per_sec=trials / runtime if runtime else None, **progress_dict)
+
+    @classmethod
+    def _run_batch(cls, batch, func):
+        """
+        Run the jobs in one worker, for dispatching with an executor.
+
+        Args:
+            batch (list[tuple(int, tuple)]): list of the jobs, index of the job and the arguments of @func
+            func (callable): function which receives a job and returns a tuple (index, unit, error message)
+
+        Returns:
+            list[tuple(int, covsirphy.PhaseUnit, str or None)]: the returned values of @func
+        """
+        return [func(job) for job in batch]
+
+    @classmethod
+    def _run(cls, unit, record_df, tau, detach_estimator=False, history_dir=None, **kwargs):
+        """
+        Run estimation for one phase.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            record_df (pandas.DataFrame): records of the phase
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+            tau (int or None): tau value [min], a divisor of 1440
+            detach_estimator (bool): whether release the estimator and the records of the phase or not
+            history_dir (str or pathlib.Path or None): directory to save the history of trials when detached
+            kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
+
+        Returns:
+            covsirphy.PhaseUnit: the unit with estimated parameter values
+
+        Notes:
+            This is a class method to avoid sending the datasets registered to MPEstimator to the workers.
+        """
+        # Set tau
+        unit.set_ode(tau=tau)
+        # Parameter estimation
         unit.estimate(record_df=record_df, **kwargs)
         # Show the number of trials and runtime
         unit_dict = unit.to_dict()
-        trials, runtime = unit_dict[self.TRIALS], unit_dict[self.RUNTIME]
+        trials, runtime = unit_dict[cls.TRIALS], unit_dict[cls.RUNTIME]
         print(f"\t{unit}: finished {trials:>4} trials in {runtime}")
+        if detach_estimator:
+            unit.detach_estimator(filename=cls._history_filename(unit, history_dir))
         return unit
 
-    def run(self, n_jobs=-1, **kwargs):
+    @staticmethod
+    def _history_filename(unit, history_dir=None):
+        """
+        Return the filename to save the history of trials of the phase.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            history_dir (str or pathlib.Path or None): directory to save the history or None (not saved)
+
+        Returns:
+            pathlib.Path or None: filename, like Japan_01Jan2020_31Jan2020.csv, or None
+        """
+        if history_dir is None:
+            return None
+        directory = Path(history_dir)
+        directory.mkdir(exist_ok=True, parents=True)
+        names = [*(unit.id_dict or {}).values(), unit.start_date, unit.end_date]
+        return directory.joinpath(f"{'_'.join(str(name) for name in names)}.csv")
+
+    @classmethod
+    def _run_shared(cls, unit, key, handle, tau, **kwargs):
+        """
+        Run estimation for one phase with the records saved in shared memory.
+
+        Args:
+            unit (covsirphy.PhaseUnit): unit of one phase
+            key (tuple(str, str or None) or None): key of the area in the store
+            handle (dict[str, object]): the returned value of covsirphy.SharedRecordStore.handle()
+            tau (int or None): tau value [min], a divisor of 1440
+            kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
+
+        Returns:
+            covsirphy.PhaseUnit: the unit with estimated parameter values
+        """
+        store = SharedRecordStore.attach(handle)
+        try:
+            record_df = store.records(
+                key, start_date=unit.start_date, end_date=unit.end_date)
+        finally:
+            store.close()
+        return cls._run(unit, record_df, tau, **kwargs)
+
+    @property
+    def failures(self):
+        """
+        dict[str, str]: the phases failed in the last run, {name of the phase: error message}
+        """
+        return self._failure_dict.copy()
+
+    def run(self, n_jobs=-1, auto_complement=False, shared_memory=False, pool=None,
+            checkpoint=None, unit_timeout=None, errors="raise", telemetry=None,
+            executor=None, locality=False, cancel_event=None, detach_estimator=False, history_dir=None, **kwargs):
         """
         Run estimation.
 
         Args:
             n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            auto_complement (bool): if True and necessary, the number of cases will be complemented
+            shared_memory (bool): if True, records will be saved in shared memory and attached by the workers
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            checkpoint (str or pathlib.Path or None): filename of the checkpoint (JSON lines) or None (not used)
+            unit_timeout (int or None): time-out of estimation of one phase [sec] or None (un-limited)
+            errors (str): "raise" (stop when an error was raised in a phase) or "skip" (skip the failed phase)
+            telemetry (covsirphy.EstimationTelemetry or None): telemetry to receive the events of estimation
+            executor (concurrent.futures.Executor or None): executor to use instead of multiprocessing.Pool
+            locality (bool): whether phases of the same area should be sent to the executor together or not
+            cancel_event (threading.Event or None): event to stop estimation when set
+            detach_estimator (bool): whether release the estimators and the records of the phases in the workers or not
+            history_dir (str or pathlib.Path or None): directory to save the history of trials when detached
+            kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
+
+        Raises:
+            concurrent.futures.CancelledError: @cancel_event was set
+
+        Returns:
+            list[covsirphy.PhaseUnit]: the units with estimated parameter values
+
+        Notes:
+            Only the units and the records of the phases will be sent to the workers.
+            Phases will be dispatched to the workers one by one in descending order of estimated cost
+            (phase length, the number of parameters, tau and runtime recorded in the previous runs of this instance).
+            Phases which took much longer than the others will be reported as stragglers.
+            With @shared_memory=True, records of all areas will be saved once (covsirphy.SharedRecordStore)
+            and the workers receive only the keys of the areas.
+            When @pool is applied, @n_jobs will be ignored and the pool will not be closed here.
+            With @checkpoint, the result of each phase will be saved as soon as it is finished.
+            When the same file is used again with the same configuration (fixed parameter values, @auto_complement
+            and keyword arguments of covsirphy.Estimator.run()), the saved phases will not be estimated again.
+            With @errors="skip", failed (and timed-out) phases will not be included in the returned list
+            and can be confirmed with MPEstimator.failures.
+            @executor can be any object with submit() method which returns concurrent.futures.Future,
+            like concurrent.futures.ProcessPoolExecutor. @shared_memory and @telemetry require
+            the workers of the executor to run on this machine.
+            With @locality=True, the phases of an area (registered with JHUData) will be split into @n_jobs tasks
+            at most and the records of the area will be sent to a worker once per task.
+            Phases estimated with @record_df will be submitted one by one regardless of @locality.
+            With @detach_estimator=True, estimators (with Optuna studies) will not be sent back from the workers
+            and only the results will be kept in the units. Please refer to PhaseUnit.detach_estimator().
+        """
+        if errors not in ("raise", "skip"):
+            raise ValueError(f"@errors must be 'raise' or 'skip', but {errors} was applied.")
+        if pool is not None:
+            pool = self.ensure_instance(pool, WorkerPool, name="pool")
+            n_jobs = pool.n_jobs
+        if executor is not None:
+            if pool is not None:
+                raise ValueError("@pool and @executor cannot be specified at the same time.")
+            if not callable(getattr(executor, "submit", None)):
+                raise TypeError(
+                    f"@executor must have submit() method as concurrent.futures.Executor, but {type(executor)} was applied.")
+        if telemetry is not None:
+            self.ensure_instance(telemetry, EstimationTelemetry, name="telemetry")
+        option_dict = {
+            "auto_complement": auto_complement, "pool": pool, "checkpoint": checkpoint,
+            "unit_timeout": unit_timeout, "errors": errors, "telemetry": telemetry,
+            "executor": executor, "locality": locality, "cancel_event": cancel_event,
+        }
+        # Arguments of MPEstimator._run()
+        kwargs.update(detach_estimator=detach_estimator, history_dir=history_dir)
+        if shared_memory and (n_jobs != 1 or executor is not None):
+            record_dict = {}
+            for key in set(self._area_key(unit) for unit in self._units):
+                try:
+                    record_dict[key] = self._area_records(key, auto_complement=auto_complement)
+                except Exception:
+                    # Failed phases will be reported by the workers with KeyError
+                    if errors == "raise":
+                        raise
+            with SharedRecordStore(record_dict) as store:
+                return self._run_units(n_jobs=n_jobs, handle=store.handle(), **option_dict, **kwargs)
+        return self._run_units(n_jobs=n_jobs, **option_dict, **kwargs)
+
+    # Interval to check cancellation [sec]
+    CANCEL_CHECK_INTERVAL = 1.0
+
+    @classmethod
+    def _iter_results(cls, iterator, cancel_event=None):
+        """
+        Return the results of imap_unordered(), checking cancellation at intervals.
+
+        Args:
+            iterator (multiprocessing.pool.IMapIterator): iterator of results
+            cancel_event (threading.Event or None): event to stop estimation when set
+
+        Raises:
+            concurrent.futures.CancelledError: @cancel_event was set
+
+        Returns:
+            generator: the results
+        """
+        while True:
+            try:
+                yield iterator.next(timeout=cls.CANCEL_CHECK_INTERVAL)
+            except StopIteration:
+                return
+            except PoolTimeoutError:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError("Estimation was cancelled.") from None
+
+    def _split_batch(self, jobs, n_batches):
+        """
+        Split the jobs into batches with similar costs.
+
+        Args:
+            jobs (list[tuple(int, tuple)]): list of the jobs, index of the job and the arguments of @func
+            n_batches (int): the maximum number of batches
+
+        Returns:
+            list[list[tuple(int, tuple)]]: batches of the jobs
+        """
+        batches = [[] for _ in range(min(n_batches, len(jobs)))]
+        costs = [0] * len(batches)
+        # Assign the jobs to the batch with the lowest cost in descending order of cost
+        for job in sorted(jobs, key=lambda x: self._cost(x[1][0], self._tau), reverse=True):
+            i = costs.index(min(costs))
+            batches[i].append(job)
+            costs[i] += self._cost(job[1][0], self._tau)
+        return batches
+
+    def _submit(self, executor, func, jobs, locality, complete_f, n_jobs, cancel_event=None):
+        """
+        Submit the jobs to the executor and wait for completion.
+
+        Args:
+            executor (concurrent.futures.Executor): executor
+            func (callable): function which receives a job and returns a tuple (index, unit, error message)
+            jobs (list[tuple(int, tuple)]): list of the jobs, index of the job and the arguments of @func
+            locality (bool): whether the jobs of the same area should be submitted together or not
+            complete_f (callable): function which receives the returned values of @func
+            n_jobs (int): the number of workers, the maximum number of tasks of an area
+            cancel_event (threading.Event or None): event to stop estimation when set
+
+        Raises:
+            concurrent.futures.CancelledError: @cancel_event was set
+        """
+        def _batch_key(job):
+            key = self._area_key(job[1][0]) if locality else None
+            return f"job_{job[0]}" if key is None else str(key)
+        batches = []
+        for (_, group) in groupby(sorted(jobs, key=_batch_key), key=_batch_key):
+            batches.extend(self._split_batch(list(group), n_batches=n_jobs))
+        # Submit the batches in descending order of cost (longest-processing-time first)
+        batches.sort(key=lambda b: sum(self._cost(job[1][0], self._tau) for job in b), reverse=True)
+        futures = [executor.submit(self._run_batch, batch, func) for batch in batches]
+        try:
+            not_done = set(futures)
+            while not_done:
+                done, not_done = wait(
+                    not_done, timeout=self.CANCEL_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError("Estimation was cancelled.")
+                for future in done:
+                    for result in future.result():
+                        complete_f(*result)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    def _run_units(self, n_jobs=-1, auto_complement=False, handle=None, pool=None,
+                   checkpoint=None, unit_timeout=None, errors="raise", telemetry=None,
+                   executor=None, locality=False, cancel_event=None, **kwargs):
+        """
+        Run estimation of the registered units.
+
+        Args:
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            auto_complement (bool): if True and necessary, the number of cases will be complemented
+            handle (dict[str, object] or None): handle of covsirphy.SharedRecordStore, if available
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            checkpoint (str or pathlib.Path or None): filename of the checkpoint (JSON lines) or None (not used)
+            unit_timeout (int or None): time-out of estimation of one phase [sec] or None (un-limited)
+            errors (str): "raise" (stop when an error was raised in a phase) or "skip" (skip the failed phase)
+            telemetry (covsirphy.EstimationTelemetry or None): telemetry to receive the events of estimation
+            executor (concurrent.futures.Executor or None): executor to use instead of multiprocessing.Pool
+            locality (bool): whether phases of the same area should be sent to the executor together or not
+            cancel_event (threading.Event or None): event to stop estimation when set
             kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
 
+        Raises:
+            concurrent.futures.CancelledError: @cancel_event was set
+
         Returns:
-            list[covsirphy.PhaseUnit]
+            list[covsirphy.PhaseUnit]: the units with estimated parameter values
         """
         units = self._units[:]
-        results = []
+        self._failure_dict = {}
         # The number of parallel jobs
         n_jobs = cpu_count() if n_jobs == -1 else n_jobs
         # Start optimization
         print(f"\n<{self.model.NAME} model: parameter estimation>")
-        print(f"Running optimization with {n_jobs} CPUs...")
-        stopwatch = StopWatch()
-        # Estimation of the last phase will be done to determine tau value
-        if self._tau is None:
-            unit_sel, units = units[-1], units[:-1]
-            unit_est = self._run(unit=unit_sel, tau=None, **kwargs)
-            self._tau = unit_est.tau
-            results = [unit_est]
-        # Estimation of each phase
-        est_f = functools.partial(self._run, tau=self._tau, **kwargs)
-        if n_jobs == 1:
-            results = [est_f(unit) for unit in units]
+        if executor is None:
+            print(f"Running optimization with {n_jobs} CPUs...")
         else:
-            with Pool(n_jobs) as p:
-                units_est = p.map(est_f, units)
-            results.extend(units_est)
+            print(f"Running optimization with {type(executor).__name__}...")
+        stopwatch = StopWatch()
+        # Restore the results saved in the checkpoint, {index: unit}
+        if checkpoint is not None:
+            # Options which do not change the results will not be included in the configuration
+            est_dict = {
+                k: v for (k, v) in kwargs.items() if k not in ("detach_estimator", "history_dir")}
+            config_dict = {
+                "param": self.param_dict, "auto_complement": auto_complement, "estimator": est_dict}
+            checkpoint = EstimationCheckpoint(checkpoint, config=config_dict)
+        done_dict = {}
+        if checkpoint is not None:
+            for (i, unit) in enumerate(units):
+                if checkpoint.restore(unit, model=self.model, tau=self._tau):
+                    done_dict[i] = unit
+                    self._tau = unit.tau
+                    print(f"\t{unit}: restored from {checkpoint.filename}")
+        jobs_todo = [(i, unit) for (i, unit) in enumerate(units) if i not in done_dict]
+        queue = None if telemetry is None else telemetry.start(n_units=len(jobs_todo))
+        job_f = functools.partial(self._run_job, unit_timeout=unit_timeout, errors=errors, queue=queue)
+
+        def _complete(index, unit, error):
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Estimation was cancelled.")
+            if error is None:
+                done_dict[index] = unit
+                if checkpoint is not None:
+                    checkpoint.save(unit)
+                return
+            self._failure_dict[str(unit)] = error
+            print(f"\t{unit}: failed ({error})")
+
+        def _prepare(index, unit):
+            try:
+                return (index, (unit, self._records(unit, auto_complement=auto_complement)))
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_FAIL, unit, error=error)
+                if errors == "raise":
+                    raise
+                _complete(index, unit, error)
+        try:
+            # Estimation of the last phase will be done to determine tau value
+            while self._tau is None and jobs_todo:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise CancelledError("Estimation was cancelled.")
+                job = _prepare(*jobs_todo.pop(-1))
+                if job is None:
+                    continue
+                est_f = functools.partial(self._run, tau=None, **kwargs)
+                _complete(*job_f(job, func=est_f, cancel_event=cancel_event))
+                if job[0] in done_dict:
+                    self._tau = done_dict[job[0]].tau
+            # Estimation of each phase
+            if handle is None:
+                est_f = functools.partial(self._run, tau=self._tau, **kwargs)
+                jobs = [job for job in (_prepare(i, unit) for (i, unit) in jobs_todo) if job is not None]
+            else:
+                est_f = functools.partial(
+                    self._run_shared, handle=handle, tau=self._tau, **kwargs)
+                jobs = [(i, (unit, self._area_key(unit))) for (i, unit) in jobs_todo]
+            run_f = functools.partial(job_f, func=est_f)
+            if cancel_event is not None and cancel_event.is_set():
+                raise CancelledError("Estimation was cancelled.")
+            if executor is not None:
+                self._submit(
+                    executor, run_f, jobs, locality=locality, complete_f=_complete, n_jobs=n_jobs,
+                    cancel_event=cancel_event)
+            elif n_jobs == 1 and pool is None:
+                for job in jobs:
+                    _complete(*run_f(job, cancel_event=cancel_event))
+            elif jobs:
+                # Dispatch the jobs dynamically in descending order of cost (longest-processing-time first)
+                jobs.sort(key=lambda x: self._cost(x[1][0], self._tau), reverse=True)
+                if pool is None:
+                    with Pool(n_jobs) as p:
+                        iterator = p.imap_unordered(run_f, jobs, chunksize=1)
+                        for result in self._iter_results(iterator, cancel_event=cancel_event):
+                            _complete(*result)
+                else:
+                    iterator = pool.imap_unordered(run_f, jobs, chunksize=1)
+                    for result in self._iter_results(iterator, cancel_event=cancel_event):
+                        _complete(*result)
+        finally:
+            if telemetry is not None:
+                telemetry.stop()
+        results = [done_dict[i] for i in sorted(done_dict.keys())]
+        self._record_runtime(results)
         # Completion
         stopwatch.stop()
         print(f"Completed optimization. Total: {stopwatch.stop_show()}")
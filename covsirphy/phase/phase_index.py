@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from covsirphy.cleaning.term import Term
+
+
+class PhaseIndex(Term):
+    """
+    Sorted interval index of phases for date-to-phase lookup.
+
+    Args:
+        units (list[covsirphy.PhaseUnit]): phase units sorted by dates (not overlapped)
+
+    Raises:
+        ValueError: the units are not sorted or overlapped
+
+    Notes:
+        Start/end dates of the phases will be saved as ordinals and point/range queries will be done
+        with binary search (O(log n)). Returned values are positions of the units in @units.
+
+    Examples:
+        >>> units = [PhaseUnit("01Jan2020", "31Jan2020", 1000), PhaseUnit("01Feb2020", "29Feb2020", 1000)]
+        >>> index = PhaseIndex(units)
+        >>> index.find("15Feb2020")
+        1
+        >>> index.between("20Jan2020", "01Feb2020")
+        [0, 1]
+        >>> index.locate(["31Dec2019", "01Feb2020"]).tolist()
+        [-1, 1]
+    """
+    # Ordinal of 01Jan1970 to convert numpy.datetime64 values
+    _EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
+
+    def __init__(self, units):
+        self._starts = [unit.start_ordinal for unit in units]
+        self._ends = [unit.end_ordinal for unit in units]
+        if any(sta <= end for (sta, end) in zip(self._starts[1:], self._ends[:-1])):
+            raise ValueError("@units must be sorted by dates and must not be overlapped.")
+        self._start_array = np.array(self._starts, dtype=np.int64)
+        self._end_array = np.array(self._ends, dtype=np.int64)
+
+    def __len__(self):
+        return len(self._starts)
+
+    def find(self, date):
+        """
+        Return the position of the phase which has the date.
+
+        Args:
+            date (str): date, like 01Jan2020
+
+        Returns:
+            int or None: position of the phase or None (not registered)
+        """
+        ordinal = self.date_ordinal(date)
+        position = bisect_right(self._starts, ordinal) - 1
+        if position < 0 or ordinal > self._ends[position]:
+            return None
+        return position
+
+    def between(self, start_date=None, end_date=None):
+        """
+        Return the positions of the phases which have at least one date in the range.
+
+        Args:
+            start_date (str or None): the first date of the range or None (un-limited)
+            end_date (str or None): the last date of the range or None (un-limited)
+
+        Returns:
+            list[int]: positions of the phases
+        """
+        lo = 0 if start_date is None else bisect_left(self._ends, self.date_ordinal(start_date))
+        hi = len(self) if end_date is None else bisect_right(self._starts, self.date_ordinal(end_date))
+        return list(range(lo, hi))
+
+    def locate(self, dates):
+        """
+        Return the positions of the phases which have the dates.
+
+        Args:
+            dates (list[str] or pandas.DatetimeIndex or pandas.Series): dates
+
+        Returns:
+            numpy.ndarray: positions of the phases (-1 when not registered), with the same length as @dates
+        """
+        if isinstance(dates, (pd.DatetimeIndex, pd.Series)):
+            days = pd.DatetimeIndex(dates).values.astype("datetime64[D]").astype(np.int64)
+            ordinals = days + self._EPOCH_ORDINAL
+        else:
+            ordinals = np.array([self.date_ordinal(date) for date in dates], dtype=np.int64)
+        if not len(self):
+            return np.full(len(ordinals), -1, dtype=np.int64)
+        positions = np.searchsorted(self._start_array, ordinals, side="right") - 1
+        registered = (positions >= 0) & (ordinals <= self._end_array[np.maximum(positions, 0)])
+        return np.where(registered, positions, -1)
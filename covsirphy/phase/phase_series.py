@@ -1,12 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+from itertools import count
 import numpy as np
 import pandas as pd
 from covsirphy.cleaning.term import Term
 from covsirphy.phase.phase_unit import PhaseUnit
+from covsirphy.phase.phase_index import PhaseIndex
 from covsirphy.phase.sr_change import ChangeFinder
 
+# Versions of phase series, unique in the process
+_VERSION_COUNTER = count()
+
 
 class PhaseSeries(Term):
     """
@@ -22,16 +28,69 @@ class PhaseSeries(Term):
         self.first_date = self.ensure_date(first_date, "first_date")
         self.last_date = self.ensure_date(last_date, "last_date")
         self.init_population = self.ensure_population(population)
-        # List of PhaseUnit
+        # List of PhaseUnit and the index of them (created when necessary)
         self._units = []
         self.clear(include_past=True)
 
+    @property
+    def _units(self):
+        """
+        list[covsirphy.PhaseUnit]: registered phase units
+
+        Notes:
+            The list must be replaced (not modified in-place) when start/end dates of the phases are changed.
+        """
+        return self._unit_list
+
+    @_units.setter
+    def _units(self, units):
+        self._unit_list = units
+        self._index = None
+        self._version = next(_VERSION_COUNTER)
+
+    @property
+    def version(self):
+        """
+        int: version of the series, which will be updated when the phases are changed
+
+        Notes:
+            Versions are unique in the process. Copied series have the same version until changed.
+        """
+        return self._version
+
     def __iter__(self):
         yield from self._units
 
     def __len__(self):
         return len([unit for unit in self._units if unit])
 
+    def copy(self):
+        """
+        Return a copy of the series, sharing the phase units with this series.
+
+        Returns:
+            covsirphy.PhaseSeries: copied series
+
+        Notes:
+            Shared units will be copied when they are changed with PhaseSeries methods (copy-on-write).
+            The copy has the same version as this series until changed.
+        """
+        series = copy.copy(self)
+        series._units = self._units[:]
+        series._index = self._index
+        # Phases are not changed yet (the setter updated the version)
+        series._version = self._version
+        return series
+
+    @property
+    def phase_index(self):
+        """
+        covsirphy.PhaseIndex: sorted interval index of the registered phases, including disabled phases
+        """
+        if self._index is None:
+            self._index = PhaseIndex(self._units)
+        return self._index
+
     def unit(self, phase="last"):
         """
         Return the unit of the phase.
@@ -129,7 +188,7 @@ class PhaseSeries(Term):
         # Add phase if the last date is not included
         if self.last_date not in unit or unit <= self.last_date:
             unit.set_ode(model=model, tau=tau, **param_dict)
-            self._units.append(unit)
+            self._units = [*self._units, unit]
             return self
         # Fill in the blank of past dates
         filling = PhaseUnit(start_date, self.last_date, population)
@@ -138,7 +197,7 @@ class PhaseSeries(Term):
             self.tomorrow(self.last_date), end_date, population)
         target.set_ode(model=model, tau=tau, **param_dict)
         # Add new phase
-        self._units.extend([filling, target])
+        self._units = [*self._units, filling, target]
         return self
 
     def delete(self, phase="last"):
@@ -198,7 +257,9 @@ class PhaseSeries(Term):
             covsirphy.PhaseSeries: self
         """
         phase_id = self.str2num(phase)
+        self._units[phase_id] = self._units[phase_id].copy()
         self._units[phase_id].disable()
+        self._version = next(_VERSION_COUNTER)
         return self
 
     def enable(self, phase):
@@ -212,7 +273,9 @@ class PhaseSeries(Term):
             covsirphy.PhaseSeries: self
         """
         phase_id = self.str2num(phase)
+        self._units[phase_id] = self._units[phase_id].copy()
         self._units[phase_id].enable()
+        self._version = next(_VERSION_COUNTER)
         return self
 
     def summary(self):
@@ -321,15 +384,13 @@ class PhaseSeries(Term):
             ValueError: Phases are not series.
         """
         sorted_units = sorted(units)
-        s = ", ".join([str(unit) for unit in sorted_units])
         for (i, unit) in enumerate(sorted_units):
             if i in [0, len(sorted_units) - 1]:
                 continue
-            sta_app = unit.start_date
-            end_app = unit.end_date
-            sta = cls.tomorrow(sorted_units[i - 1].end_date)
-            end = cls.yesterday(sorted_units[i + 1].start_date)
-            if sta != sta_app or end != end_app:
+            sta = sorted_units[i - 1].end_ordinal + 1
+            end = sorted_units[i + 1].start_ordinal - 1
+            if sta != unit.start_ordinal or end != unit.end_ordinal:
+                s = ", ".join([str(unit) for unit in sorted_units])
                 raise ValueError(
                     f"The list of units does not a series of phases. Applied: {s}")
         return sorted_units
@@ -358,9 +419,26 @@ class PhaseSeries(Term):
         finder = ChangeFinder(sr_df, **kwargs)
         finder.run()
         # Register phases
+        start_dates, _ = finder.date_range()
+        return self.set_change_dates(start_dates[1:])
+
+    def set_change_dates(self, change_dates):
+        """
+        Register past phases with the change dates, which were found with S-R trend analysis etc.
+
+        Args:
+            change_dates (list[str]): list of change points, the start dates of the 1st, 2nd... phases
+
+        Returns:
+            covsirphy.PhaseSeries: self
+
+        Notes:
+            All phases will be cleared in advance and the last phase will end at the last date of the records.
+        """
+        change_dates = self.ensure_list(change_dates, name="change_dates")
         self.clear(include_past=True)
-        _, end_dates = finder.date_range()
-        [self.add(end_date=end_date) for end_date in end_dates]
+        end_dates = [self.yesterday(date) for date in change_dates]
+        [self.add(end_date=end_date) for end_date in [*end_dates, self.last_date]]
         return self
 
     def trend_show(self, sr_df, area=None, filename=None):
@@ -420,20 +498,20 @@ class PhaseSeries(Term):
                     - Country (str): country/region name
                     - Province (str): province/prefecture/state name
                     - Variables of the model and dataset (int): Confirmed etc.
+
+        Notes:
+            Initial values will be calculated for each phase, but not registered to the units shared with the other series.
         """
         dataframes = []
         rec_dates = record_df[self.DATE].dt.strftime(self.DATE_FORMAT).unique()
-        for (num, unit) in enumerate(self._units):
+        for unit in self._units:
             if not unit:
                 continue
             if unit.start_date in rec_dates:
-                unit.set_y0(record_df)
+                y0_df = record_df
             else:
-                try:
-                    unit.set_y0(dataframes[-1])
-                except IndexError:
-                    pass
-            df = unit.simulate(y0_dict=y0_dict)
+                y0_df = dataframes[-1] if dataframes else None
+            df = unit.simulate(y0_dict=y0_dict, record_df=y0_df)
             dataframes.append(df)
         sim_df = pd.concat(dataframes, ignore_index=True, sort=True)
         sim_df = sim_df.set_index(self.DATE).resample("D").last()
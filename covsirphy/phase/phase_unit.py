@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import copy
+import json
+import numpy as np
 import pandas as pd
 from covsirphy.util.error import UnExecutedError
 from covsirphy.cleaning.term import Term
@@ -56,78 +59,86 @@ class PhaseUnit(Term):
         'Phase (01Jan2020 - 01Mar2020)'
         >>> set([unit1, unit3, unit4]) == set([unit1, unit3])
         True
+
+    Notes:
+        Start/end dates are saved as ordinals (the number of days since 01Jan0001) to compare phases quickly.
+        Values of ODE parameters are saved in an array with the order of ModelBase.PARAMETERS.
     """
+    __slots__ = (
+        "_start", "_end", "_population", "_model", "_params", "_tau", "_rt", "_runtime",
+        "day_param_dict", "est_dict", "y0_dict", "_id_dict", "_enabled", "_record_df", "_estimator",
+    )
 
     def __init__(self, start_date, end_date, population):
         self.ensure_date_order(start_date, end_date, name="end_date")
-        self._start_date = start_date
-        self._end_date = end_date
+        self._start = self.date_ordinal(start_date)
+        self._end = self.date_ordinal(end_date)
         self._population = self.ensure_population(population)
+        # ODE model, parameter values (numpy.ndarray or None), tau value, reproduction number
+        self._model = None
+        self._params = None
+        self._tau = None
+        self._rt = None
         # Summary of information
-        self.info_dict = {
-            self.START: start_date,
-            self.END: end_date,
-            self.N: population,
-            self.ODE: None,
-            self.RT: None
-        }
-        self._ode_dict = {self.TAU: None}
         self.day_param_dict = {}
         self.est_dict = {
             self.RMSLE: None,
             self.TRIALS: None,
             self.RUNTIME: None
         }
+        # Runtime of parameter estimation [sec]
+        self._runtime = None
         # Init
         self._id_dict = None
         self._enabled = True
-        self._model = None
-        self._record_df = pd.DataFrame()
+        self._record_df = None
         self.y0_dict = {}
         self._estimator = None
 
+    def _other_start(self, other):
+        """
+        Return the start date of the other phase or the date as an ordinal, for comparison.
+
+        Args:
+            other (str or covsirphy.PhaseUnit): date or phase
+
+        Returns:
+            int: ordinal of the date
+        """
+        if isinstance(other, str):
+            return self.date_ordinal(other)
+        if isinstance(other, PhaseUnit):
+            return other._start
+        raise NotImplementedError
+
     def __str__(self):
         if self._id_dict is None:
             header = "Phase"
         else:
             id_str = ', '.join(list(self._id_dict.values()))
             header = f"{id_str:>4} phase"
-        return f"{header} ({self._start_date} - {self._end_date})"
+        return f"{header} ({self.start_date} - {self.end_date})"
 
     def __hash__(self):
-        return hash((self._start_date, self._end_date))
+        return hash((self._start, self._end))
 
     def __eq__(self, other):
         if not isinstance(other, PhaseUnit):
             raise NotImplementedError
-        return self._start_date == other.start_date and self._end_date == other.end_date
+        return self._start == other._start and self._end == other._end
 
     def __ne__(self, other):
         return not self.__eq__(other)
 
     def __lt__(self, other):
         # self < other
-        end = self.date_obj(self._end_date)
-        if isinstance(other, str):
-            sta_other = self.date_obj(other)
-        elif isinstance(other, PhaseUnit):
-            sta_other = self.date_obj(other.start_date)
-        else:
-            raise NotImplementedError
-        return end < sta_other
+        return self._end < self._other_start(other)
 
     def __le__(self, other):
         # self <= other
-        end = self.date_obj(self._end_date)
-        if isinstance(other, str):
-            sta_other = self.date_obj(other)
-        elif isinstance(other, PhaseUnit):
-            if self.__eq__(other):
-                return True
-            sta_other = self.date_obj(other.start_date)
-        else:
-            raise NotImplementedError
-        return end <= sta_other
+        if isinstance(other, PhaseUnit) and self.__eq__(other):
+            return True
+        return self._end <= self._other_start(other)
 
     def __gt__(self, other):
         # self > other
@@ -141,32 +152,43 @@ class PhaseUnit(Term):
 
     def __add__(self, other):
         if self < other:
-            return PhaseUnit(self._start_date, other.end_date, self._population)
+            return PhaseUnit(self.start_date, other.end_date, self._population)
         raise NotImplementedError
 
     def __iadd__(self, other):
         return self.__add__(other)
 
     def __sub__(self, other):
-        sta = self.date_obj(self._start_date)
-        end = self.date_obj(self._end_date)
-        sta_other = self.date_obj(other.start_date)
-        end_other = self.date_obj(other.end_date)
-        if sta < sta_other and end == end_other:
-            end_date = self.yesterday(other.start_date)
-            return PhaseUnit(self._start_date, end_date, self._population)
-        if sta == sta_other and end > end_other:
-            start_date = self.tomorrow(other.end_date)
-            return PhaseUnit(start_date, self._end_date, self._population)
+        if self._start < other._start and self._end == other._end:
+            end_date = self.ordinal_date(other._start - 1)
+            return PhaseUnit(self.start_date, end_date, self._population)
+        if self._start == other._start and self._end > other._end:
+            start_date = self.ordinal_date(other._end + 1)
+            return PhaseUnit(start_date, self.end_date, self._population)
 
     def __isub__(self, other):
         return self.__sub__(other)
 
     def __contains__(self, date):
-        sta = self.date_obj(self._start_date)
-        end = self.date_obj(self._end_date)
-        date = self.date_obj(date)
-        return sta <= date <= end
+        return self._start <= self.date_ordinal(date) <= self._end
+
+    def copy(self):
+        """
+        Return a copy of the phase, sharing the records and the estimator with this phase.
+
+        Returns:
+            covsirphy.PhaseUnit: copied phase
+
+        Notes:
+            Records and estimator (with the history of trials) will not be copied because they are not changed.
+            Phase information, including identifiers, parameter values and initial values, will be copied.
+        """
+        unit = copy.copy(self)
+        unit.day_param_dict = self.day_param_dict.copy()
+        unit.est_dict = self.est_dict.copy()
+        unit.y0_dict = self.y0_dict.copy()
+        unit._id_dict = None if self._id_dict is None else self._id_dict.copy()
+        return unit
 
     @ property
     def id_dict(self):
@@ -234,14 +256,28 @@ class PhaseUnit(Term):
         """
         str: start date
         """
-        return self._start_date
+        return self.ordinal_date(self._start)
 
     @ property
     def end_date(self):
         """
         str: end date
         """
-        return self._end_date
+        return self.ordinal_date(self._end)
+
+    @ property
+    def start_ordinal(self):
+        """
+        int: ordinal of the start date (the number of days since 01Jan0001)
+        """
+        return self._start
+
+    @ property
+    def end_ordinal(self):
+        """
+        int: ordinal of the end date (the number of days since 01Jan0001)
+        """
+        return self._end
 
     @ property
     def population(self):
@@ -255,15 +291,15 @@ class PhaseUnit(Term):
         """
         int or None: tau value [min]
         """
-        return self._ode_dict[self.TAU]
+        return self._tau
 
     @ tau.setter
     def tau(self, value):
-        if self._ode_dict[self.TAU] is None:
-            self._ode_dict[self.TAU] = self.ensure_tau(value)
+        if self._tau is None:
+            self._tau = self.ensure_tau(value)
             return
         raise AttributeError(
-            f"PhaseUnit.tau is not None ({self._ode_dict[self.TAU]}) and cannot be changed.")
+            f"PhaseUnit.tau is not None ({self._tau}) and cannot be changed.")
 
     @ property
     def model(self):
@@ -279,6 +315,55 @@ class PhaseUnit(Term):
         """
         return self._estimator
 
+    @ property
+    def runtime(self):
+        """
+        float or None: runtime of parameter estimation [sec]
+        """
+        return self._runtime
+
+    @ property
+    def _ode_dict(self):
+        """
+        dict[str, float or int or None]: parameter values (None when not set) and tau value
+        """
+        if self._model is None:
+            return {self.TAU: self._tau}
+        values = [None if np.isnan(v) else v for v in self._params.tolist()]
+        return {**dict(zip(self._model.PARAMETERS, values)), self.TAU: self._tau}
+
+    def _set_params(self, param_dict):
+        """
+        Save parameter values of the registered model.
+
+        Args:
+            param_dict (dict[str, float or None]): parameter values (None when not set)
+        """
+        self._params = np.array(
+            [np.nan if param_dict.get(p) is None else param_dict[p] for p in self._model.PARAMETERS],
+            dtype=np.float64)
+
+    def detach_estimator(self, filename=None):
+        """
+        Release the estimator and the records of the phase, keeping the results of parameter estimation.
+
+        Args:
+            filename (str or pathlib.Path or None): CSV filename to save the history of trials or None (not saved)
+
+        Returns:
+            covsirphy.PhaseUnit: self
+
+        Notes:
+            Parameter values, summary of estimation (RMSLE etc.) and initial values will be kept.
+            The saved history of trials can be read with pandas.read_csv().
+            Scenario.estimate_history() and Scenario.estimate_accuracy() cannot be used for the phase after that.
+        """
+        if filename is not None and self._estimator is not None:
+            self._estimator.history(show_figure=False).to_csv(filename, index=False)
+        self._estimator = None
+        self._record_df = None
+        return self
+
     def to_dict(self):
         """
         Summarize phase information and return as a dictionary.
@@ -299,7 +384,11 @@ class PhaseUnit(Term):
                     - Runtime: runtime of estimation
         """
         return {
-            **self.info_dict,
+            self.START: self.start_date,
+            self.END: self.end_date,
+            self.N: self._population,
+            self.ODE: None if self._model is None else self._model.NAME,
+            self.RT: self._rt,
             **self._ode_dict,
             **self.day_param_dict,
             **self.est_dict
@@ -331,6 +420,106 @@ class PhaseUnit(Term):
         df = pd.DataFrame.from_dict(summary_dict, orient="index").T
         return df.dropna(how="all", axis=1)
 
+    @staticmethod
+    def _convert(value):
+        """
+        Convert numpy objects to JSON serializable values.
+
+        Args:
+            value (object): numpy object
+
+        Returns:
+            object: Python object
+        """
+        return value.item() if hasattr(value, "item") else str(value)
+
+    def to_record(self):
+        """
+        Return the state of the phase as a record which can be saved in a table, except for the estimator.
+
+        Returns:
+            dict[str, object]:
+                - Start (str): start date of the phase
+                - End (str): end date of the phase
+                - Population (int): population value of the start date
+                - ODE (str or None): model name
+                - tau (int or None): tau value [min]
+                - parameter values (float): values of the parameters of the model (NaN when not set)
+                - enabled (bool): whether the phase is enabled or not
+                - runtime (float or None): runtime of parameter estimation [sec]
+                - estimation (str): JSON string of summary of estimation (RMSLE etc.)
+                - y0 (str): JSON string of initial values
+                - id (str or None): JSON string of identifiers
+        """
+        param_dict = {} if self._model is None else dict(zip(self._model.PARAMETERS, self._params.tolist()))
+        return {
+            self.START: self.start_date,
+            self.END: self.end_date,
+            self.N: int(self._population),
+            self.ODE: None if self._model is None else self._model.NAME,
+            self.TAU: self._tau,
+            **param_dict,
+            "enabled": self._enabled,
+            "runtime": self._runtime,
+            "estimation": json.dumps(self.est_dict, default=self._convert),
+            "y0": json.dumps(self.y0_dict, default=self._convert),
+            "id": None if self._id_dict is None else json.dumps(self._id_dict, default=self._convert),
+        }
+
+    @classmethod
+    def from_record(cls, record):
+        """
+        Create a phase with the record returned by PhaseUnit.to_record().
+
+        Args:
+            record (dict[str, object]): record of the phase, NaN can be used as None
+
+        Raises:
+            KeyError: the model is not a subclass of covsirphy.ModelBase which has been imported
+
+        Returns:
+            covsirphy.PhaseUnit: the phase
+        """
+        def _value(key):
+            value = record.get(key)
+            return None if value is None or (isinstance(value, float) and np.isnan(value)) else value
+
+        unit = cls(record[cls.START], record[cls.END], int(record[cls.N]))
+        tau = None if _value(cls.TAU) is None else int(_value(cls.TAU))
+        model = None if _value(cls.ODE) is None else cls._find_model(_value(cls.ODE))
+        param_dict = {} if model is None else {p: _value(p) for p in model.PARAMETERS}
+        unit.set_ode(model=model, tau=tau, **param_dict)
+        unit.est_dict.update(json.loads(record["estimation"]))
+        unit.y0_dict = json.loads(record["y0"])
+        if _value("id") is not None:
+            unit.set_id(**json.loads(record["id"]))
+        unit._runtime = _value("runtime")
+        if not record["enabled"]:
+            unit.disable()
+        return unit
+
+    @staticmethod
+    def _find_model(name):
+        """
+        Find the model with the name.
+
+        Args:
+            name (str): name of the model, like SIR-F
+
+        Raises:
+            KeyError: the model is not a subclass of covsirphy.ModelBase which has been imported
+
+        Returns:
+            covsirphy.ModelBase: the model
+        """
+        models = ModelBase.__subclasses__()
+        while models:
+            model = models.pop(0)
+            if model.NAME == name:
+                return model
+            models.extend(model.__subclasses__())
+        raise KeyError(f"ODE model named {name} is not registered as a subclass of covsirphy.ModelBase.")
+
     def set_ode(self, model=None, tau=None, **kwargs):
         """
         Set ODE model, tau value and parameter values, if necessary.
@@ -344,27 +533,26 @@ class PhaseUnit(Term):
             covsirphy.PhaseUnit: self
         """
         # Tau value
-        tau = self.ensure_tau(tau) or self._ode_dict[self.TAU]
+        tau = self.ensure_tau(tau) or self._tau
         # Model
         model = model or self._model
         if model is None:
-            self._ode_dict[self.TAU] = tau
+            self._tau = tau
             return self
-        self._model = self.ensure_subclass(model, ModelBase, name="model")
-        self.info_dict[self.ODE] = model.NAME
         # Parameter values
-        param_dict = self._ode_dict.copy()
+        param_dict = self._ode_dict
         param_dict.update(kwargs)
         param_dict = {
             p: param_dict[p] if p in param_dict else None for p in model.PARAMETERS
         }
-        self._ode_dict = param_dict.copy()
-        self._ode_dict[self.TAU] = tau
+        self._model = self.ensure_subclass(model, ModelBase, name="model")
+        self._set_params(param_dict)
+        self._tau = tau
         # Day parameters
         if None in param_dict.values():
             return self
         model_instance = model(population=self._population, **param_dict)
-        self.info_dict[self.RT] = model_instance.calc_r0()
+        self._rt = model_instance.calc_r0()
         # Reproduction number
         if tau is not None:
             self.day_param_dict = model_instance.calc_days_dict(tau)
@@ -384,7 +572,7 @@ class PhaseUnit(Term):
                 - Recovered (int): the number of recovered cases
                 - Susceptible (int): the number of susceptible cases
         """
-        return self._record_df
+        return pd.DataFrame() if self._record_df is None else self._record_df
 
     @ record_df.setter
     def record_df(self, df):
@@ -425,7 +613,7 @@ class PhaseUnit(Term):
         self._model_is_registered()
         # Records
         if record_df is None:
-            record_df = self._record_df.copy()
+            record_df = self.record_df.copy()
         if record_df.empty:
             raise UnExecutedError(
                 "PhaseUnit.record_df = ...", message="or specify @record_df argument")
@@ -463,15 +651,18 @@ class PhaseUnit(Term):
         """
         # Reproduction number
         est_dict = estimator.to_dict()
-        self.info_dict[self.RT] = est_dict.pop(self.RT)
+        self._rt = est_dict.pop(self.RT)
         # Get parameter values and tau value
         ode_set = set([*self._model.PARAMETERS, self.TAU])
         ode_dict = {
             k: v for (k, v) in est_dict.items() if k in ode_set}
-        self._ode_dict.update(ode_dict)
+        param_dict = {**self._ode_dict, **ode_dict}
+        self._set_params(param_dict)
+        self._tau = param_dict[self.TAU]
         # Other information of estimation
         other_dict = dict(est_dict.items() - ode_dict.items())
         self.est_dict.update(other_dict)
+        self._runtime = estimator.runtime
         # Initial values
         self.set_y0(record_df=record_df)
 
@@ -491,16 +682,28 @@ class PhaseUnit(Term):
                     - Recovered (int): the number of recovered cases
                     - any other columns will be ignored
         """
+        self.y0_dict = self._calc_y0(record_df)
+
+    def _calc_y0(self, record_df):
+        """
+        Calculate initial values with the records.
+
+        Args:
+            record_df (pandas.DataFrame): refer to PhaseUnit.set_y0()
+
+        Returns:
+            dict[str, float]: initial values of the variables of the model
+        """
         self._model_is_registered()
         df = record_df.loc[
             record_df[self.DATE] >= self.date_obj(self.start_date), :]
         df = self._model.tau_free(df, self._population, tau=None)
         y0_dict = df.iloc[0, :].to_dict()
-        self.y0_dict = {
+        return {
             k: v for (k, v) in y0_dict.items() if k in set(self._model.VARIABLES)
         }
 
-    def simulate(self, y0_dict=None):
+    def simulate(self, y0_dict=None, record_df=None):
         """
         Perform simulation with the set/estimated parameter values.
 
@@ -508,6 +711,16 @@ class PhaseUnit(Term):
             y0_dict (dict or None): dictionary of initial values or None
                 - key (str): variable name
                 - value (float): initial value
+            record_df (pandas.DataFrame or None): records to calculate initial values or None (registered values)
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+                    - any other columns will be ignored
 
         Returns:
             pandas.DataFrame
@@ -524,11 +737,12 @@ class PhaseUnit(Term):
         Notes:
             Simulation starts at the start date of the phase.
             Simulation end at the next date of the end date of the phase.
+            Initial values calculated with @record_df will not be registered to the phase.
         """
         self._model_is_registered()
         # Initial values
-        y0_dict = y0_dict or {}
-        y0_dict.update(self.y0_dict)
+        y0_dict = (y0_dict or {}).copy()
+        y0_dict.update(self.y0_dict if record_df is None else self._calc_y0(record_df))
         diff_set = set(self._model.VARIABLES) - y0_dict.keys()
         y0_dict.update({var: 0 for var in diff_set})
         # Conditions
@@ -536,18 +750,18 @@ class PhaseUnit(Term):
         if None in param_dict.values():
             raise UnExecutedError("PhaseUnit.set_ode()")
         tau = param_dict.pop(self.TAU)
-        last_date = self.tomorrow(self._end_date)
+        last_date = self.ordinal_date(self._end + 1)
         # Simulation
         simulator = ODESimulator()
         simulator.add(
             model=self._model,
-            step_n=self.steps(self._start_date, last_date, tau),
+            step_n=self.steps(self.start_date, last_date, tau),
             population=self._population,
             param_dict=param_dict,
             y0_dict=y0_dict
         )
         # Dimensionalized values
-        df = simulator.dim(tau=tau, start_date=self._start_date)
+        df = simulator.dim(tau=tau, start_date=self.start_date)
         df = self._model.restore(df)
         # Return day-level data
         df = df.set_index(self.DATE).resample("D").first()
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+from pathlib import Path
+import tempfile
+import numpy as np
+import pandas as pd
+from covsirphy.cleaning.term import Term
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8
+    shared_memory = None
+
+
+class SharedRecordStore(Term):
+    """
+    Records of areas saved in one shared memory block (or memory-mapped file) with offset index of areas.
+    The other processes can attach the store without copying the dataset.
+
+    Args:
+        record_dict (dict[object, pandas.DataFrame]): records of areas
+            - key (object): hashable key of the area, like (country, province)
+            - value (pandas.DataFrame):
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+                    - any other columns will be ignored
+        filename (str or pathlib.Path or None): filename of the memory-mapped file
+
+    Notes:
+        If @filename is None, shared memory will be used (Python 3.8 or later).
+        With Python 3.7 or older, a temporary memory-mapped file will be used when @filename is None.
+        Please use SharedRecordStore.handle() and SharedRecordStore.attach(handle) in the workers.
+        The owner of the store must call SharedRecordStore.close() (or use with-statement) finally.
+
+    Examples:
+        >>> with SharedRecordStore(record_dict) as store:
+        >>>     handle = store.handle()
+        >>>     # in the worker process
+        >>>     worker_store = SharedRecordStore.attach(handle)
+        >>>     record_df = worker_store.records(("Japan", "-"), start_date="01May2020")
+        >>>     worker_store.close()
+    """
+    # Columns of the array: Date (days since 01Jan1970) and the number of cases
+    ARRAY_COLUMNS = [Term.DATE, *Term.VALUE_COLUMNS]
+
+    def __init__(self, record_dict, filename=None):
+        if not isinstance(record_dict, dict):
+            raise TypeError(
+                f"@record_dict must be a dictionary, but {type(record_dict)} was applied.")
+        # Offset index: {key: (start, end)}
+        self._index = {}
+        arrays = []
+        start = 0
+        for (key, record_df) in record_dict.items():
+            array = self._to_array(record_df)
+            self._index[key] = (start, start + len(array))
+            arrays.append(array)
+            start += len(array)
+        values = np.concatenate(arrays, axis=0) if arrays else np.empty(
+            (0, len(self.ARRAY_COLUMNS)), dtype=np.int64)
+        self._shape = values.shape
+        # Save the values in shared memory or memory-mapped file
+        self._shm = None
+        self._filename = None
+        self._is_owner = True
+        if filename is None and shared_memory is not None:
+            self._shm = shared_memory.SharedMemory(
+                create=True, size=max(values.nbytes, 1))
+            self._array = np.ndarray(
+                self._shape, dtype=np.int64, buffer=self._shm.buf)
+            self._array[:] = values[:]
+        else:
+            if filename is None:
+                fd, filename = tempfile.mkstemp(suffix=".npy")
+                os.close(fd)
+            self._filename = str(filename)
+            self._array = np.lib.format.open_memmap(
+                self._filename, mode="w+", dtype=np.int64, shape=self._shape)
+            self._array[:] = values[:]
+            self._array.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __len__(self):
+        return len(self._index)
+
+    @classmethod
+    def _to_array(cls, record_df):
+        """
+        Convert the records to an array.
+
+        Args:
+            record_df (pandas.DataFrame): records of an area
+
+        Returns:
+            numpy.ndarray: int64 values with columns defined by SharedRecordStore.ARRAY_COLUMNS
+        """
+        df = cls.ensure_dataframe(
+            record_df, name="record_df", columns=cls.NLOC_COLUMNS)
+        df = df.sort_values(cls.DATE)
+        dates = df[cls.DATE].values.astype("datetime64[D]").astype(np.int64)
+        values = df.loc[:, cls.VALUE_COLUMNS].values.astype(np.int64)
+        return np.concatenate([dates.reshape(-1, 1), values], axis=1)
+
+    @classmethod
+    def from_dataframe(cls, dataframe, filename=None):
+        """
+        Create a store with a dataframe of many areas, like JHUData.cleaned().
+
+        Args:
+            dataframe (pandas.DataFrame):
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Country (str): country/region name
+                    - Province (str): province/prefecture/state name
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+            filename (str or pathlib.Path or None): filename of the memory-mapped file
+
+        Returns:
+            covsirphy.SharedRecordStore: the store with keys (country, province)
+        """
+        df = cls.ensure_dataframe(dataframe, name="dataframe", columns=cls.COLUMNS)
+        record_dict = {
+            key: sub_df for (key, sub_df) in df.groupby(cls.AREA_COLUMNS, sort=False)}
+        return cls(record_dict, filename=filename)
+
+    def handle(self):
+        """
+        Return the information to attach the store in the other processes.
+
+        Returns:
+            dict[str, object]: small picklable dictionary
+        """
+        return {
+            "name": None if self._shm is None else self._shm.name,
+            "filename": self._filename,
+            "shape": self._shape,
+            "index": self._index,
+        }
+
+    @classmethod
+    def attach(cls, handle):
+        """
+        Attach the store created by the other process without copying the dataset.
+
+        Args:
+            handle (dict[str, object]): the returned value of SharedRecordStore.handle()
+
+        Returns:
+            covsirphy.SharedRecordStore: the store (not the owner)
+        """
+        store = cls.__new__(cls)
+        store._index = handle["index"]
+        store._shape = tuple(handle["shape"])
+        store._is_owner = False
+        store._shm = None
+        store._filename = handle["filename"]
+        if handle["name"] is not None:
+            store._shm = shared_memory.SharedMemory(name=handle["name"])
+            store._array = np.ndarray(
+                store._shape, dtype=np.int64, buffer=store._shm.buf)
+        else:
+            store._array = np.load(store._filename, mmap_mode="r")
+        return store
+
+    def keys(self):
+        """
+        Return the keys of the registered areas.
+
+        Returns:
+            list[object]: keys of the areas
+        """
+        return list(self._index.keys())
+
+    def records(self, key, start_date=None, end_date=None):
+        """
+        Return the records of the area.
+
+        Args:
+            key (object): key of the area
+            start_date (str or None): start date, like 22Jan2020
+            end_date (str or None): end date, like 01Feb2020
+
+        Raises:
+            KeyError: the area is not registered
+
+        Returns:
+            pandas.DataFrame
+                Index:
+                    reset index
+                Columns:
+                    - Date (pd.TimeStamp): Observation date
+                    - Confirmed (int): the number of confirmed cases
+                    - Infected (int): the number of currently infected cases
+                    - Fatal (int): the number of fatal cases
+                    - Recovered (int): the number of recovered cases
+        """
+        if key not in self._index:
+            raise KeyError(f"Records of {key} are not registered in the store.")
+        start, end = self._index[key]
+        array = self._array[start:end]
+        # Select the period with binary search
+        dates = array[:, 0]
+        sta_pos = 0 if start_date is None else np.searchsorted(
+            dates, self._days(start_date), side="left")
+        end_pos = len(dates) if end_date is None else np.searchsorted(
+            dates, self._days(end_date), side="right")
+        selected = np.array(array[sta_pos:end_pos])
+        df = pd.DataFrame(selected[:, 1:], columns=self.VALUE_COLUMNS)
+        df.insert(0, self.DATE, pd.to_datetime(selected[:, 0], unit="D"))
+        return df
+
+    @classmethod
+    def _days(cls, date_str):
+        """
+        Convert a date string to the number of days since 01Jan1970.
+
+        Args:
+            date_str (str): date, like 22Jan2020
+
+        Returns:
+            int: the number of days
+        """
+        return int(np.datetime64(cls.date_obj(date_str), "D").astype(np.int64))
+
+    def close(self):
+        """
+        Close the store. If this process is the owner, shared memory or memory-mapped file will be released.
+        """
+        self._array = None
+        if self._shm is not None:
+            self._shm.close()
+            if self._is_owner:
+                self._shm.unlink()
+            self._shm = None
+        elif self._filename is not None and self._is_owner:
+            Path(self._filename).unlink()
+            self._filename = None
@@ -2,12 +2,152 @@
 # -*- coding: utf-8 -*-
 
 from datetime import timedelta
-import warnings
+import functools
+from multiprocessing import cpu_count, Pool
 import numpy as np
 import pandas as pd
 import ruptures as rpt
 from covsirphy.cleaning.term import Term
 from covsirphy.phase.trend import Trend
+from covsirphy.util.worker_pool import WorkerPool
+
+
+class _SharedCost(rpt.base.BaseCost):
+    """
+    Segment cost which can be shared by the settings of ChangeFinder.sweep().
+    Costs of "rbf" and "l2" model are calculated with cumulative sums in O(1),
+    and costs of the other models are cached.
+
+    Args:
+        model (str): cost model, "rbf", "l2", "l1" or "linear"
+        gamma (float or None): gamma of rbf kernel or None (median heuristic)
+    """
+    model = "covsirphy_shared"
+
+    def __init__(self, model, gamma=None):
+        self.min_size = 2
+        self.gamma = gamma
+        self.signal = None
+        self._model = model
+        self._table = None
+        self._cost = None
+        self._cache_dict = {}
+
+    def fit(self, signal):
+        """
+        Calculate the tables of cumulative sums.
+
+        Args:
+            signal (numpy.ndarray): signal with shape (n_samples, n_features)
+
+        Returns:
+            _SharedCost: self
+        """
+        if self.signal is signal:
+            return self
+        self.signal = signal.reshape(-1, 1) if signal.ndim == 1 else signal
+        self._cache_dict = {}
+        if self._model == "rbf":
+            distances = (self.signal[:, None, :] - self.signal[None, :, :]) ** 2
+            distances = distances.sum(axis=2)
+            if self.gamma is None:
+                median = np.median(distances[np.triu_indices(len(self.signal), k=1)])
+                self.gamma = 1 / median if median != 0 else 1.0
+            # As the same as ruptures.costs.CostRbf
+            gram = np.exp(-np.clip(distances * self.gamma, 1e-2, 1e2))
+            np.fill_diagonal(gram, 1.0)
+            self._table = np.zeros((len(gram) + 1, len(gram) + 1))
+            self._table[1:, 1:] = gram.cumsum(axis=0).cumsum(axis=1)
+        elif self._model == "l2":
+            zeros = np.zeros((1, self.signal.shape[1]))
+            self._table = (
+                np.concatenate([zeros, self.signal.cumsum(axis=0)]),
+                np.concatenate([zeros, (self.signal ** 2).cumsum(axis=0)]))
+        else:
+            self._cost = rpt.costs.cost_factory(model=self._model).fit(self.signal)
+            self.min_size = self._cost.min_size
+        return self
+
+    def error(self, start, end):
+        """
+        Return the cost of the segment [start:end].
+
+        Args:
+            start (int): start of the segment
+            end (int): end of the segment
+
+        Returns:
+            float: cost of the segment
+        """
+        if end - start < self.min_size:
+            raise rpt.exceptions.NotEnoughPoints
+        length = end - start
+        if self._model == "rbf":
+            table = self._table
+            block = table[end, end] - table[start, end] - table[end, start] + table[start, start]
+            return length - block / length
+        if self._model == "l2":
+            sums, squares = self._table
+            return float(((squares[end] - squares[start]) - (sums[end] - sums[start]) ** 2 / length).sum())
+        key = (start, end)
+        if key not in self._cache_dict:
+            self._cache_dict[key] = self._cost.error(start, end)
+        return self._cache_dict[key]
+
+    def _errors(self, starts, end):
+        """
+        Return the costs of the segments [start:end] for the start points.
+
+        Args:
+            starts (numpy.ndarray): start points of the segments
+            end (int): end of the segments
+
+        Returns:
+            numpy.ndarray: costs of the segments
+        """
+        lengths = end - starts
+        if self._model == "rbf":
+            table = self._table
+            blocks = table[end, end] - table[starts, end] - table[end, starts] + table[starts, starts]
+            return lengths - blocks / lengths
+        sums, squares = self._table
+        return ((squares[end] - squares[starts]) - (sums[end] - sums[starts]) ** 2 / lengths[:, None]).sum(axis=1)
+
+    def partition(self, pen, min_size, jump):
+        """
+        Return the optimal partition with penalty value (as the same as ruptures.Pelt) with vectorized calculation.
+
+        Args:
+            pen (float): penalty value
+            min_size (int): minimum length of the segments
+            jump (int): subsample (one every @jump points)
+
+        Returns:
+            list[int]: end points of the segments (the last value is the number of samples)
+
+        Note:
+            This is available only for "rbf" and "l2" model.
+        """
+        n_samples = len(self.signal)
+        points = np.array([0, *[k for k in range(0, n_samples, jump) if k >= min_size], n_samples])
+        points = np.unique(points)
+        scores = np.full(len(points), np.inf)
+        scores[0] = 0
+        previous = np.zeros(len(points), dtype=np.int64)
+        for (j, end) in enumerate(points[1:], start=1):
+            candidates = np.nonzero(points[:j] <= end - min_size)[0]
+            if not candidates.size:
+                continue
+            totals = scores[candidates] + self._errors(points[candidates], end) + pen
+            best = np.argmin(totals)
+            scores[j] = totals[best]
+            previous[j] = candidates[best]
+        results = []
+        j = len(points) - 1
+        while j > 0:
+            results.append(int(points[j]))
+            j = previous[j]
+        return sorted(results)
 
 
 class ChangeFinder(Term):
@@ -24,12 +164,34 @@ class ChangeFinder(Term):
                 - any other columns will be ignored
         min_size (int): minimum value of phase length [days], over 2
         max_rmsle (float): minmum value of RMSLE score
+        algo (str): algorithm of change point detection, "Pelt", "KernelCPD", "Binseg", "BottomUp" or "Window"
+        cost (str): cost model, "rbf", "l2", "l1" or "linear" (linear regression of log10(S) on R)
+        jump (int): subsample (one every @jump points) for algorithms except for "KernelCPD"
+        pen (float or None): penalty value of the detection or None (default value of the cost model)
 
     Notes:
         When RMSLE score > max_rmsle, predicted values will be None
+        "KernelCPD" is C implementation of "Pelt" with kernels and can be used with "rbf" or "l2" (linear kernel) cost.
+        Log10(S) values will be standardized for the cost models except for "rbf".
+        Default penalty values are the values which agreed with the results of Pelt/rbf (pen=0.5) in the benchmark.
     """
+    # Algorithms of change point detection
+    ALGORITHMS = {
+        "Pelt": rpt.Pelt,
+        "KernelCPD": rpt.KernelCPD,
+        "Binseg": rpt.Binseg,
+        "BottomUp": rpt.BottomUp,
+        "Window": rpt.Window,
+    }
+    # Default penalty values of the cost models
+    PENALTIES = {
+        "rbf": 0.5,
+        "l2": 0.3,
+        "l1": 1.0,
+        "linear": 0.01,
+    }
 
-    def __init__(self, sr_df, min_size=5, max_rmsle=20.0):
+    def __init__(self, sr_df, min_size=5, max_rmsle=20.0, algo="Pelt", cost="rbf", jump=1, pen=None):
         # Dataset
         self.sr_df = self.ensure_dataframe(
             sr_df, name="sr_df", time_index=True, columns=[self.S, self.R])
@@ -47,7 +209,18 @@ class ChangeFinder(Term):
         # Minimum value of RMSLE score
         self.max_rmsle = self.ensure_float(max_rmsle)
         # Setting for optimization
+        self.ensure_list([algo], list(self.ALGORITHMS.keys()), name="algo")
+        self.ensure_list([cost], list(self.PENALTIES.keys()), name="cost")
+        if algo == "KernelCPD" and cost not in ("rbf", "l2"):
+            raise ValueError(f"@cost must be 'rbf' or 'l2' with KernelCPD, but {cost} was applied.")
+        self.algo = algo
+        self.cost = cost
+        self.jump = self.ensure_natural_int(jump, name="jump")
+        self.pen = self.PENALTIES[cost] if pen is None else self.ensure_float(pen, name="pen")
         self._change_dates = []
+        # Curve fitting of the last phase and the mean error, scaling of the signal for incremental update
+        self._tail_trend = None
+        self._scale_dict = {}
 
     def run(self):
         """
@@ -56,35 +229,242 @@ class ChangeFinder(Term):
         Returns:
             covsirphy.ChangeFinder: self
         """
-        # Convert the dataset, index: Recovered, column: log10(Susceptible)
-        sr_df = self.sr_df.copy()
-        sr_df[self.S] = np.log10(sr_df[self.S].astype(np.float64))
-        df = sr_df.pivot_table(index=self.R, values=self.S, aggfunc="last")
-        # Convert index to serial numbers
-        serial_df = pd.DataFrame(np.arange(1, df.index.max() + 1, 1))
-        serial_df.index += 1
-        df = df.join(serial_df, how="outer")
-        series = df.reset_index(drop=True).iloc[:, 0]
-        series = series.dropna()
-        # Detection with Ruptures
-        warnings.simplefilter("ignore", category=RuntimeWarning)
-        algorithm = rpt.Pelt(model="rbf", jump=1, min_size=self.min_size)
-        results = algorithm.fit_predict(series.values, pen=0.5)
-        # Convert index values to Susceptible values
-        reset_series = series.reset_index(drop=True)
-        reset_series.index += 1
-        susceptible_df = reset_series[results].reset_index()
-        # Convert Susceptible values to dates
-        df = pd.merge_asof(
-            susceptible_df.sort_values(self.S),
-            sr_df.reset_index().sort_values(self.S),
-            on=self.S, direction="nearest"
-        )
-        found_list = df[self.DATE].sort_values()[:-1]
+        self._scale_dict = {}
+        self._change_dates = self._find(self.sr_df)
+        self._tail_trend = self._fit_tail()
+        return self
+
+    @classmethod
+    def run_many(cls, sr_dict, n_jobs=-1, pool=None, **kwargs):
+        """
+        Find change points of many areas at once with parallel processing.
+
+        Args:
+            sr_dict (dict[str, pandas.DataFrame]): S-R data of the areas
+                Index:
+                    Date (pd.TimeStamp): Observation date
+                Columns:
+                    - Recovered (int): the number of recovered cases (> 0)
+                    - Susceptible (int): the number of susceptible cases
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            kwargs: keyword arguments of ChangeFinder()
+
+        Returns:
+            tuple(dict[str, list[str]], dict[str, str]):
+                - change dates of the areas (in the order of @sr_dict)
+                - error messages of the failed areas
+
+        Notes:
+            When @pool is applied, @n_jobs will be ignored and the pool will not be closed here.
+            Failure of an area (e.g. too few records) does not stop the analysis of the other areas.
+        """
+        if not isinstance(sr_dict, dict):
+            raise TypeError(f"@sr_dict must be a dictionary, but {type(sr_dict)} was applied.")
+        if pool is not None:
+            pool = cls.ensure_instance(pool, WorkerPool, name="pool")
+            n_jobs = pool.n_jobs
+        n_jobs = cpu_count() if n_jobs == -1 else cls.ensure_natural_int(n_jobs, name="n_jobs")
+        run_f = functools.partial(cls._run_area, **kwargs)
+        jobs = list(sr_dict.items())
+        # Longer series first to balance the load of the workers
+        jobs.sort(key=lambda x: len(x[1]), reverse=True)
+        if n_jobs == 1 and pool is None:
+            results = [run_f(job) for job in jobs]
+        elif pool is None:
+            with Pool(min(n_jobs, max(len(jobs), 1))) as p:
+                results = list(p.imap_unordered(run_f, jobs, chunksize=1))
+        else:
+            results = list(pool.imap_unordered(run_f, jobs, chunksize=1))
+        change_dict = {area: change_dates for (area, change_dates, _) in results if change_dates is not None}
+        error_dict = {area: errmsg for (area, _, errmsg) in results if errmsg is not None}
+        return ({area: change_dict[area] for area in sr_dict if area in change_dict}, error_dict)
+
+    @classmethod
+    def _run_area(cls, job, **kwargs):
+        """
+        Find change points of an area.
+
+        Args:
+            job (tuple(str, pandas.DataFrame)): area name and S-R data
+            kwargs: keyword arguments of ChangeFinder()
+
+        Returns:
+            tuple(str, list[str] or None, str or None): area name, change dates and error message (None if succeeded)
+        """
+        area, sr_df = job
+        try:
+            finder = cls(sr_df, **kwargs).run()
+        except Exception as e:
+            return (area, None, f"{type(e).__name__}: {e}")
+        return (area, finder.date_range()[0][1:], None)
+
+    def sweep(self, pens, min_sizes=None, n_jobs=1, pool=None):
+        """
+        Find change points with the grid of penalty values and minimum lengths of phases.
+
+        Args:
+            pens (list[float]): penalty values
+            min_sizes (list[int] or None): minimum values of phase length [days] (over 2) or None (the current value)
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+
+        Returns:
+            pandas.DataFrame: results of the settings
+                Index:
+                    reset index
+                Columns:
+                    - pen (float): penalty value
+                    - min_size (int): minimum value of phase length [days]
+                    - Phases (int): the number of phases
+                    - Change_dates (list[str]): change dates
+                    - RMSLE (float): total RMSLE score of S-R trend curve fitting of the phases
+
+        Notes:
+            The cost (e.g. gram matrix of rbf kernel) will be calculated only once and shared by the settings.
+            Curve fitting of the phases of all settings will be done at once with Trend.run_many().
+            The change dates of the instance will not be changed.
+            When @pool is applied, @n_jobs will be ignored and the pool will not be closed here.
+        """
+        pens = [self.ensure_float(pen, name="pen") for pen in self.ensure_list(pens, name="pens")]
+        min_sizes = [self.min_size] if min_sizes is None else self.ensure_list(min_sizes, name="min_sizes")
+        for min_size in min_sizes:
+            self.ensure_natural_int(min_size, name="min_size")
+            if min_size < 3:
+                raise ValueError(f"@min_size must be over 2, but {min_size} was applied.")
+            if len(self.dates) < min_size * 2:
+                raise ValueError(f"More than {min_size * 2} records must be included with min_size={min_size}.")
+        if pool is not None:
+            pool = self.ensure_instance(pool, WorkerPool, name="pool")
+            n_jobs = pool.n_jobs
+        n_jobs = cpu_count() if n_jobs == -1 else self.ensure_natural_int(n_jobs, name="n_jobs")
+        # Calculate the cost only once
+        values, r_values, dates = self._prepare(self.sr_df)
+        scale_dict = {}
+        signal = self._signal(values, r_values, scale_dict=scale_dict)
+        cost = None
+        if self.algo != "KernelCPD":
+            with np.errstate(all="ignore"):
+                cost = _SharedCost(model=self.cost).fit(signal)
+            if self.cost == "rbf":
+                scale_dict["gamma"] = cost.gamma
+        # Detect change points with the settings
+        jobs = [(pen, min_size) for min_size in min_sizes for pen in pens]
+        run_f = functools.partial(self._sweep_point, signal=signal, custom_cost=cost, scale_dict=scale_dict)
+        if n_jobs == 1 and pool is None:
+            results = [run_f(job) for job in jobs]
+        elif pool is None:
+            with Pool(min(n_jobs, len(jobs))) as p:
+                results = p.map(run_f, jobs)
+        else:
+            results = pool.map(run_f, jobs)
+        first_obj, last_obj = self.sr_df.index.min(), self.sr_df.index.max()
+        change_nest = [
+            self._to_dates(points, dates, first_obj, last_obj, min_size) if len(values) >= min_size * 2 else []
+            for ((_, min_size), points) in zip(jobs, results)]
+        # Curve fitting of the phases of all settings at once
+        sr_dfs = []
+        for change_dates in change_nest:
+            change_index = pd.to_datetime(change_dates, format=self.DATE_FORMAT)
+            positions = [0, *self.sr_df.index.searchsorted(change_index), len(self.sr_df)]
+            sr_dfs.extend(self.sr_df.iloc[start:end] for (start, end) in zip(positions[:-1], positions[1:]))
+        scores = Trend.rmsle_many(sr_dfs)
+        records, i = [], 0
+        for ((pen, min_size), change_dates) in zip(jobs, change_nest):
+            n_phases = len(change_dates) + 1
+            records.append({
+                "pen": pen, "min_size": min_size, "Phases": n_phases, "Change_dates": change_dates,
+                self.RMSLE: sum(scores[i: i + n_phases])})
+            i += n_phases
+        return pd.DataFrame(records)
+
+    def _sweep_point(self, job, signal, custom_cost, scale_dict):
+        """
+        Detect change points with a setting of the grid.
+
+        Args:
+            job (tuple(float, int)): penalty value and minimum value of phase length [days]
+            signal (numpy.ndarray): signal for change point detection
+            custom_cost (ruptures.base.BaseCost or None): fitted cost to re-use
+            scale_dict (dict[str, float]): scaling of the signal
+
+        Returns:
+            list[int]: end points of the segments
+        """
+        pen, min_size = job
+        if len(signal) < min_size * 2:
+            return [len(signal)]
+        if self.algo == "Pelt" and self.cost in ("rbf", "l2"):
+            # Vectorized optimal partitioning with the tables of cumulative sums
+            with np.errstate(all="ignore"):
+                return custom_cost.partition(pen=pen, min_size=min_size, jump=self.jump)
+        algorithm = self._algorithm(min_size, custom_cost=custom_cost, scale_dict=scale_dict)
+        with np.errstate(all="ignore"):
+            return algorithm.fit(signal).predict(pen=pen)
+
+    def _find(self, sr_df):
+        """
+        Find change points in the records.
+
+        Args:
+            sr_df (pandas.DataFrame): records to analyse
+                Index:
+                    Date (pd.TimeStamp): Observation date
+                Columns:
+                    - Recovered (int): the number of recovered cases (> 0)
+                    - Susceptible (int): the number of susceptible cases
+
+        Returns:
+            list[str]: change dates, excluding the first date of the records
+        """
+        values, r_values, dates = self._prepare(sr_df)
+        if len(values) < self.min_size * 2:
+            # Too few unique Recovered values to split
+            return []
+        # Detection with Ruptures (floating point errors will be ignored only in this thread)
+        with np.errstate(all="ignore"):
+            results = self._detect(values, r_values)
+        return self._to_dates(results, dates, sr_df.index.min(), sr_df.index.max(), self.min_size)
+
+    def _prepare(self, sr_df):
+        """
+        Convert the records to log10(Susceptible) values sorted by Recovered values.
+
+        Args:
+            sr_df (pandas.DataFrame): records to analyse
+                Index:
+                    Date (pd.TimeStamp): Observation date
+                Columns:
+                    - Recovered (int): the number of recovered cases (> 0)
+                    - Susceptible (int): the number of susceptible cases
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray):
+                log10(Susceptible) values, Recovered values and the dates of the last records of the Recovered values
+        """
+        df = sr_df.reset_index().drop_duplicates(subset=self.R, keep="last")
+        df = df.sort_values(self.R, kind="mergesort")
+        with np.errstate(divide="ignore"):
+            values = np.log10(df[self.S].to_numpy(dtype=np.float64))
+        return (values, df[self.R].to_numpy(dtype=np.float64), df[self.DATE].to_numpy())
+
+    def _to_dates(self, results, dates, first_obj, last_obj, min_size):
+        """
+        Convert the end points of the segments to change dates.
+
+        Args:
+            results (list[int]): end points of the segments
+            dates (numpy.ndarray): dates of the values
+            first_obj (pandas.Timestamp): the first date of the records
+            last_obj (pandas.Timestamp): the last date of the records
+            min_size (int): minimum value of phase length [days]
+
+        Returns:
+            list[str]: change dates, excluding the first date of the records
+        """
+        found_list = pd.Series(dates[np.array(results) - 1]).sort_values()[:-1]
         # Only use dates when the previous phase has more than {min_size + 1} days
-        delta_days = timedelta(days=self.min_size)
-        first_obj = self.date_obj(self.dates[0])
-        last_obj = self.date_obj(self.dates[-1])
+        delta_days = timedelta(days=min_size)
         effective_list = [first_obj]
         for found in found_list:
             if effective_list[-1] + delta_days < found:
@@ -92,19 +472,204 @@ class ChangeFinder(Term):
         # The last change date must be under the last date of records {- min_size} days
         if effective_list[-1] >= last_obj - delta_days:
             effective_list = effective_list[:-1]
-        # Set change points
-        self._change_dates = [
-            date.strftime(self.DATE_FORMAT) for date in effective_list[1:]]
+        return [date.strftime(self.DATE_FORMAT) for date in effective_list[1:]]
+
+    def update(self, sr_df, tolerance=5.0):
+        """
+        Update change points incrementally with new records.
+
+        Args:
+            sr_df (pandas.DataFrame): the previous records and new records
+                Index:
+                    Date (pd.TimeStamp): Observation date
+                Columns:
+                    - Recovered (int): the number of recovered cases (> 0)
+                    - Susceptible (int): the number of susceptible cases
+                    - any other columns will be ignored
+            tolerance (float): the last phase will be re-examined when the mean error of the latest records
+                is over @tolerance times of the mean error of the records used for curve fitting
+
+        Returns:
+            covsirphy.ChangeFinder: self
+
+        Raises:
+            ValueError: the first date of @sr_df is different from that of the previous records
+
+        Notes:
+            ChangeFinder.run() will be performed if not done.
+            Curve fitting of the last phase is kept and the latest records (@min_size days at most) which were not
+            used for curve fitting will be compared with the fitted curve.
+            Change points will be searched only in the last two phases (and new records) when the error increased,
+            and the change points before the last change date will not be changed.
+            Records must be sorted by date. Only the new dates will be registered, and the cost does not depend on
+            the number of the previous records unless the last phase is re-examined.
+        """
+        sr_df = self.ensure_dataframe(sr_df, name="sr_df", time_index=True, columns=[self.S, self.R])
+        tolerance = self.ensure_float(tolerance, name="tolerance")
+        if sr_df.index[0] != self.sr_df.index[0]:
+            raise ValueError(
+                f"The first date of @sr_df must be {self.dates[0]}, but {sr_df.index[0]:{self.DATE_FORMAT}} was applied.")
+        previous_last = self.sr_df.index[-1]
+        self.sr_df = sr_df
+        if sr_df.index[-1] >= previous_last:
+            new_index = sr_df.index[sr_df.index.searchsorted(previous_last, side="right"):]
+            self.dates.extend(date_obj.strftime(self.DATE_FORMAT) for date_obj in new_index)
+        else:
+            self.dates = [date_obj.strftime(self.DATE_FORMAT) for date_obj in sr_df.index]
+        if self._tail_trend is None:
+            return self.run()
+        # Records of the last phase
+        start_obj = self.date_obj(self._change_dates[-1]) if self._change_dates else sr_df.index[0]
+        tail_df = sr_df.iloc[sr_df.index.searchsorted(start_obj):]
+        if self._tail_trend[0].sr_df.index[0] != start_obj:
+            # Change dates were updated with ChangeFinder.date_range()
+            self._tail_trend = self._fit_tail(last_date=previous_last)
+        trend, base_error = self._tail_trend
+        # The latest records which were not used for curve fitting
+        new_df = tail_df.iloc[tail_df.index.searchsorted(trend.sr_df.index[-1], side="right"):]
+        if new_df.empty:
+            return self
+        recent_df = new_df.iloc[-self.min_size:]
+        with np.errstate(all="ignore"):
+            errors = np.abs(
+                np.log10(recent_df[self.S].to_numpy(dtype=np.float64) + 1)
+                - np.log10(trend.predict(recent_df[self.R]) + 1))
+        if np.nan_to_num(errors.mean(), nan=np.inf) <= tolerance * base_error:
+            return self
+        # Re-examine the last phase with the previous phase as context
+        # (curve fitting will be kept until a new change point is found)
+        context_obj = self.date_obj(self._change_dates[-2]) if len(self._change_dates) > 1 else sr_df.index.min()
+        context_df = sr_df.loc[sr_df.index >= context_obj]
+        self._update_scale(sr_df)
+        found_list = []
+        if len(tail_df) >= self.min_size * 2:
+            found_list = [
+                date for date in self._find(context_df)
+                if self.date_obj(date) > start_obj + timedelta(days=self.min_size)]
+        if found_list:
+            self._change_dates.extend(found_list)
+            self._tail_trend = self._fit_tail()
         return self
 
-    def _curve_fitting(self, phase, start_date, end_date):
+    def _update_scale(self, sr_df, n_samples=256):
         """
-        Perform curve fitting for the phase.
+        Update scaling of the signal with all records, using evenly spaced samples to keep the cost constant.
+
+        Args:
+            sr_df (pandas.DataFrame): all records
+            n_samples (int): the maximum number of samples
+        """
+        step = max(len(sr_df) // n_samples, 1)
+        df = sr_df.iloc[::step].drop_duplicates(subset=self.R, keep="last")
+        with np.errstate(divide="ignore"):
+            values = np.log10(df[self.S].to_numpy(dtype=np.float64))
+        if self.cost == "rbf":
+            # Median heuristic as the same as ruptures.costs.CostRbf
+            distances = (values[:, None] - values[None, :])[np.triu_indices(len(values), k=1)] ** 2
+            median = np.median(distances) if distances.size else 0
+            self._scale_dict["gamma"] = 1 / median if median != 0 else 1.0
+            return
+        std = values.std()
+        self._scale_dict.update(mean=values.mean(), std=std if std > 0 else 1)
+        if self.cost == "linear":
+            r_max = df[self.R].max()
+            self._scale_dict["r_max"] = r_max if r_max > 0 else 1
+
+    def _fit_tail(self, last_date=None):
+        """
+        Perform curve fitting of the last phase.
+
+        Args:
+            last_date (pandas.Timestamp or None): the last date of records to use or None (the last date of the records)
+
+        Returns:
+            tuple(covsirphy.Trend, float): trend of the last phase and the mean error of the records
+        """
+        start_obj = self.date_obj(self._change_dates[-1]) if self._change_dates else self.sr_df.index.min()
+        last_obj = last_date or self.sr_df.index.max()
+        tail_df = self.sr_df.loc[(self.sr_df.index >= start_obj) & (self.sr_df.index <= last_obj)]
+        trend = Trend(tail_df).run()
+        # Avoid zero division with perfect fitting
+        base_error = max(trend.rmsle() / len(tail_df), np.finfo(np.float64).eps)
+        return (trend, base_error)
+
+    def _detect(self, values, r_values):
+        """
+        Detect change points with the selected algorithm and cost model.
+
+        Args:
+            values (numpy.ndarray): log10(Susceptible) values sorted by Recovered values
+            r_values (numpy.ndarray): Recovered values
+
+        Returns:
+            list[int]: end points of the segments (the last value is the length of @values)
+        """
+        signal = self._signal(values, r_values)
+        algorithm = self._algorithm(self.min_size)
+        results = algorithm.fit(signal).predict(pen=self.pen)
+        if self.cost == "rbf":
+            self._scale_dict.setdefault("gamma", algorithm.cost.gamma)
+        return results
+
+    def _signal(self, values, r_values, scale_dict=None):
+        """
+        Create the signal for change point detection.
+
+        Args:
+            values (numpy.ndarray): log10(Susceptible) values sorted by Recovered values
+            r_values (numpy.ndarray): Recovered values
+            scale_dict (dict[str, float] or None): scaling of the signal or None (that of the instance)
+
+        Returns:
+            numpy.ndarray: signal with shape (the number of values, the number of features)
+
+        Notes:
+            Scaling of the signal (gamma of rbf kernel, mean/std of log10(S) and max of R) will be determined
+            with the first call after ChangeFinder.run() and re-used in incremental update.
+        """
+        scale_dict = self._scale_dict if scale_dict is None else scale_dict
+        if self.cost == "rbf":
+            return values.reshape(-1, 1)
+        if "mean" not in scale_dict:
+            std = values.std()
+            scale_dict.update(mean=values.mean(), std=std if std > 0 else 1)
+        signal = ((values - scale_dict["mean"]) / scale_dict["std"]).reshape(-1, 1)
+        if self.cost == "linear":
+            # Linear regression of standardized log10(S) on scaled R
+            scale_dict.setdefault("r_max", r_values.max() if r_values.max() > 0 else 1)
+            signal = np.column_stack([signal, r_values / scale_dict["r_max"], np.ones(len(values))])
+        return signal
+
+    def _algorithm(self, min_size, custom_cost=None, scale_dict=None):
+        """
+        Create the algorithm of change point detection.
+
+        Args:
+            min_size (int): minimum value of phase length [days]
+            custom_cost (ruptures.base.BaseCost or None): fitted cost to re-use (not for KernelCPD)
+            scale_dict (dict[str, float] or None): scaling of the signal or None (that of the instance)
+
+        Returns:
+            ruptures.base.BaseEstimator: the algorithm (not fitted)
+        """
+        scale_dict = self._scale_dict if scale_dict is None else scale_dict
+        params = {"gamma": scale_dict["gamma"]} if "gamma" in scale_dict else None
+        if self.algo == "KernelCPD":
+            kernel = "linear" if self.cost == "l2" else self.cost
+            return rpt.KernelCPD(kernel=kernel, min_size=min_size, params=params)
+        option_dict = {
+            "model": self.cost, "custom_cost": custom_cost, "min_size": min_size, "jump": self.jump, "params": params}
+        if self.algo == "Window":
+            return rpt.Window(width=min_size * 2, **option_dict)
+        return self.ALGORITHMS[self.algo](**option_dict)
+
+    def _curve_fitting(self, phase, trend):
+        """
+        Create the result of curve fitting for the phase.
 
         Args:
             phase (str): phase name
-            start_date (str): start date of the phase
-            end_date (str): end date of the phase
+            trend (covsirphy.Trend): trend of the phase (curve fitting was completed)
 
         Returns:
             tuple
@@ -116,14 +681,7 @@ class ChangeFinder(Term):
                         - (phase_name)_Recovered: Recovered
                 (int): minimum value of R, which is the change point of the curve
         """
-        sr_df = self.sr_df.copy()
-        sta = self.date_obj(start_date)
-        end = self.date_obj(end_date)
-        sr_df = sr_df.loc[(sr_df.index >= sta) & (sr_df.index <= end), :]
-        # Calculate linear and negative exponential curve fitting
-        # and select the method with the smaller RMSLE score
-        trend = Trend(sr_df=sr_df)
-        trend.run()
+        # The method with the smaller RMSLE score was selected with linear and negative exponential curve fitting
         df = trend.result_df.copy()
         rmsle = trend.rmsle()
         if rmsle > self.max_rmsle:
@@ -173,12 +731,15 @@ class ChangeFinder(Term):
         Notes:
             @change_dates must be specified if ChangeFinder.run() was not done.
         """
-        # Curve fitting
+        # Curve fitting of all phases at once
         start_dates, end_dates = self.date_range(change_dates)
+        sr_dfs = [
+            self.sr_df.loc[(self.sr_df.index >= self.date_obj(start_date)) & (self.sr_df.index <= self.date_obj(end_date))]
+            for (start_date, end_date) in zip(start_dates, end_dates)
+        ]
+        trends = Trend.run_many(sr_dfs)
         nested = [
-            self._curve_fitting(self.num2str(num), start_date, end_date)
-            for (num, (start_date, end_date))
-            in enumerate(zip(start_dates, end_dates))
+            self._curve_fitting(self.num2str(num), trend) for (num, trend) in enumerate(trends)
         ]
         df_list, vlines = zip(*nested)
         comp_df = pd.concat([self.sr_df, *df_list], axis=1)
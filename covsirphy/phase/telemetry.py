@@ -0,0 +1,303 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+from multiprocessing import Manager
+import os
+from pathlib import Path
+import threading
+import time
+import warnings
+from covsirphy.cleaning.term import Term
+
+
+class EstimationTelemetry(Term):
+    """
+    Telemetry of parameter estimation with MPEstimator.
+    Events sent from the workers via a queue will be handed to the callbacks in the main process.
+
+    Args:
+        callbacks (list[callable] or None): functions which receive an event (dict[str, object])
+
+    Notes:
+        Events have the following keys.
+            - event (str): "run_start", "unit_start", "unit_progress", "unit_finish", "unit_fail" or "run_finish"
+            - time (float): UNIX time
+            - unit (str): name of the phase (unit events only)
+            - pid (int): process ID of the worker (unit events only)
+            - Trials (int), Runtime (float) [sec], trials_per_sec (float) and RMSLE (float):
+                progress of estimation ("unit_progress" and "unit_finish" only)
+            - error (str): error message ("unit_fail" only)
+            - units (int): the number of phases to estimate
+            - queue_depth (int): the number of phases which have not been started
+            - utilization (dict[int, float]): ratio of busy time to the elapsed time for each worker
+        RMSLE of "unit_progress" events is the best score until the time.
+
+    Examples:
+        >>> telemetry = cs.EstimationTelemetry(
+        >>>     callbacks=[cs.JSONLinesSink("events.jsonl"), cs.PrometheusSink("estimation.prom")])
+        >>> snl.estimate(cs.SIRF, telemetry=telemetry)
+    """
+    RUN_START = "run_start"
+    UNIT_START = "unit_start"
+    UNIT_PROGRESS = "unit_progress"
+    UNIT_FINISH = "unit_finish"
+    UNIT_FAIL = "unit_fail"
+    RUN_FINISH = "run_finish"
+
+    def __init__(self, callbacks=None):
+        self._callbacks = []
+        for callback in callbacks or []:
+            self.add_callback(callback)
+        self._manager = None
+        self._queue = None
+        self._thread = None
+        self._init_state(n_units=0)
+
+    def _init_state(self, n_units):
+        """
+        Initialize the state of the run.
+
+        Args:
+            n_units (int): the number of phases to estimate
+        """
+        self._n_units = n_units
+        self._start_time = time.time()
+        self._started = 0
+        self._finished = 0
+        self._failed = 0
+        # {pid: busy time [sec]}, {pid: start time of the current unit}
+        self._busy_dict = {}
+        self._running_dict = {}
+
+    def add_callback(self, callback):
+        """
+        Register a callback.
+
+        Args:
+            callback (callable): function which receives an event (dict[str, object])
+
+        Returns:
+            covsirphy.EstimationTelemetry: self
+        """
+        if not callable(callback):
+            raise TypeError(f"@callback must be callable, but {type(callback)} was applied.")
+        self._callbacks.append(callback)
+        return self
+
+    def start(self, n_units):
+        """
+        Start listening the events.
+
+        Args:
+            n_units (int): the number of phases to estimate
+
+        Returns:
+            multiprocessing.managers.BaseProxy: queue which can be sent to the workers
+        """
+        self._init_state(n_units=n_units)
+        self._manager = Manager()
+        self._queue = self._manager.Queue()
+        self._thread = threading.Thread(target=self._listen, daemon=True)
+        self._thread.start()
+        self._handle({"event": self.RUN_START, "time": self._start_time})
+        return self._queue
+
+    def stop(self):
+        """
+        Stop listening the events after all events were handled.
+
+        Returns:
+            dict[str, object]: summary of the run, the same as EstimationTelemetry.summary()
+        """
+        if self._thread is None:
+            return self.summary()
+        self._queue.put(None)
+        self._thread.join()
+        self._manager.shutdown()
+        self._manager, self._queue, self._thread = None, None, None
+        self._handle({"event": self.RUN_FINISH, "time": time.time()})
+        return self.summary()
+
+    @classmethod
+    def send(cls, queue, event, unit, **kwargs):
+        """
+        Send an event from the worker.
+
+        Args:
+            queue (multiprocessing.managers.BaseProxy or None): the returned value of EstimationTelemetry.start()
+            event (str): event name
+            unit (covsirphy.PhaseUnit): unit of one phase
+            kwargs: the other values of the event
+        """
+        if queue is None:
+            return
+        queue.put({"event": event, "time": time.time(), "unit": str(unit), "pid": os.getpid(), **kwargs})
+
+    def _listen(self):
+        """
+        Handle the events in the queue until None is received.
+        """
+        while True:
+            event_dict = self._queue.get()
+            if event_dict is None:
+                break
+            self._handle(event_dict)
+
+    def _handle(self, event_dict):
+        """
+        Update the state with the event and hand it to the callbacks.
+
+        Args:
+            event_dict (dict[str, object]): event
+        """
+        event, now, pid = event_dict["event"], event_dict["time"], event_dict.get("pid")
+        if event == self.UNIT_START:
+            self._started += 1
+            self._running_dict[pid] = now
+            self._busy_dict.setdefault(pid, 0)
+        elif event in (self.UNIT_FINISH, self.UNIT_FAIL):
+            if event == self.UNIT_FINISH:
+                self._finished += 1
+            else:
+                self._failed += 1
+            start = self._running_dict.pop(pid, now)
+            self._busy_dict[pid] = self._busy_dict.get(pid, 0) + now - start
+        event_dict.update(
+            units=self._n_units,
+            queue_depth=max(self._n_units - self._started, 0),
+            utilization=self._utilization(now))
+        for callback in self._callbacks:
+            try:
+                callback(event_dict.copy())
+            except Exception as e:
+                warnings.warn(f"Telemetry callback {callback} failed: {e}", UserWarning)
+
+    def _utilization(self, now):
+        """
+        Calculate utilization of the workers.
+
+        Args:
+            now (float): UNIX time
+
+        Returns:
+            dict[int, float]: ratio of busy time to the elapsed time for each worker
+        """
+        elapsed = max(now - self._start_time, 1e-9)
+        return {
+            pid: (busy + (now - self._running_dict[pid] if pid in self._running_dict else 0)) / elapsed
+            for (pid, busy) in self._busy_dict.items()
+        }
+
+    def summary(self):
+        """
+        Summarize the (last) run.
+
+        Returns:
+            dict[str, object]:
+                - units (int): the number of phases to estimate
+                - started (int): the number of started phases
+                - finished (int): the number of finished phases
+                - failed (int): the number of failed phases
+                - elapsed (float): elapsed time [sec]
+                - utilization (dict[int, float]): ratio of busy time to the elapsed time for each worker
+        """
+        now = time.time()
+        return {
+            "units": self._n_units,
+            "started": self._started,
+            "finished": self._finished,
+            "failed": self._failed,
+            "elapsed": now - self._start_time,
+            "utilization": self._utilization(now),
+        }
+
+
+class JSONLinesSink(object):
+    """
+    Callback of EstimationTelemetry to write the events to a JSON lines file.
+
+    Args:
+        filename (str or pathlib.Path): filename to append the events
+    """
+
+    def __init__(self, filename):
+        self._path = Path(filename)
+
+    def __call__(self, event_dict):
+        line = json.dumps(event_dict, default=str)
+        with self._path.open("a") as fh:
+            fh.write(f"{line}\n")
+
+
+class PrometheusSink(object):
+    """
+    Callback of EstimationTelemetry to write the metrics to a text file with Prometheus exposition format,
+    which can be collected with textfile collector of node exporter.
+
+    Args:
+        filename (str or pathlib.Path): filename of the metrics (will be overwritten)
+        prefix (str): prefix of the metric names
+    """
+
+    def __init__(self, filename, prefix="covsirphy_estimation"):
+        self._path = Path(filename)
+        self._prefix = prefix
+        self._gauge_dict = {}
+        # {unit name: value}
+        self._rmsle_dict = {}
+        self._speed_dict = {}
+
+    @staticmethod
+    def _label(value):
+        """
+        Escape the label value.
+
+        Args:
+            value (object): label value
+
+        Returns:
+            str: escaped value
+        """
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def __call__(self, event_dict):
+        self._gauge_dict.update(
+            units_total=event_dict["units"], queue_depth=event_dict["queue_depth"])
+        event = event_dict["event"]
+        if event == EstimationTelemetry.RUN_START:
+            self._gauge_dict.update(units_started=0, units_finished=0, units_failed=0)
+            self._rmsle_dict, self._speed_dict = {}, {}
+        for (name, target) in zip(
+                ["units_started", "units_finished", "units_failed"],
+                [EstimationTelemetry.UNIT_START, EstimationTelemetry.UNIT_FINISH, EstimationTelemetry.UNIT_FAIL]):
+            if event == target:
+                self._gauge_dict[name] = self._gauge_dict.get(name, 0) + 1
+        if event_dict.get(Term.RMSLE) is not None:
+            self._rmsle_dict[event_dict["unit"]] = event_dict[Term.RMSLE]
+        if event_dict.get("trials_per_sec") is not None:
+            self._speed_dict[event_dict["unit"]] = event_dict["trials_per_sec"]
+        self._write(event_dict["utilization"])
+
+    def _write(self, utilization_dict):
+        """
+        Write the metrics to the file atomically.
+
+        Args:
+            utilization_dict (dict[int, float]): ratio of busy time to the elapsed time for each worker
+        """
+        lines = []
+        for (name, value) in self._gauge_dict.items():
+            lines.extend([f"# TYPE {self._prefix}_{name} gauge", f"{self._prefix}_{name} {value}"])
+        labeled = [
+            ("best_rmsle", "unit", self._rmsle_dict),
+            ("trials_per_second", "unit", self._speed_dict),
+            ("worker_utilization", "pid", utilization_dict),
+        ]
+        for (name, label, value_dict) in labeled:
+            lines.append(f"# TYPE {self._prefix}_{name} gauge")
+            lines.extend(
+                f'{self._prefix}_{name}{{{label}="{self._label(k)}"}} {v}' for (k, v) in value_dict.items())
+        temp_path = self._path.with_name(f"{self._path.name}.tmp")
+        temp_path.write_text("\n".join(lines) + "\n")
+        os.replace(temp_path, self._path)
@@ -10,7 +10,7 @@ if not hasattr(sys, "ps1"):
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from scipy.optimize import curve_fit, OptimizeWarning
+from scipy.optimize import leastsq
 from covsirphy.cleaning.term import Term
 
 
@@ -40,6 +40,9 @@ class Trend(Term):
         # Setting for analysis
         self._result_df = pd.DataFrame()
         self.fit_fnc = self.linear
+        # {function name: parameter values}, the selected function
+        self._param_dict = {}
+        self._func = None
 
     @property
     def result_df(self):
@@ -64,38 +67,255 @@ class Trend(Term):
         Returns:
             covsirphy.Trend: self
         """
-        L, N = self.L, self.N
-        # Perform fitting and calculate RMSLE scores
-        dataframe_dict = {func: self._run(func=func) for func in (L, N)}
-        score_dict = {
-            func: self._rmsle(fit_df) for (func, fit_df) in dataframe_dict.items()}
-        # Select the best dataframe
-        if 0 < score_dict[L] < score_dict[N] or not score_dict[N]:
-            self._result_df = dataframe_dict[L]
-        else:
-            self._result_df = dataframe_dict[N]
+        self.run_many([self])
         return self
 
-    def _run(self, func):
+    @classmethod
+    def run_many(cls, trends):
         """
-        Perform curve fitting of S-R trend with linear or negative exponential function and save the result.
+        Perform curve fitting of many phases (of one or many series) at once and select the best solutions.
 
         Args:
-            func (function): the selected curve fitting function, either linear or negative exponential
+            trends (list[covsirphy.Trend or pandas.DataFrame]): Trend instances or S-R dataframes of the phases
 
         Returns:
-            pandas.DataFrame: results of fitting
-                Index:
-                    - index (Date) (pd.TimeStamp): Observation date
-                Columns:
-                    - Recovered: The number of recovered cases
-                    - Susceptible_actual: Actual values of Susceptible
-                    - columns defined by @columns
+            list[covsirphy.Trend]: Trend instances with the results of fitting
+
+        Notes:
+            Linear function will be fitted with closed-form least squares solution.
+            Negative exponential function will be initialized with the linear solution
+            and fitted with vectorized Levenberg-Marquardt method.
+            Levenberg-Marquardt method (Trend._curve_fit()) will be used only for the phases
+            where the vectorized fitting failed.
         """
-        self.fit_fnc = self.negative_exp if func == self.N else self.linear
-        return self._fitting(self.sr_df)
+        trends = [trend if isinstance(trend, cls) else cls(trend) for trend in trends]
+        if not trends:
+            return trends
+        L, N = cls.L, cls.N
+        score_dict, param_dict, fast = cls._fit_arrays([trend.sr_df for trend in trends])
+        lin_a, lin_b = param_dict[L]
+        exp_a, exp_b = param_dict[N]
+        for (i, trend) in enumerate(trends):
+            if fast[i]:
+                # Create only the dataframe of the best solution
+                scores = {func: score_dict[func][i] for func in (L, N)}
+                func = L if 0 < scores[L] < scores[N] or not scores[N] else N
+                trend._result_df = trend._fitting(
+                    trend.sr_df, func=func, param=(param_dict[func][0][i], param_dict[func][1][i]))
+                trend._func = func
+                continue
+            # Use Trend._curve_fit() if needed
+            dataframe_dict = {
+                L: trend._fitting(trend.sr_df, func=L, param=(lin_a[i], lin_b[i])),
+                N: trend._fitting(trend.sr_df, func=N, p0=(exp_a[i], exp_b[i])),
+            }
+            scores = {
+                func: trend._rmsle(fit_df) for (func, fit_df) in dataframe_dict.items()}
+            # Select the best dataframe
+            trend._func = L if 0 < scores[L] < scores[N] or not scores[N] else N
+            trend._result_df = dataframe_dict[trend._func]
+        return trends
+
+    @classmethod
+    def rmsle_many(cls, sr_dfs):
+        """
+        Return the best RMSLE scores of many phases without creating the dataframes of the results.
+
+        Args:
+            sr_dfs (list[pandas.DataFrame]): S-R dataframes of the phases
+
+        Returns:
+            numpy.ndarray: RMSLE scores of the phases
+
+        Notes:
+            Trend.rmsle() will be used only for the phases where the vectorized fitting failed.
+        """
+        if not sr_dfs:
+            return np.array([])
+        L, N = cls.L, cls.N
+        score_dict, _, fast = cls._fit_arrays(sr_dfs)
+        lin, exp = score_dict[L], score_dict[N]
+        scores = np.where(((0 < lin) & (lin < exp)) | (exp == 0), lin, exp)
+        for i in np.nonzero(~fast)[0]:
+            scores[i] = cls(sr_dfs[i]).rmsle()
+        return scores
+
+    @classmethod
+    def _fit_arrays(cls, sr_dfs):
+        """
+        Perform curve fitting of the phases with vectorized calculation.
+
+        Args:
+            sr_dfs (list[pandas.DataFrame]): S-R dataframes of the phases
 
-    def _fitting(self, sr_df):
+        Returns:
+            tuple(dict[str, numpy.ndarray], dict[str, tuple(numpy.ndarray, numpy.ndarray)], numpy.ndarray):
+                - RMSLE scores of the functions
+                - parameter values of the functions
+                - whether the vectorized fitting succeeded or not
+        """
+        L, N = cls.L, cls.N
+        x, y, mask = cls._padded(sr_dfs)
+        # Floating point errors (RuntimeWarning) will be ignored only in this thread
+        with np.errstate(all="ignore"):
+            lin_a, lin_b = cls._fit_linear_many(x, y, mask)
+            # f(x) = a exp(-bx) is approximately equal to (- ab)x + a when bx is small
+            exp_a, exp_b, converged = cls._fit_negative_exp_many(x, y, mask, a_ini=lin_b, b_ini=-lin_a / lin_b)
+            # RMSLE scores of the phases
+            score_dict = {
+                L: cls._rmsle_many(y, mask, lin_a[:, None] * x + lin_b[:, None]),
+                N: cls._rmsle_many(y, mask, exp_a[:, None] * np.exp(-exp_b[:, None] * x)),
+            }
+        param_dict = {L: (lin_a, lin_b), N: (exp_a, exp_b)}
+        fast = converged & np.isfinite(lin_a) & np.isfinite(lin_b)
+        return (score_dict, param_dict, fast)
+
+    @classmethod
+    def _padded(cls, sr_dfs):
+        """
+        Create padded arrays of Recovered and log(Susceptible) values to fit many phases at once.
+
+        Args:
+            sr_dfs (list[pandas.DataFrame]): S-R dataframes of the phases
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray):
+                Recovered values, log(Susceptible) values and mask of the records
+                with shape (the number of phases, the max length of the phases)
+        """
+        width = max(len(df) for df in sr_dfs)
+        x = np.zeros((len(sr_dfs), width), dtype=np.float64)
+        y = np.zeros((len(sr_dfs), width), dtype=np.float64)
+        mask = np.zeros((len(sr_dfs), width), dtype=np.bool_)
+        with np.errstate(divide="ignore"):
+            for (i, df) in enumerate(sr_dfs):
+                x[i, :len(df)] = df[cls.R].to_numpy(dtype=np.float64)
+                y[i, :len(df)] = np.log(df[cls.S].to_numpy(dtype=np.float64))
+                mask[i, :len(df)] = True
+        return (x, y, mask)
+
+    @staticmethod
+    def _rmsle_many(y, mask, y_predicted):
+        """
+        Calculate RMSLE scores of actual/predicted Susceptible of the phases, as the same as Trend._rmsle().
+
+        Args:
+            y (numpy.ndarray): log(Susceptible) values with shape (phases, records)
+            mask (numpy.ndarray): mask of the records
+            y_predicted (numpy.ndarray): predicted values of log(Susceptible) with shape (phases, records)
+
+        Returns:
+            numpy.ndarray: RMSLE scores with shape (phases,)
+        """
+        actual = np.round(np.exp(y))
+        predicted = np.exp(y_predicted)
+        # Predicted values will be converted to integers only when all values of the phase are finite
+        finite = (np.isfinite(predicted) | ~mask).all(axis=1)
+        predicted = np.where(finite[:, None], np.trunc(predicted), predicted)
+        predicted = np.where(np.isposinf(predicted), 0, predicted)
+        selected = mask & (actual > 0) & (predicted > 0)
+        scores = np.abs(np.log10(actual + 1) - np.log10(predicted + 1))
+        return np.where(selected, scores, 0).sum(axis=1)
+
+    @staticmethod
+    def _scale(x, mask):
+        """
+        Calculate scaling factors of x values to improve conditioning.
+
+        Args:
+            x (numpy.ndarray): x values with shape (phases, records)
+            mask (numpy.ndarray): mask of the records
+
+        Returns:
+            numpy.ndarray: scaling factors with shape (phases,)
+        """
+        scale = np.max(np.abs(np.where(mask, x, 0)), axis=1)
+        return np.where(scale > 0, scale, 1.0)
+
+    @classmethod
+    def _fit_linear_many(cls, x, y, mask):
+        """
+        Fit linear function f(x)=Ax+B with closed-form least squares solution.
+
+        Args:
+            x (numpy.ndarray): x values with shape (phases, records)
+            y (numpy.ndarray): y values with shape (phases, records)
+            mask (numpy.ndarray): mask of the records
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray): parameter A and B of the phases (NaN if failed)
+        """
+        scale = cls._scale(x, mask)
+        u = np.where(mask, x / scale[:, None], 0)
+        y = np.where(mask, y, 0)
+        n = mask.sum(axis=1)
+        u_mean = u.sum(axis=1) / n
+        y_mean = y.sum(axis=1) / n
+        du = np.where(mask, u - u_mean[:, None], 0)
+        dy = np.where(mask, y - y_mean[:, None], 0)
+        slope = (du * dy).sum(axis=1) / (du ** 2).sum(axis=1)
+        intercept = y_mean - slope * u_mean
+        return (slope / scale, intercept)
+
+    @classmethod
+    def _fit_negative_exp_many(cls, x, y, mask, a_ini, b_ini, max_iter=200, tol=1.0e-12):
+        """
+        Fit negative exponential function f(x)=A exp(-Bx) with vectorized Levenberg-Marquardt method.
+
+        Args:
+            x (numpy.ndarray): x values with shape (phases, records)
+            y (numpy.ndarray): y values with shape (phases, records)
+            mask (numpy.ndarray): mask of the records
+            a_ini (numpy.ndarray): initial values of A with shape (phases,)
+            b_ini (numpy.ndarray): initial values of B with shape (phases,)
+            max_iter (int): the maximum number of iterations
+            tol (float): tolerance of relative change of the sum of squared residuals
+
+        Returns:
+            tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray):
+                parameter A and B of the phases and whether the fitting converged or not
+        """
+        scale = cls._scale(x, mask)
+        u = np.where(mask, x / scale[:, None], 0)
+        y = np.where(mask, y, 0)
+        # Fit f(u) = A exp(-Cu) where C = B * scale
+        a = np.asarray(a_ini, dtype=np.float64).copy()
+        c = np.asarray(b_ini, dtype=np.float64) * scale
+        valid = np.isfinite(a) & np.isfinite(c) & np.isfinite(y).all(axis=1)
+        a, c = np.where(valid, a, 0), np.where(valid, c, 0)
+
+        def _sse(a, c):
+            return (np.where(mask, y - a[:, None] * np.exp(-c[:, None] * u), 0) ** 2).sum(axis=1)
+
+        sse = _sse(a, c)
+        damping = np.full(a.shape, 1.0e-3)
+        converged = ~valid
+        for _ in range(max_iter):
+            if converged.all():
+                break
+            exp_u = np.where(mask, np.exp(-c[:, None] * u), 0)
+            residual = np.where(mask, y - a[:, None] * exp_u, 0)
+            jac_a = exp_u
+            jac_c = -a[:, None] * u * exp_u
+            a11, a12, a22 = (jac_a ** 2).sum(axis=1), (jac_a * jac_c).sum(axis=1), (jac_c ** 2).sum(axis=1)
+            g1, g2 = (jac_a * residual).sum(axis=1), (jac_c * residual).sum(axis=1)
+            d11, d22 = a11 * (1 + damping), a22 * (1 + damping)
+            det = d11 * d22 - a12 ** 2
+            new_a = a + (g1 * d22 - g2 * a12) / det
+            new_c = c + (d11 * g2 - a12 * g1) / det
+            new_sse = _sse(new_a, new_c)
+            improved = np.isfinite(new_sse) & (new_sse <= sse) & ~converged
+            small = np.abs(sse - new_sse) <= tol * np.maximum(sse, 1.0e-300)
+            converged = converged | (improved & small) | (sse == 0)
+            a, c = np.where(improved, new_a, a), np.where(improved, new_c, c)
+            sse = np.where(improved, new_sse, sse)
+            damping = np.where(improved, damping / 10, damping * 10)
+            # Stop when the step cannot be improved any more
+            converged = converged | (damping > 1.0e16)
+        success = valid & converged & np.isfinite(a) & np.isfinite(c)
+        return (a, c / scale, success)
+
+    def _fitting(self, sr_df, func, param=None, p0=None):
         """
         Perform curve fitting of S-R trend with linear or negative exponential function.
 
@@ -106,6 +326,9 @@ class Trend(Term):
                 Columns:
                     - Recovered: The number of recovered cases
                     - Susceptible: Actual data of Susceptible
+            func (str): the selected curve fitting function, either linear or negative exponential
+            param (tuple(float, float) or None): fitted parameter values or None (use Trend._curve_fit())
+            p0 (tuple(float, float) or None): initial values of the parameters for Trend._curve_fit()
 
         Returns:
             pandas.DataFrame
@@ -116,30 +339,81 @@ class Trend(Term):
                     - Susceptible_actual (int): Actual values of Susceptible
                     - Susceptible_predicted (int): Predicted values of Susceptible
         """
+        self.fit_fnc = self.negative_exp if func == self.N else self.linear
         df = sr_df.rename({self.S: f"{self.S}{self.A}"}, axis=1)
         df = df.astype(np.float64)
-        # Calculate initial values of parameters
-        x_series = df[self.R]
-        y_series = np.log(df[f"{self.S}{self.A}"]).astype(np.float64)
-        a_ini = y_series.max()
-        b_ini = y_series.diff().reset_index(drop=True)[1] / a_ini
-        # Curve fitting with linear or negative exponential function
-        warnings.simplefilter("ignore", OptimizeWarning)
-        warnings.simplefilter("ignore", RuntimeWarning)
-        param, _ = curve_fit(
-            self.fit_fnc, x_series, y_series,
-            p0=[a_ini, b_ini],
-            # Increase mux number of iteration in curve fitting from 600 (default)
-            maxfev=5000
-        )
-        # Predict the values with the parameters
-        f_partial = functools.partial(
-            self.fit_fnc, a=param[0], b=param[1]
-        )
-        df[f"{self.S}{self.P}"] = np.exp(
-            f_partial(x_series)).astype(np.float64)
+        # Floating point errors (RuntimeWarning) will be ignored only in this thread
+        with np.errstate(all="ignore"):
+            x_series = df[self.R]
+            y_series = np.log(df[f"{self.S}{self.A}"]).astype(np.float64)
+            if param is None or not np.isfinite(param).all():
+                # Calculate initial values of parameters
+                if p0 is None or not np.isfinite(p0).all():
+                    a_ini = y_series.max()
+                    b_ini = y_series.diff().reset_index(drop=True)[1] / a_ini
+                    p0 = [a_ini, b_ini]
+                # Curve fitting with linear or negative exponential function
+                param = self._curve_fit(
+                    self.fit_fnc, x_series, y_series,
+                    p0=p0,
+                    # Increase mux number of iteration in curve fitting from 600 (default)
+                    maxfev=5000
+                )
+            self._param_dict[func] = (param[0], param[1])
+            # Predict the values with the parameters
+            f_partial = functools.partial(
+                self.fit_fnc, a=param[0], b=param[1]
+            )
+            df[f"{self.S}{self.P}"] = np.exp(
+                f_partial(x_series)).astype(np.float64)
         return df.astype(np.int64, errors="ignore")
 
+    @staticmethod
+    def _curve_fit(f, x_series, y_series, p0, maxfev):
+        """
+        Fit the function with Levenberg-Marquardt method, as the same as scipy.optimize.curve_fit().
+
+        Args:
+            f (callable): function to fit, f(x, a, b)
+            x_series (pandas.Series): x values
+            y_series (pandas.Series): y values
+            p0 (list[float] or tuple(float, float)): initial values of the parameters
+            maxfev (int): the maximum number of calls to the function
+
+        Raises:
+            RuntimeError: the optimal parameters were not found
+            ValueError: y values include NA or infinite values
+
+        Returns:
+            numpy.ndarray: parameter values
+
+        Notes:
+            Covariance of the parameters will not be calculated and OptimizeWarning will not be raised.
+        """
+        y_array = np.asarray_chkfinite(y_series, dtype=np.float64)
+        param, _, _, errmsg, ier = leastsq(
+            lambda p: f(x_series, *p) - y_array, p0, full_output=True, maxfev=maxfev)
+        if ier not in [1, 2, 3, 4]:
+            raise RuntimeError(f"Optimal parameters not found: {errmsg}")
+        return param
+
+    def predict(self, recovered):
+        """
+        Predict the values of Susceptible with the best solution.
+
+        Args:
+            recovered (numpy.ndarray or pandas.Series): Recovered values
+
+        Returns:
+            numpy.ndarray: predicted values of Susceptible
+        """
+        if self._result_df.empty:
+            self.run()
+        fit_fnc = self.negative_exp if self._func == self.N else self.linear
+        a, b = self._param_dict[self._func]
+        with np.errstate(all="ignore"):
+            return np.exp(fit_fnc(np.asarray(recovered, dtype=np.float64), a, b))
+
     def rmsle(self):
         """
         Return the best RMSLE score.
@@ -227,12 +501,13 @@ class Trend(Term):
         x_series = df[cls.R]
         actual = df[f"{cls.S}{cls.A}"]
         # Plot the actual values
-        warnings.simplefilter("ignore", FutureWarning)
-        plt.plot(
-            x_series, actual,
-            label="Actual", color="black",
-            marker=".", markeredgewidth=0, linewidth=0
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            plt.plot(
+                x_series, actual,
+                label="Actual", color="black",
+                marker=".", markeredgewidth=0, linewidth=0
+            )
         # Plot the predicted values
         for col in predicted_cols:
             plt.plot(x_series, df[col], label=col.replace(cls.P, str()))
@@ -272,8 +547,9 @@ class Trend(Term):
             bbox_to_anchor=(1.02, 0), loc="lower left", borderaxespad=0
         )
         # Save figure or show figure
-        warnings.simplefilter("ignore", UserWarning)
-        plt.tight_layout()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            plt.tight_layout()
         if filename is None:
             plt.show()
             return None
@@ -10,6 +10,7 @@ import optuna
 import pandas as pd
 import seaborn as sns
 from sklearn.metrics import mean_squared_log_error
+from covsirphy.util.optimize import _quiet_optuna
 from covsirphy.util.stopwatch import StopWatch
 from covsirphy.cleaning.term import Term
 from covsirphy.ode.mbase import ModelBase
@@ -35,11 +36,11 @@ class Estimator(Term):
         population (int): total population in the place
         tau (int): tau value [min], a divisor of 1440
         kwargs: parameter values of the model and data subseting
+
+    Notes:
+        Estimator does not change numpy error handling and warning filters. Instances can be used in threads
+        concurrently. INFO logs of Optuna will be suppressed only while optimization is running.
     """
-    np.seterr(divide="raise")
-    optuna.logging.disable_default_handler()
-    warnings.simplefilter("ignore", FutureWarning)
-    warnings.simplefilter("ignore", SyntaxWarning)
 
     def __init__(self, record_df, model, population, tau=None, **kwargs):
         # ODE model
@@ -89,7 +90,7 @@ class Estimator(Term):
         )
 
     def run(self, timeout=180, reset_n_max=3,
-            timeout_iteration=10, allowance=(0.98, 1.02), seed=0, **kwargs):
+            timeout_iteration=10, allowance=(0.98, 1.02), seed=0, callback=None, **kwargs):
         """
         Run optimization.
         If the result satisfied the following conditions, optimization ends.
@@ -103,10 +104,15 @@ class Estimator(Term):
             timeout_iteration (int): time-out of one iteration
             allowance (tuple(float, float)): the allowance of the predicted value
             seed (int or None): random seed of hyperparameter optimization
+            callback (callable or None): function called after each iteration with a dictionary
+                - Trials (int): the number of trials in the current study
+                - Runtime (float): runtime of this run [sec]
+                - RMSLE (float): the best RMSLE score in the current study
             kwargs: other keyword arguments will be ignored
 
         Notes:
             @n_jobs was obsoleted because this is not effective for Optuna.
+            Division by zero raises FloatingPointError in optimization (with numpy.errstate of this thread).
         """
         # Create a study of optuna
         if self.study is None:
@@ -115,26 +121,34 @@ class Estimator(Term):
         iteration_n = math.ceil(timeout / timeout_iteration)
         increasing_cols = [f"{v}{self.P}" for v in self.model.VARS_INCLEASE]
         stopwatch = StopWatch()
-        for _ in range(iteration_n):
-            # Perform optimization
-            self.study.optimize(
-                self._objective, n_jobs=1, timeout=timeout_iteration)
-            # Create a table to compare observed/estimated values
-            comp_df = self._compare(*self._param())
-            # Check monotonic variables
-            mono_ok_list = [
-                comp_df[col].is_monotonic_increasing for col in increasing_cols
-            ]
-            if not all(mono_ok_list):
-                if reset_n == reset_n_max - 1:
+        with np.errstate(divide="raise"), _quiet_optuna():
+            for _ in range(iteration_n):
+                # Perform optimization
+                self.study.optimize(
+                    self._objective, n_jobs=1, timeout=timeout_iteration)
+                if callback is not None:
+                    values = [trial.value for trial in self.study.trials if trial.value is not None]
+                    callback({
+                        self.TRIALS: len(self.study.trials),
+                        self.RUNTIME: stopwatch.stop(),
+                        self.RMSLE: min(values) if values else None,
+                    })
+                # Create a table to compare observed/estimated values
+                comp_df = self._compare(*self._param())
+                # Check monotonic variables
+                mono_ok_list = [
+                    comp_df[col].is_monotonic_increasing for col in increasing_cols
+                ]
+                if not all(mono_ok_list):
+                    if reset_n == reset_n_max - 1:
+                        break
+                    # Initialize the study
+                    self._init_study(seed=seed)
+                    reset_n += 1
+                    continue
+                # Need additional trials when the values are not in allowance
+                if self._is_in_allowance(comp_df, allowance):
                     break
-                # Initialize the study
-                self._init_study(seed=seed)
-                reset_n += 1
-                continue
-            # Need additional trials when the values are not in allowance
-            if self._is_in_allowance(comp_df, allowance):
-                break
         # Calculate run-time and the number of trials
         self.runtime += stopwatch.stop()
         self.total_trials = len(self.study.trials)
@@ -358,8 +372,9 @@ class Estimator(Term):
         # Show figure
         fig_df = df.loc[:, df.columns.str.startswith("params_")]
         fig_df.columns = fig_df.columns.str.replace("params_", "")
-        warnings.simplefilter("ignore", category=UserWarning)
-        sns.pairplot(fig_df, diag_kind="kde", markers="+")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
+            sns.pairplot(fig_df, diag_kind="kde", markers="+")
         # Save figure or show figure
         if filename is None:
             plt.show()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from itertools import product
+import numpy as np
+import pandas as pd
+from scipy.integrate import solve_ivp
+from covsirphy.cleaning.term import Term
+from covsirphy.ode.mbase import ModelBase
+
+
+class GridSimulator(Term):
+    """
+    Simulate an ODE model with a grid of parameter sets at once.
+
+    Args:
+        model (covsirphy.ModelBase): ODE model
+        population (int): total population
+        tau (int): tau value [min]
+        start_date (str): the first date of simulation, like 01Jan2020
+        y0_dict (dict[str, int]): initial values of the variables of the model on @start_date
+
+    Notes:
+        ODE systems of all parameter sets will be stacked and solved with one call of scipy.integrate.solve_ivp().
+        If the model cannot handle arrays of parameter values (e.g. SIR-FV model), the sets will be solved one by one.
+        Because step sizes are controlled for all sets together, results may slightly differ from ODESimulator's.
+
+    Examples:
+        >>> simulator = cs.GridSimulator(cs.SIRF, 1_000_000, 1440, "01Jan2021", y0_dict)
+        >>> param_df = simulator.grid(rho=[0.1, 0.2], sigma=[0.01, 0.02], theta=[0.002], kappa=[0.005])
+        >>> simulator.run(param_df, end_date="31Mar2021")
+    """
+
+    def __init__(self, model, population, tau, start_date, y0_dict):
+        self._model = self.ensure_subclass(model, ModelBase, name="model")
+        self._population = self.ensure_natural_int(population, name="population")
+        self._tau = self.ensure_tau(tau)
+        self.ensure_date(start_date, name="start_date")
+        self._start_date = start_date
+        self.ensure_list(list(y0_dict.keys()), candidates=self._model.VARIABLES, name="y0_dict")
+        self._y0_array = np.array([y0_dict.get(var, 0) for var in self._model.VARIABLES], dtype=np.float64)
+
+    @staticmethod
+    def grid(**kwargs):
+        """
+        Create all combinations of the parameter values.
+
+        Args:
+            kwargs (dict[str, list[float]]): candidates of the values for each parameter
+
+        Returns:
+            pandas.DataFrame:
+                Index:
+                    reset index
+                Columns:
+                    parameter names (float): parameter values
+        """
+        names = list(kwargs.keys())
+        values = [np.ravel(kwargs[name]).tolist() for name in names]
+        return pd.DataFrame(list(product(*values)), columns=names, dtype=np.float64)
+
+    def _solve(self, param_dict, n_grid, steps):
+        """
+        Solve the stacked ODE systems.
+
+        Args:
+            param_dict (dict[str, numpy.ndarray]): parameter values, arrays with the length of @n_grid
+            n_grid (int): the number of parameter sets
+            steps (numpy.ndarray): time steps to return the values
+
+        Returns:
+            numpy.ndarray or None: values with shape (the number of variables, len(@steps), @n_grid)
+                or None when the model cannot handle arrays of parameter values
+        """
+        n_vars = len(self._model.VARIABLES)
+        model = self._model(population=self._population, **param_dict)
+        y0 = np.repeat(self._y0_array[:, np.newaxis], n_grid, axis=1)
+        try:
+            if np.shape(model(0, y0)) != y0.shape:
+                return None
+        except (TypeError, ValueError):
+            return None
+        sol = solve_ivp(
+            fun=lambda t, y: np.asarray(model(t, y.reshape(n_vars, n_grid))).ravel(),
+            t_span=[0, steps[-1]],
+            y0=y0.ravel(),
+            t_eval=steps,
+            dense_output=False
+        )
+        return sol["y"].reshape(n_vars, n_grid, len(steps)).transpose(0, 2, 1)
+
+    def _solve_each(self, param_dict, n_grid, steps):
+        """
+        Solve the ODE systems one by one.
+
+        Args:
+            param_dict (dict[str, numpy.ndarray]): parameter values, arrays with the length of @n_grid
+            n_grid (int): the number of parameter sets
+            steps (numpy.ndarray): time steps to return the values
+
+        Returns:
+            numpy.ndarray: values with shape (the number of variables, len(@steps), @n_grid)
+        """
+        results = []
+        for i in range(n_grid):
+            model = self._model(population=self._population, **{k: v[i] for (k, v) in param_dict.items()})
+            sol = solve_ivp(
+                fun=model, t_span=[0, steps[-1]], y0=self._y0_array, t_eval=steps, dense_output=False)
+            results.append(sol["y"])
+        return np.stack(results, axis=2)
+
+    def run(self, param_df, end_date):
+        """
+        Simulate the number of cases with the parameter sets and summarize the results.
+
+        Args:
+            param_df (pandas.DataFrame): parameter sets, refer to GridSimulator.grid()
+                Index:
+                    reset index
+                Columns:
+                    parameter names of the model (float): parameter values
+            end_date (str): the last date of simulation
+
+        Raises:
+            KeyError: values of some parameters were not included in @param_df
+
+        Returns:
+            pandas.DataFrame:
+                Index:
+                    reset index
+                Columns:
+                    - parameter names of the model (float): the same as @param_df
+                    - max(Infected) (int): max value of Infected
+                    - argmax(Infected) (str): the date when Infected shows max value
+                    - Confirmed on {end_date} (int): Confirmed on the end date
+                    - Infected on {end_date} (int): Infected on the end date
+                    - Fatal on {end_date} (int): Fatal on the end date
+
+        Notes:
+            Values on @start_date are the initial values and included in max(Infected).
+        """
+        self.ensure_dataframe(param_df, name="param_df", columns=self._model.PARAMETERS)
+        self.ensure_date_order(self._start_date, end_date, name="end_date")
+        n_grid = len(param_df)
+        param_dict = {
+            param: param_df[param].to_numpy(dtype=np.float64) for param in self._model.PARAMETERS}
+        # Values at 00:00 of each date
+        days = self.steps(self._start_date, end_date, tau=1440)
+        steps = np.arange(days + 1) * (1440 // self._tau)
+        y = self._solve(param_dict, n_grid, steps)
+        if y is None:
+            y = self._solve_each(param_dict, n_grid, steps)
+        # Confirmed/Infected/Fatal/Recovered
+        var_df = pd.DataFrame(
+            {var: np.round(values).ravel() for (var, values) in zip(self._model.VARIABLES, y)}, dtype=np.int64)
+        df = self._model.restore(var_df)
+        infected = df[self.CI].to_numpy().reshape(days + 1, n_grid)
+        dates = pd.date_range(self.date_obj(self._start_date), periods=days + 1, freq="D")
+        # Summary
+        summary_df = param_df.loc[:, self._model.PARAMETERS].reset_index(drop=True)
+        summary_df[f"max({self.CI})"] = infected.max(axis=0)
+        summary_df[f"argmax({self.CI})"] = dates[infected.argmax(axis=0)].strftime(self.DATE_FORMAT)
+        for col in [self.C, self.CI, self.F]:
+            summary_df[f"{col} on {end_date}"] = df[col].to_numpy().reshape(days + 1, n_grid)[-1]
+        return summary_df
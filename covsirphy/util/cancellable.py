@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import threading
+
+# Executor used when not specified, created when needed
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def default_executor():
+    """
+    Return the default executor (thread pool) for asynchronous methods.
+
+    Returns:
+        concurrent.futures.ThreadPoolExecutor: executor shared in the process
+    """
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(thread_name_prefix="covsirphy")
+        return _default_executor
+
+
+def submit_cancellable(func, executor=None, timeout=None):
+    """
+    Submit a function to the executor and return a future which can be cancelled even while running.
+
+    Args:
+        func (callable): function which receives threading.Event (set when cancelled or timed out)
+        executor (concurrent.futures.Executor or None): thread-based executor or None (default thread pool)
+        timeout (float or None): time-out [sec] or None (un-limited)
+
+    Returns:
+        concurrent.futures.Future: future which resolves to the returned value of @func
+
+    Notes:
+        The future stays in pending state until completion, and Future.cancel() sets the event while running.
+        @func should check the event and stop the work cooperatively.
+        When timed out, the event will be set and TimeoutError will be set to the future.
+        The future can be awaited with asyncio.wrap_future().
+    """
+    executor = executor or default_executor()
+    future = Future()
+    cancel_event = threading.Event()
+    lock = threading.Lock()
+
+    def _on_done(f):
+        if f.cancelled():
+            cancel_event.set()
+    future.add_done_callback(_on_done)
+
+    def _finish(result=None, exception=None):
+        with lock:
+            if future.done():
+                return
+            try:
+                if exception is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(exception)
+            except Exception:
+                # Cancelled just now
+                pass
+
+    def _run():
+        if cancel_event.is_set():
+            return
+        try:
+            result = func(cancel_event)
+        except BaseException as e:
+            _finish(exception=e)
+        else:
+            _finish(result=result)
+
+    if timeout is not None:
+        def _expire():
+            cancel_event.set()
+            _finish(exception=TimeoutError(f"The task was not completed in {timeout} sec."))
+        timer = threading.Timer(timeout, _expire)
+        timer.daemon = True
+        future.add_done_callback(lambda _: timer.cancel())
+        timer.start()
+    inner = executor.submit(_run)
+    future.add_done_callback(lambda f: inner.cancel() if f.cancelled() else None)
+    return future
@@ -3,6 +3,11 @@
 
 from pathlib import Path
 import pandas as pd
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    # Parquet format is not available
+    pyarrow = None
 
 
 def save_dataframe(df, filename, index=True):
@@ -25,3 +30,47 @@ def save_dataframe(df, filename, index=True):
         df.to_csv(filepath, index=index)
     except (TypeError, OSError):
         pass
+
+
+def save_table(df, filename):
+    """
+    Save dataframe as a Parquet file (or a CSV file when pyarrow is not installed) without index.
+
+    Args:
+        df (pd.DataFrame): the dataframe
+        filename (str or pathlib.Path): filename without suffix
+
+    Returns:
+        pathlib.Path: path of the saved file with suffix ".parquet" or ".csv"
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise TypeError(
+            f"@df should be a pandas.DataFrame, but {type(df)} was applied.")
+    if pyarrow is None:
+        filepath = Path(f"{filename}.csv")
+        df.to_csv(filepath, index=False)
+    else:
+        filepath = Path(f"{filename}.parquet")
+        df.to_parquet(filepath, index=False)
+    return filepath
+
+
+def load_table(filename, date_columns=None):
+    """
+    Load dataframe saved with save_table().
+
+    Args:
+        filename (str or pathlib.Path): filename with suffix ".parquet" or ".csv"
+        date_columns (list[str] or None): columns to parse as dates when the file is a CSV file
+
+    Returns:
+        pd.DataFrame: the dataframe with reset index
+    """
+    filepath = Path(filename)
+    if filepath.suffix == ".parquet":
+        return pd.read_parquet(filepath)
+    df = pd.read_csv(filepath)
+    for col in date_columns or []:
+        if col in df:
+            df[col] = pd.to_datetime(df[col])
+    return df
@@ -1,7 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from contextlib import contextmanager
 from datetime import datetime
+import threading
 import warnings
 import matplotlib.pyplot as plt
 from matplotlib.ticker import ScalarFormatter
@@ -10,6 +12,32 @@ import optuna
 import pandas as pd
 import seaborn as sns
 
+# The number of running optimizations and verbosity of Optuna before the first one started
+_optuna_lock = threading.Lock()
+_optuna_running = 0
+_optuna_verbosity = None
+
+
+@contextmanager
+def _quiet_optuna():
+    """
+    Suppress INFO logs of Optuna while at least one optimization is running in this process.
+    The verbosity will be restored when all optimizations finished.
+    """
+    global _optuna_running, _optuna_verbosity
+    with _optuna_lock:
+        if not _optuna_running:
+            _optuna_verbosity = optuna.logging.get_verbosity()
+            optuna.logging.set_verbosity(optuna.logging.WARNING)
+        _optuna_running += 1
+    try:
+        yield
+    finally:
+        with _optuna_lock:
+            _optuna_running -= 1
+            if not _optuna_running:
+                optuna.logging.set_verbosity(_optuna_verbosity)
+
 
 class Optimizer(object):
     """
@@ -24,10 +52,12 @@ class Optimizer(object):
                 - Explanatory variable defined by @x
                 - Response variables which is not @x
         kwargs: keyword arguments of fixed parameter values
+
+    Notes:
+        Warning filters and logging of Optuna will not be changed when imported.
+        FutureWarning and SyntaxWarning will be ignored and INFO logs of Optuna will be suppressed
+        only while optimization is running.
     """
-    optuna.logging.disable_default_handler()
-    warnings.simplefilter("ignore", FutureWarning)
-    warnings.simplefilter("ignore", SyntaxWarning)
     A, P = "_actual", "_predicted"
 
     def __init__(self, train_df, x="t", **kwargs):
@@ -51,10 +81,13 @@ class Optimizer(object):
         Notes:
             @seed will effective when the number of CPUs is 1
         """
-        self.study = optuna.create_study(
-            direction="minimize",
-            sampler=optuna.samplers.TPESampler(seed=seed)
-        )
+        with warnings.catch_warnings(), _quiet_optuna():
+            warnings.simplefilter("ignore", FutureWarning)
+            warnings.simplefilter("ignore", SyntaxWarning)
+            self.study = optuna.create_study(
+                direction="minimize",
+                sampler=optuna.samplers.TPESampler(seed=seed)
+            )
 
     def run(self, n_trials, timeout, n_jobs=-1, seed=None):
         """
@@ -76,8 +109,11 @@ class Optimizer(object):
         start_time = datetime.now()
         if self.study is None:
             self._init_study(seed=seed)
-        self.study.optimize(
-            self.objective, n_trials=n_trials, timeout=timeout, n_jobs=n_jobs)
+        with warnings.catch_warnings(), _quiet_optuna():
+            warnings.simplefilter("ignore", FutureWarning)
+            warnings.simplefilter("ignore", SyntaxWarning)
+            self.study.optimize(
+                self.objective, n_trials=n_trials, timeout=timeout, n_jobs=n_jobs)
         end_time = datetime.now()
         self.runtime += (end_time - start_time).total_seconds()
         self.total_trials += n_trials
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import importlib
+from multiprocessing import cpu_count, Pool
+
+
+class WorkerPool(object):
+    """
+    Pool of worker processes which can be re-used across parameter estimation calls.
+
+    Args:
+        n_jobs (int): the number of worker processes or -1 (CPU count)
+        modules (list[str] or None): names of the modules to import in the workers when started
+
+    Notes:
+        If @modules is None, covsirphy (and optuna, pandas, scipy) will be imported in the workers.
+        Workers will stay alive (with the imported modules and their caches) until WorkerPool.close() is called.
+        This can be used with with-statement.
+
+    Examples:
+        >>> with cs.WorkerPool(n_jobs=4) as pool:
+        >>>     snl.estimate(cs.SIRF, pool=pool)
+        >>>     policy.estimate(cs.SIRF, pool=pool)
+    """
+    MODULES = ["covsirphy", "optuna", "pandas", "scipy.integrate"]
+
+    def __init__(self, n_jobs=-1, modules=None):
+        if not isinstance(n_jobs, int) or (n_jobs < 1 and n_jobs != -1):
+            raise ValueError(
+                f"@n_jobs must be a positive integer or -1, but {n_jobs} was applied.")
+        self._n_jobs = cpu_count() if n_jobs == -1 else n_jobs
+        self._modules = self.MODULES[:] if modules is None else list(modules)
+        self._pool = Pool(
+            self._n_jobs, initializer=self._initializer, initargs=(self._modules,))
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def _initializer(modules):
+        """
+        Import the modules in the worker process.
+
+        Args:
+            modules (list[str]): names of the modules
+        """
+        for name in modules:
+            importlib.import_module(name)
+
+    @property
+    def n_jobs(self):
+        """
+        int: the number of worker processes
+        """
+        return self._n_jobs
+
+    @property
+    def closed(self):
+        """
+        bool: whether the pool has been closed or not
+        """
+        return self._closed
+
+    def _ensure_running(self):
+        """
+        Ensure that the pool is running.
+
+        Raises:
+            ValueError: the pool has been closed
+        """
+        if self._closed:
+            raise ValueError("The worker pool has been closed.")
+
+    def map(self, func, iterable, chunksize=None):
+        """
+        Apply the function to each element with the workers.
+
+        Args:
+            func (callable): picklable function
+            iterable (iterable): arguments
+            chunksize (int or None): the number of elements sent to a worker at once
+
+        Returns:
+            list[object]: the returned values in the order of @iterable
+        """
+        self._ensure_running()
+        return self._pool.map(func, iterable, chunksize=chunksize)
+
+    def starmap(self, func, iterable, chunksize=None):
+        """
+        Apply the function to each group of arguments with the workers.
+
+        Args:
+            func (callable): picklable function
+            iterable (iterable[tuple]): groups of arguments
+            chunksize (int or None): the number of elements sent to a worker at once
+
+        Returns:
+            list[object]: the returned values in the order of @iterable
+        """
+        self._ensure_running()
+        return self._pool.starmap(func, iterable, chunksize=chunksize)
+
+    def imap_unordered(self, func, iterable, chunksize=1):
+        """
+        Apply the function to each element with the workers, returning the results as soon as they are ready.
+
+        Args:
+            func (callable): picklable function
+            iterable (iterable): arguments
+            chunksize (int): the number of elements sent to a worker at once
+
+        Returns:
+            iterator[object]: the returned values in the order of completion
+        """
+        self._ensure_running()
+        return self._pool.imap_unordered(func, iterable, chunksize=chunksize)
+
+    def close(self):
+        """
+        Close the pool and wait for the workers to exit.
+        """
+        if self._closed:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._closed = True
+
+    def terminate(self):
+        """
+        Stop the workers immediately.
+        """
+        if self._closed:
+            return
+        self._pool.terminate()
+        self._pool.join()
+        self._closed = True
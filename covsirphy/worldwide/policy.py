@@ -1,20 +1,159 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import functools
 from itertools import groupby
+import json
 from operator import itemgetter
+from pathlib import Path
+import shutil
+import tempfile
+import warnings
 import pandas as pd
+from covsirphy.__version__ import __version__
 from covsirphy.util.error import deprecate, UnExecutedError
+from covsirphy.util.cancellable import submit_cancellable
 from covsirphy.util.plotting import line_plot
 from covsirphy.cleaning.jhu_data import JHUData
 from covsirphy.cleaning.population import PopulationData
 from covsirphy.cleaning.oxcgrt import OxCGRTData
 from covsirphy.cleaning.term import Term
 from covsirphy.ode.mbase import ModelBase
+from covsirphy.phase.phase_unit import PhaseUnit
 from covsirphy.phase.phase_estimator import MPEstimator
+from covsirphy.phase.sr_change import ChangeFinder
 from covsirphy.analysis.scenario import Scenario
 
 
+class _LazyScenarioDict(MutableMapping):
+    """
+    Dictionary of scenarios which will be created or loaded when accessed for the first time.
+
+    Args:
+        loader_dict (dict[str, callable]): functions which return covsirphy.Scenario without arguments
+        max_size (int or None): the maximum number of scenarios kept in memory or None (un-limited)
+        dir_dict (dict[str, pathlib.Path] or None): directories of the scenarios saved with Scenario.save(), if any
+
+    Notes:
+        When more than @max_size scenarios are in memory, the least recently used one will be saved
+        in a temporary directory with Scenario.save() and loaded with Scenario.load() when accessed again.
+        Estimators of the phases will not be kept after that.
+    """
+
+    def __init__(self, loader_dict, max_size=None, dir_dict=None):
+        self._loader_dict = dict(loader_dict)
+        self._max_size = max_size
+        # Keys in the registered order, scenarios in memory (least recently used first)
+        self._key_dict = dict.fromkeys(self._loader_dict)
+        self._scenario_dict = OrderedDict()
+        # Temporary directory and sub-directories to save evicted scenarios
+        self._spill_dir = None
+        self._subdir_dict = {}
+        # Directories of the saved scenarios, {key: directory}
+        self._dir_dict = dict(dir_dict or {})
+
+    def __getitem__(self, key):
+        if key in self._scenario_dict:
+            self._scenario_dict.move_to_end(key)
+            return self._scenario_dict[key]
+        scenario = self._loader_dict[key]()
+        del self._loader_dict[key]
+        self._store(key, scenario)
+        return scenario
+
+    def __setitem__(self, key, value):
+        self._loader_dict.pop(key, None)
+        self._key_dict[key] = None
+        self._store(key, value)
+
+    def __delitem__(self, key):
+        del self._key_dict[key]
+        self._loader_dict.pop(key, None)
+        self._scenario_dict.pop(key, None)
+        self._dir_dict.pop(key, None)
+
+    def __iter__(self):
+        return iter(self._key_dict)
+
+    def __len__(self):
+        return len(self._key_dict)
+
+    def _store(self, key, scenario):
+        """
+        Keep the scenario in memory and evict the least recently used scenarios, if necessary.
+
+        Args:
+            key (str): key of the scenario
+            scenario (covsirphy.Scenario): the scenario
+        """
+        self._scenario_dict[key] = scenario
+        self._scenario_dict.move_to_end(key)
+        while self._max_size is not None and len(self._scenario_dict) > self._max_size:
+            self._spill(*self._scenario_dict.popitem(last=False))
+
+    def _spill(self, key, scenario):
+        """
+        Save the scenario in the temporary directory and register the loader.
+
+        Args:
+            key (str): key of the scenario
+            scenario (covsirphy.Scenario): the scenario
+        """
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(prefix="covsirphy_")
+        subdir = self._subdir_dict.setdefault(key, f"scenario_{len(self._subdir_dict)}")
+        dirpath = Path(self._spill_dir.name).joinpath(subdir)
+        scenario.save(dirpath)
+        self._loader_dict[key] = functools.partial(Scenario.load, dirpath, jhu_data=scenario.jhu_data)
+        self._dir_dict[key] = dirpath
+
+    def save(self, key, directory):
+        """
+        Save the scenario without creating or loading it.
+
+        Args:
+            key (str): key of the scenario
+            directory (pathlib.Path): directory to save the files
+
+        Returns:
+            bool: whether the scenario was saved or not (has not been created)
+
+        Notes:
+            Scenarios in memory will be saved with Scenario.save() and the files of the saved scenarios
+            (evicted or loaded from a directory) will be copied.
+            Files in the directory will be removed in advance because they may be the files of another scenario.
+            When saved in the parent directory of the saved files, the scenario will be loaded from the new files.
+        """
+        if key in self._scenario_dict:
+            shutil.rmtree(directory, ignore_errors=True)
+            self._scenario_dict[key].save(directory)
+            return True
+        if key not in self._dir_dict:
+            return False
+        source, dirpath = Path(self._dir_dict[key]), Path(directory)
+        if source.resolve() == dirpath.resolve():
+            return True
+        shutil.rmtree(dirpath, ignore_errors=True)
+        shutil.copytree(source, dirpath)
+        # The source may be overwritten with the files of another scenario
+        if source.parent.resolve() == dirpath.parent.resolve():
+            loader = self._loader_dict[key]
+            self._loader_dict[key] = functools.partial(loader.func, dirpath, **loader.keywords)
+            self._dir_dict[key] = dirpath
+        return True
+
+    def loaded(self):
+        """
+        Return the keys of the scenarios in memory.
+
+        Returns:
+            list[str]: keys of the scenarios in the registered order
+        """
+        return [key for key in self._key_dict if key in self._scenario_dict]
+
+
 class PolicyMeasures(Term):
     """
     Analyse the relationship of policy measures and parameters of ODE models.
@@ -23,10 +162,18 @@ class PolicyMeasures(Term):
     Args:
         jhu_data (covsirphy.JHUData): object of records
         population_data (covsirphy.PopulationData): PopulationData object
+        oxcgrt_data (covsirphy.OxCGRTData): OxCGRTData object
         tau (int or None): tau value [min]
+        max_scenarios (int or None): the maximum number of scenarios kept in memory or None (un-limited)
+
+    Notes:
+        Scenario of each country will be created when accessed for the first time.
+        When more than @max_scenarios scenarios are in memory, the least recently used one will be saved
+        in a temporary directory and loaded again when accessed. Please get Scenario instances
+        with PolicyMeasures.scenario() each time because the old instances will not be updated after that.
     """
 
-    def __init__(self, jhu_data, population_data, oxcgrt_data, tau=None):
+    def __init__(self, jhu_data, population_data, oxcgrt_data, tau=None, max_scenarios=None):
         # Records
         self.jhu_data = self.ensure_instance(
             jhu_data, JHUData, name="jhu_data")
@@ -40,8 +187,10 @@ class PolicyMeasures(Term):
         self.tau = self.ensure_tau(tau)
         # Init
         self._countries = self._all_countries()
-        self._init_scenario()
+        self._init_scenario(max_scenarios=max_scenarios)
         self.model = None
+        # Countries loaded without records, which will be kept as "uncreated" when saved
+        self._unregistered = []
 
     def _all_countries(self):
         """
@@ -55,15 +204,21 @@ class PolicyMeasures(Term):
         o_list = self.oxcgrt_data.countries()
         return list(set(j_list) & set(p_list) & set(o_list))
 
-    def _init_scenario(self):
+    def _init_scenario(self, max_scenarios=None):
         """
-        Initialize the scenario classes of registered countries.
+        Initialize the scenario classes of registered countries, which will be created when accessed.
+
+        Args:
+            max_scenarios (int or None): the maximum number of scenarios kept in memory or None (un-limited)
         """
-        self.scenario_dict = {
-            country: Scenario(
-                self.jhu_data, self.population_data, country=country, tau=self.tau)
-            for country in self._countries
-        }
+        max_scenarios = self.ensure_natural_int(max_scenarios, name="max_scenarios", none_ok=True)
+        self.scenario_dict = _LazyScenarioDict(
+            {
+                country: functools.partial(
+                    Scenario, self.jhu_data, self.population_data, country=country, tau=self.tau)
+                for country in self._countries
+            },
+            max_size=max_scenarios)
 
     def scenario(self, country):
         """
@@ -92,7 +247,7 @@ class PolicyMeasures(Term):
     @countries.setter
     def countries(self, country_list):
         selected_set = set(country_list)
-        all_set = set(self._all_countries())
+        all_set = set(self.scenario_dict.keys())
         if not selected_set.issubset(all_set):
             un_selectable_set = selected_set - all_set
             un_selectable = ", ".join(list(un_selectable_set))
@@ -100,29 +255,41 @@ class PolicyMeasures(Term):
                 f"{un_selectable} cannot be selected because records are not registered.")
         self._countries = country_list
 
-    def trend(self, min_len=2):
+    def trend(self, min_len=2, n_jobs=-1, pool=None, **kwargs):
         """
         Perform S-R trend analysis for all registered countries.
 
         Args:
             min_len (int): minimum length of phases to have
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            kwargs: keyword arguments of ChangeFinder()
 
         Returns:
             covsirphy.PolicyMeasures: self
 
         Notes:
+            Change points of the countries will be searched in parallel with ChangeFinder.run_many()
+            and only S-R records will be sent to the worker processes.
             Countries which do not have @min_len phases will be un-registered.
+            When S-R trend analysis failed for some countries, UserWarning will be raised with the error messages
+            and the countries will be un-registered. Their phases will not be changed.
         """
         min_len = self.ensure_natural_int(min_len, name="min_len")
-        for country in self._countries:
-            try:
-                self.scenario_dict[country].trend(
-                    set_phases=True, show_figure=False)
-            except ValueError:
-                pass
+        sr_dict = {
+            country: self.scenario_dict[country]._tracker(self.MAIN).sr_df for country in self._countries}
+        change_dict, error_dict = ChangeFinder.run_many(sr_dict, n_jobs=n_jobs, pool=pool, **kwargs)
+        # Scenarios may be evicted from memory, and must be accessed one by one
+        for (country, change_dates) in change_dict.items():
+            self.scenario_dict[country]._tracker(self.MAIN).series.set_change_dates(change_dates)
+        if error_dict:
+            errors = "\n".join(
+                f"{country}: {error_dict[country]}" for country in self._countries if country in error_dict)
+            warnings.warn(
+                f"S-R trend analysis failed for {len(error_dict)} countries.\n{errors}", UserWarning, stacklevel=2)
         countries = [
             country for country in self._countries
-            if len(self.scenario_dict[country][self.MAIN]) >= min_len
+            if country not in error_dict and len(self.scenario_dict[country][self.MAIN]) >= min_len
         ]
         self.countries = countries
         return self
@@ -171,32 +338,56 @@ class PolicyMeasures(Term):
             for (length, records) in groupby(sorted_nest, key=itemgetter(1))
         }
 
-    def estimate(self, model, n_jobs=-1, **kwargs):
+    def estimate(self, model, n_jobs=-1, pool=None, **kwargs):
         """
         Estimate the parameter values of phases in the registered countries.
 
         Args:
             model (covsirphy.ModelBase): ODE model
             n_jobs (int): the number of parallel jobs or -1 (CPU count)
-            kwargs: keyword arguments of model parameters and covsirphy.Estimator.run()
+            pool (covsirphy.WorkerPool or None): pool of workers to re-use, or None (create a new pool)
+            kwargs: keyword arguments of model parameters, covsirphy.MPEstimator.run() and covsirphy.Estimator.run()
+
+        Raises:
+            ValueError: some phases have parameter values estimated with another ODE model
+
+        Notes:
+            Phases with parameter values estimated with @model will be ignored.
+            When all phases have been estimated, nothing will be changed.
+            Copies of the phases will be estimated and the results will be registered only when estimation completed.
+            With @checkpoint (filename) and @errors="skip" of covsirphy.MPEstimator.run(),
+            finished phases will be saved one by one and skipped when this method is called again.
         """
         model = self.ensure_subclass(model, ModelBase, name="model")
-        unit_nest = [
-            [
-                unit.set_id(
-                    country=self.jhu_data.country_to_iso3(country),
-                    phase=f"{self.num2str(num):>4}")
-                for (num, unit) in enumerate(self.scenario_dict[country][self.MAIN]) if unit]
-            for country in self._countries
-        ]
-        units = self.flatten(unit_nest)
+        unit_nest, other_list = [], []
+        for country in self._countries:
+            iso3 = self.jhu_data.country_to_iso3(country)
+            units, others = [], []
+            for (num, unit) in enumerate(self.scenario_dict[country][self.MAIN]):
+                if not unit:
+                    continue
+                if unit.id_dict is None:
+                    units.append(unit.copy().set_id(country=iso3, phase=f"{self.num2str(num):>4}"))
+                elif unit.model is not model:
+                    others.append(self.num2str(num))
+            unit_nest.append(units)
+            if others:
+                other_list.append(f"{country} ({', '.join(others)})")
+        if other_list:
+            raise ValueError(
+                f"Parameter values of some phases were estimated with another model, not {model.NAME}: "
+                f"{', '.join(other_list)}")
+        # Phases of different countries may have the same start/end dates (PhaseUnit.__eq__)
+        units = self.flatten(unit_nest, unique=False)
+        if not units:
+            return
         # Parameter estimation
         mp_estimator = MPEstimator(
             jhu_data=self.jhu_data, population_data=self.population_data,
             model=model, tau=self.tau, **kwargs)
         mp_estimator.add(units)
         results = mp_estimator.run(
-            n_jobs=n_jobs, auto_complement=True, **kwargs)
+            n_jobs=n_jobs, pool=pool, auto_complement=True, **kwargs)
         # Register the results
         for country in self._countries:
             new_units = [
@@ -207,6 +398,34 @@ class PolicyMeasures(Term):
         self.model = model
         self.tau = mp_estimator.tau
 
+    def estimate_async(self, model, n_jobs=-1, executor=None, task_timeout=None, **kwargs):
+        """
+        Estimate the parameter values of phases in the registered countries asynchronously.
+
+        Args:
+            model (covsirphy.ModelBase): ODE model
+            n_jobs (int): the number of parallel jobs or -1 (CPU count)
+            executor (concurrent.futures.Executor or None): thread-based executor or None (default thread pool)
+            task_timeout (float or None): time-out of the task [sec] or None (un-limited)
+            kwargs: keyword arguments of PolicyMeasures.estimate()
+
+        Returns:
+            concurrent.futures.Future: future which resolves to dict[str, covsirphy.ParamTracker]
+                - key (str): country name
+                - value (covsirphy.ParamTracker): tracker of the main scenario of the country
+
+        Notes:
+            Future.cancel() stops estimation even while running. When timed out, TimeoutError will be raised.
+            The results will be registered only when estimation completed.
+            In asyncio, please use "await asyncio.wrap_future(future)".
+        """
+        def _estimate(cancel_event):
+            self.estimate(model=model, n_jobs=n_jobs, cancel_event=cancel_event, **kwargs)
+            return {
+                country: self.scenario_dict[country]._tracker(self.MAIN) for country in self._countries}
+
+        return submit_cancellable(_estimate, executor=executor, timeout=task_timeout)
+
     @deprecate(
         old="PolicyMeasures.param_history(param: str)",
         new="PolicyMeasures.history(param: str)",
@@ -301,3 +520,104 @@ class PolicyMeasures(Term):
         # Combine data
         return pd.merge(
             param_df, oxcgrt_df, how="inner", on=[self.COUNTRY, self.DATE])
+
+    def save(self, directory):
+        """
+        Save the scenarios of all countries.
+
+        Args:
+            directory (str or pathlib.Path): directory to save the files (will be created if not exist)
+
+        Returns:
+            pathlib.Path: filename of the manifest
+
+        Notes:
+            Scenarios will be saved with covsirphy.Scenario.save() in the sub-directories
+            and manifest.json (tau value, model name, selected countries and the sub-directories) will be created.
+            Scenarios which have not been created will not be created here and will be listed as "uncreated"
+            in the manifest.
+        """
+        dirpath = Path(directory)
+        dirpath.mkdir(parents=True, exist_ok=True)
+        subdir_dict, uncreated = {}, []
+        for country in self.scenario_dict.keys():
+            subdir = f"country_{len(subdir_dict)}"
+            if self.scenario_dict.save(country, dirpath.joinpath(subdir)):
+                subdir_dict[country] = subdir
+            else:
+                uncreated.append(country)
+        uncreated.extend(self._unregistered)
+        manifest_dict = {
+            "version": __version__,
+            self.TAU: self.tau,
+            self.ODE: None if self.model is None else self.model.NAME,
+            "countries": self._countries,
+            "scenarios": subdir_dict,
+            "uncreated": uncreated,
+        }
+        filepath = dirpath.joinpath("manifest.json")
+        filepath.write_text(json.dumps(manifest_dict, indent=4, ensure_ascii=False))
+        return filepath
+
+    @classmethod
+    def load(cls, directory, jhu_data=None, population_data=None, oxcgrt_data=None, countries=None,
+             max_scenarios=None):
+        """
+        Load the scenarios saved with PolicyMeasures.save().
+
+        Args:
+            directory (str or pathlib.Path): directory of the saved files
+            jhu_data (covsirphy.JHUData or None): object of records, if necessary
+            population_data (covsirphy.PopulationData or None): PopulationData object, if necessary
+            oxcgrt_data (covsirphy.OxCGRTData or None): OxCGRTData object, if necessary
+            countries (list[str] or None): countries to load or None (all saved countries)
+            max_scenarios (int or None): the maximum number of scenarios kept in memory or None (un-limited)
+
+        Raises:
+            KeyError: some of @countries were not saved
+
+        Returns:
+            covsirphy.PolicyMeasures: the loaded scenarios
+
+        Notes:
+            Scenario of each country will be loaded when accessed for the first time.
+            @jhu_data, @population_data and @oxcgrt_data are necessary for PolicyMeasures.estimate() and .track().
+            Scenarios which had not been created when saved will be created with @jhu_data and @population_data
+            when accessed. If they are not applied, the countries will not be registered
+            but will be kept as "uncreated" with PolicyMeasures.save().
+        """
+        dirpath = Path(directory)
+        manifest_dict = json.loads(dirpath.joinpath("manifest.json").read_text())
+        subdir_dict = manifest_dict["scenarios"]
+        uncreated = manifest_dict.get("uncreated", [])
+        if countries is not None:
+            cls.ensure_list(countries, candidates=[*subdir_dict.keys(), *uncreated], name="countries")
+            subdir_dict = {country: subdir for (country, subdir) in subdir_dict.items() if country in countries}
+            uncreated = [country for country in uncreated if country in countries]
+        policy = cls.__new__(cls)
+        policy.jhu_data = None if jhu_data is None else cls.ensure_instance(jhu_data, JHUData, name="jhu_data")
+        policy.population_data = None if population_data is None else cls.ensure_instance(
+            population_data, PopulationData, name="population_data")
+        policy.oxcgrt_data = None if oxcgrt_data is None else cls.ensure_instance(
+            oxcgrt_data, OxCGRTData, name="oxcgrt_data")
+        policy.tau = manifest_dict[cls.TAU]
+        model_name = manifest_dict[cls.ODE]
+        policy.model = None if model_name is None else PhaseUnit._find_model(model_name)
+        max_scenarios = cls.ensure_natural_int(max_scenarios, name="max_scenarios", none_ok=True)
+        dir_dict = {country: dirpath.joinpath(subdir) for (country, subdir) in subdir_dict.items()}
+        loader_dict = {
+            country: functools.partial(Scenario.load, directory, jhu_data=policy.jhu_data)
+            for (country, directory) in dir_dict.items()
+        }
+        if policy.jhu_data is not None and policy.population_data is not None:
+            loader_dict.update(
+                {
+                    country: functools.partial(
+                        Scenario, policy.jhu_data, policy.population_data, country=country, tau=policy.tau)
+                    for country in uncreated
+                }
+            )
+        policy.scenario_dict = _LazyScenarioDict(loader_dict, max_size=max_scenarios, dir_dict=dir_dict)
+        policy._countries = [country for country in manifest_dict["countries"] if country in loader_dict]
+        policy._unregistered = [country for country in uncreated if country not in loader_dict]
+        return policy
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+import warnings
+import pandas as pd
+import covsirphy as cs
+
+
+def main():
+    warnings.simplefilter("error")
+    # Create output directory in example directory
+    code_path = Path(__file__)
+    data_dir = code_path.parent.with_name("data").joinpath("japan")
+    output_dir = code_path.with_name("output").joinpath(code_path.stem)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    # S-R data of the prefectures in Japan
+    sr_dict = load_sr(data_dir)
+    # Settings of change point detection: (algo, cost, jump)
+    settings = [
+        ("Pelt", "rbf", 1),
+        ("KernelCPD", "rbf", 1),
+        ("KernelCPD", "l2", 1),
+        ("Pelt", "rbf", 5),
+        ("Pelt", "l2", 1),
+        ("Pelt", "l1", 1),
+        ("Pelt", "linear", 1),
+        ("Binseg", "l2", 1),
+        ("BottomUp", "l2", 1),
+        ("Window", "l2", 1),
+    ]
+    baseline_dict = {}
+    records = []
+    for (algo, cost, jump) in settings:
+        stopwatch = cs.StopWatch()
+        result_dict = {
+            area: cs.ChangeFinder(sr_df, algo=algo, cost=cost, jump=jump).run().date_range()[0][1:]
+            for (area, sr_df) in sr_dict.items()
+        }
+        runtime = stopwatch.stop()
+        baseline_dict = baseline_dict or result_dict
+        records.append({
+            "Algorithm": algo, "Cost": cost, "Jump": jump, "Runtime [sec]": runtime,
+            "Exact match [%]": sum(result_dict[area] == baseline_dict[area] for area in sr_dict) / len(sr_dict) * 100,
+            "F1 score (3 days)": f1_score(baseline_dict, result_dict, margin=3),
+        })
+    df = pd.DataFrame(records)
+    print(df.to_string(index=False))
+    df.to_csv(output_dir.joinpath("benchmark.csv"), index=False)
+
+
+def load_sr(data_dir):
+    """
+    Load S-R data of the prefectures in Japan with the datasets in data/japan directory.
+
+    Args:
+        data_dir (pathlib.Path): directory of the datasets
+
+    Returns:
+        dict[str, pandas.DataFrame]: S-R data (index: Date, columns: Recovered and Susceptible) of the prefectures
+    """
+    df = pd.read_csv(data_dir.joinpath("covid_jpn_prefecture.csv"), parse_dates=["Date"])
+    meta_df = pd.read_csv(data_dir.joinpath("covid_jpn_metadata.csv"))
+    meta_df = meta_df.loc[(meta_df["Category"] == "Population") & (meta_df["Item"] == "Total")]
+    # Population values were registered in thousands
+    population_dict = (meta_df.set_index("Prefecture")["Value"].astype(int) * 1000).to_dict()
+    sr_dict = {}
+    for (pref, pref_df) in df.groupby("Prefecture"):
+        pref_df = pref_df.set_index("Date").sort_index()
+        sr_df = pd.DataFrame(
+            {
+                cs.Term.R: pref_df["Discharged"],
+                cs.Term.S: population_dict[pref] - pref_df["Positive"],
+            }
+        ).dropna().astype(int)
+        sr_df = sr_df.loc[sr_df[cs.Term.R] > 0]
+        if len(sr_df) >= 30:
+            sr_df.index.name = cs.Term.DATE
+            sr_dict[pref] = sr_df
+    return sr_dict
+
+
+def f1_score(baseline_dict, result_dict, margin):
+    """
+    Calculate F1 score of the change dates, regarding the dates in @margin days as matched.
+
+    Args:
+        baseline_dict (dict[str, list[str]]): baseline change dates of the areas
+        result_dict (dict[str, list[str]]): change dates of the areas to evaluate
+        margin (int): margin [days]
+
+    Returns:
+        float: F1 score
+    """
+    tp, n_baseline, n_result = 0, 0, 0
+    for (area, baseline) in baseline_dict.items():
+        base_dates = [pd.to_datetime(date, format=cs.Term.DATE_FORMAT) for date in baseline]
+        dates = [pd.to_datetime(date, format=cs.Term.DATE_FORMAT) for date in result_dict[area]]
+        tp += sum(any(abs((date - base).days) <= margin for date in dates) for base in base_dates)
+        n_baseline += len(base_dates)
+        n_result += len(dates)
+    precision = tp / n_result if n_result else 1.0
+    recall = tp / n_baseline if n_baseline else 1.0
+    return 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+import warnings
+import pandas as pd
+import covsirphy as cs
+
+
+def main():
+    warnings.simplefilter("error")
+    # Create output directory in example directory
+    code_path = Path(__file__)
+    output_dir = code_path.with_name("output").joinpath(code_path.stem)
+    output_dir.mkdir(exist_ok=True, parents=True)
+    # Setting
+    model = cs.SIRF
+    n_jobs = 4
+    countries = [f"{model.NAME}_{i}" for i in range(8)]
+    # Theoretical data
+    example_data = cs.ExampleData(tau=1440, start_date="01Jan2020")
+    population_data = cs.PopulationData(filename=None)
+    population = model.EXAMPLE["population"]
+    for country in countries:
+        example_data.add(model, step_n=90, country=country)
+        population_data.update(population, country=country)
+    # Compare the backends of parameter estimation
+    backends = {
+        "Serial": lambda: None,
+        "Process": lambda: ProcessPoolExecutor(max_workers=n_jobs),
+        "Thread": lambda: ThreadPoolExecutor(max_workers=n_jobs),
+    }
+    records = []
+    for (name, executor_f) in backends.items():
+        units = create_units(example_data, population_data, countries)
+        estimator = cs.MPEstimator(
+            model, jhu_data=example_data, population_data=population_data, tau=1440)
+        estimator.add(units)
+        executor = executor_f()
+        stopwatch = cs.StopWatch()
+        if executor is None:
+            estimator.run(n_jobs=1, timeout=10)
+        else:
+            with executor:
+                estimator.run(executor=executor, timeout=10)
+        records.append({"Backend": name, "Phases": len(units), "Runtime [sec]": stopwatch.stop()})
+    df = pd.DataFrame(records)
+    print(df)
+    df.to_csv(output_dir.joinpath("benchmark.csv"), index=False)
+
+
+def create_units(example_data, population_data, countries):
+    """
+    Create phase units of the countries.
+
+    Args:
+        example_data (covsirphy.ExampleData): theoretical data
+        population_data (covsirphy.PopulationData): population values
+        countries (list[str]): names of the countries
+
+    Returns:
+        list[covsirphy.PhaseUnit]: phase units
+    """
+    units = []
+    for country in countries:
+        snl = cs.Scenario(example_data, population_data, country=country, auto_complement=False)
+        snl.add()
+        units.append(snl["Main"].unit("last").del_id().set_id(country=country))
+    return units
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+from covsirphy import Backtester, ExampleData, PopulationData, Scenario, SIRF
+
+
+class TestBacktester(object):
+    def test_backtest(self):
+        example_data = ExampleData(tau=1440, start_date="01Jan2020")
+        population_data = PopulationData(filename=None)
+        for (step_n, rho) in zip([30, 40], [0.2, 0.1]):
+            param_dict = {**SIRF.EXAMPLE["param_dict"], "rho": rho}
+            example_data.add(SIRF, step_n=step_n, country="Theoretical", param_dict=param_dict)
+        population_data.update(SIRF.EXAMPLE["population"], country="Theoretical")
+        snl = Scenario(example_data, population_data, country="Theoretical", tau=1440, auto_complement=False)
+        with pytest.warns(UserWarning):
+            df = snl.backtest(
+                SIRF, origins=["10Feb2020", "05Jan2020"], horizons=[7, 60], n_jobs=1, timeout=1, timeout_iteration=1)
+        assert df.columns.tolist() == ["Origin", "Horizon", "RMSLE"]
+        assert df["Origin"].unique().tolist() == ["10Feb2020"]
+        assert df.loc[df["Horizon"] == 7, "RMSLE"].notna().all()
+        assert df.loc[df["Horizon"] == 60, "RMSLE"].isna().all()
+        assert not snl.summary().size
+        backtester = Backtester(snl.record_df, population=snl.population, tau=1440)
+        with pytest.raises(ValueError):
+            backtester.run(SIRF, origins=["01Jan2021"], horizons=[7])
+        with pytest.raises(ValueError):
+            backtester.run(SIRF, origins=["10Feb2020"], horizons=[7], metrics="unknown")
@@ -0,0 +1,33 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import pytest
+from covsirphy.util.cancellable import submit_cancellable
+
+
+class TestSubmitCancellable(object):
+    def test_result(self):
+        future = submit_cancellable(lambda event: 1 + 1)
+        assert future.result(timeout=10) == 2
+
+    def test_cancel(self):
+        started, stopped = threading.Event(), threading.Event()
+
+        def _task(event):
+            started.set()
+            event.wait(10)
+            stopped.set()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = submit_cancellable(_task, executor=executor)
+            assert started.wait(10)
+            assert future.cancel()
+            assert future.cancelled()
+            assert stopped.wait(10)
+
+    def test_timeout(self):
+        future = submit_cancellable(lambda event: event.wait(10), timeout=0.1)
+        with pytest.raises(TimeoutError):
+            future.result(timeout=10)
@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import numpy as np
+import pandas as pd
 import pytest
+from scipy.optimize import curve_fit
 import warnings
 from covsirphy import ChangeFinder, Trend, Term
 
@@ -29,6 +32,101 @@ class TestChangeFinder(object):
             rmsle = Trend(sr_df=phase_df).rmsle()
             assert rmsle < max_rmsle
 
+    @pytest.mark.parametrize("country", ["Japan"])
+    @pytest.mark.parametrize(
+        "algo,cost",
+        [("KernelCPD", "rbf"), ("KernelCPD", "l2"), ("Pelt", "l2"), ("Binseg", "l1"), ("BottomUp", "linear"), ("Window", "l2")]
+    )
+    def test_algorithm(self, jhu_data, population_data, country, algo, cost):
+        population = population_data.value(country)
+        sr_df = jhu_data.to_sr(country=country, population=population)
+        change_finder = ChangeFinder(sr_df, algo=algo, cost=cost)
+        change_finder.run()
+        start_dates, end_dates = change_finder.date_range()
+        assert start_dates[0] == sr_df.index.min().strftime(Term.DATE_FORMAT)
+        assert end_dates[-1] == sr_df.index.max().strftime(Term.DATE_FORMAT)
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_algorithm_error(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        sr_df = jhu_data.to_sr(country=country, population=population)
+        with pytest.raises(KeyError):
+            ChangeFinder(sr_df, algo="Dynp")
+        with pytest.raises(KeyError):
+            ChangeFinder(sr_df, cost="ar")
+        with pytest.raises(ValueError):
+            ChangeFinder(sr_df, algo="KernelCPD", cost="linear")
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_update(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        sr_df = jhu_data.to_sr(country=country, population=population)
+        change_finder = ChangeFinder(sr_df.iloc[:60])
+        change_finder.run()
+        previous_dates = change_finder.date_range()[0][1:]
+        for length in range(61, len(sr_df) + 1, 7):
+            change_finder.update(sr_df.iloc[:length])
+        change_finder.update(sr_df)
+        assert change_finder.dates == [date_obj.strftime(Term.DATE_FORMAT) for date_obj in sr_df.index]
+        start_dates, end_dates = change_finder.date_range()
+        assert start_dates[1:len(previous_dates) + 1] == previous_dates
+        assert end_dates[-1] == sr_df.index.max().strftime(Term.DATE_FORMAT)
+        with pytest.raises(ValueError):
+            change_finder.update(sr_df.iloc[1:])
+
+    def test_update_break(self, break_day=90):
+        # S-R trend with a known break: log10(S) decreases faster with R from the break day
+        dates = pd.date_range("01Mar2020", periods=150)
+        r_values = np.arange(1, 151) * 100
+        slope_values = np.where(np.arange(150) < break_day, 1e-7, 1e-5)
+        log_s_values = 8 - np.cumsum(slope_values * 100)
+        sr_df = pd.DataFrame(
+            {Term.S: np.round(10 ** log_s_values).astype(np.int64), Term.R: r_values},
+            index=pd.Index(dates, name=Term.DATE))
+        change_finder = ChangeFinder(sr_df.iloc[:60]).run()
+        previous_dates = change_finder.date_range()[0]
+        # No change points will be added while the latest records fit the curve of the last phase
+        for length in range(61, break_day + 1):
+            change_finder.update(sr_df.iloc[:length])
+        assert change_finder.date_range()[0] == previous_dates
+        # Change point will be found around the break
+        for length in range(break_day + 1, len(sr_df) + 1):
+            change_finder.update(sr_df.iloc[:length])
+        start_dates = change_finder.date_range()[0]
+        assert start_dates[:len(previous_dates)] == previous_dates
+        break_date = dates[break_day]
+        assert any(
+            abs((Term.date_obj(date) - break_date).days) <= change_finder.min_size
+            for date in start_dates[len(previous_dates):])
+
+    def test_run_many(self, jhu_data, population_data):
+        countries = ["Italy", "Japan", "Greece"]
+        sr_dict = {
+            country: jhu_data.to_sr(country=country, population=population_data.value(country))
+            for country in countries}
+        sr_dict["Short"] = sr_dict["Japan"].iloc[:5]
+        change_dict, error_dict = ChangeFinder.run_many(sr_dict, n_jobs=2)
+        assert list(change_dict.keys()) == countries
+        assert list(error_dict.keys()) == ["Short"]
+        for country in countries:
+            change_finder = ChangeFinder(sr_dict[country]).run()
+            assert change_dict[country] == change_finder.date_range()[0][1:]
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    @pytest.mark.parametrize("algo,cost", [("Pelt", "rbf"), ("Pelt", "l2"), ("Binseg", "l1")])
+    def test_sweep(self, jhu_data, population_data, country, algo, cost):
+        population = population_data.value(country)
+        sr_df = jhu_data.to_sr(country=country, population=population)
+        change_finder = ChangeFinder(sr_df, algo=algo, cost=cost)
+        df = change_finder.sweep(pens=[0.3, 1.0], min_sizes=[5, 7])
+        assert df.columns.tolist() == ["pen", "min_size", "Phases", "Change_dates", Term.RMSLE]
+        assert len(df) == 4
+        for record in df.itertuples():
+            finder = ChangeFinder(sr_df, min_size=record.min_size, algo=algo, cost=cost, pen=record.pen)
+            assert finder.run().date_range()[0][1:] == record.Change_dates
+        with pytest.raises(ValueError):
+            change_finder.sweep(pens=[0.5], min_sizes=[2])
+
     @pytest.mark.parametrize("country", ["Italy"])
     def test_show(self, jhu_data, population_data, country):
         warnings.simplefilter("ignore", category=DeprecationWarning)
@@ -81,3 +179,31 @@ class TestTrend(object):
             start_date="25Mar2020", end_date="26Mar2020")
         with pytest.raises(ValueError):
             Trend(sr_df).run()
+
+    @pytest.mark.parametrize("country", ["Italy"])
+    def test_run_many(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        sr_dfs = [
+            jhu_data.to_sr(country=country, population=population, start_date=start_date, end_date=end_date)
+            for (start_date, end_date) in [("25Mar2020", "02Apr2020"), ("03Apr2020", "20Apr2020")]
+        ]
+        trends = Trend.run_many(sr_dfs)
+        assert len(trends) == 2
+        for (sr_df, trend) in zip(sr_dfs, trends):
+            assert trend.rmsle() == pytest.approx(self._reference_rmsle(sr_df), rel=1e-2)
+
+    @staticmethod
+    def _reference_rmsle(sr_df):
+        # RMSLE score of the best solution with scipy.optimize.curve_fit()
+        x = sr_df[Term.R].to_numpy(dtype=np.float64)
+        y = np.log(sr_df[Term.S].to_numpy(dtype=np.float64))
+        actual = sr_df[Term.S].to_numpy(dtype=np.float64)
+        scores = {}
+        for (name, f) in [(Trend.L, Term.linear), (Trend.N, Term.negative_exp)]:
+            param, _ = curve_fit(f, x, y, p0=(y.max(), np.diff(y)[0] / y.max()), maxfev=5000)
+            predicted = np.trunc(np.exp(f(x, *param)))
+            selected = (actual > 0) & (predicted > 0)
+            scores[name] = np.abs(np.log10(actual[selected] + 1) - np.log10(predicted[selected] + 1)).sum()
+        if 0 < scores[Trend.L] < scores[Trend.N] or not scores[Trend.N]:
+            return scores[Trend.L]
+        return scores[Trend.N]
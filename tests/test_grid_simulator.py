@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+from covsirphy import GridSimulator, ODESimulator, Term
+from covsirphy import SIR, SIRD, SIRF, SIRFV, SEWIRF
+
+
+class TestGridSimulator(object):
+    @pytest.mark.parametrize("model", [SIR, SIRD, SIRF, SIRFV, SEWIRF])
+    def test_run(self, model):
+        population = model.EXAMPLE["population"]
+        param_dict = model.EXAMPLE["param_dict"]
+        y0_dict = model.EXAMPLE["y0_dict"]
+        simulator = GridSimulator(model, population, 720, "01Jan2020", y0_dict)
+        rho = "rho" if "rho" in param_dict else "rho1"
+        grid_dict = {param: [value] for (param, value) in param_dict.items()}
+        grid_dict[rho] = [param_dict[rho] * ratio for ratio in (0.5, 1, 1.5)]
+        param_df = simulator.grid(**grid_dict)
+        df = simulator.run(param_df, end_date="30Jun2020")
+        assert len(df) == 3
+        assert df.columns.tolist() == [
+            *model.PARAMETERS, "max(Infected)", "argmax(Infected)",
+            "Confirmed on 30Jun2020", "Infected on 30Jun2020", "Fatal on 30Jun2020"]
+        assert df["max(Infected)"].is_monotonic_increasing
+        # Compare with simulation of one parameter set
+        ode_simulator = ODESimulator()
+        ode_simulator.add(
+            model, step_n=Term.steps("01Jan2020", "30Jun2020", 720), population=population,
+            param_dict=param_dict, y0_dict=y0_dict)
+        sim_df = model.restore(ode_simulator.dim(tau=720, start_date="01Jan2020"))
+        sim_df = sim_df.set_index(Term.DATE).resample("D").first()
+        expected = [sim_df[Term.CI].max(), sim_df.loc["30Jun2020", Term.C], sim_df.loc["30Jun2020", Term.F]]
+        row = df.iloc[1]
+        result = [row["max(Infected)"], row["Confirmed on 30Jun2020"], row["Fatal on 30Jun2020"]]
+        assert np.allclose(result, expected, rtol=0.01)
+        assert row["argmax(Infected)"] == sim_df[Term.CI].idxmax().strftime(Term.DATE_FORMAT)
+
+    def test_error(self):
+        with pytest.raises(KeyError):
+            GridSimulator(SIRF, 1000, 1440, "01Jan2020", {"Exposed": 0})
+        simulator = GridSimulator(SIRF, 1000, 1440, "01Jan2020", SIRF.EXAMPLE["y0_dict"])
+        with pytest.raises(KeyError):
+            simulator.run(simulator.grid(rho=[0.1], sigma=[0.1]), end_date="31Jan2020")
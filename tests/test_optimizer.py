@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+import textwrap
+import warnings
+import optuna
+from covsirphy.util.optimize import _quiet_optuna
+
+
+class TestOptimizer(object):
+    def test_import(self):
+        # Dependencies of covsirphy may change warning filters when imported
+        listing = textwrap.dedent(
+            """
+            import sys
+            before = set(sys.modules)
+            import covsirphy
+            print("\\n".join(
+                name for name in sys.modules if name not in before and name.split(".")[0] != "covsirphy"))
+            """
+        )
+        modules = subprocess.run(
+            [sys.executable, "-c", listing], check=True, capture_output=True, text=True).stdout.split()
+        checker = textwrap.dedent(
+            """
+            import importlib
+            import sys
+            import warnings
+            import optuna
+            for name in sys.argv[1:]:
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    pass
+            filters = list(warnings.filters)
+            handlers = list(optuna.logging._get_library_root_logger().handlers)
+            import covsirphy
+            assert warnings.filters == filters, [f for f in warnings.filters if f not in filters]
+            assert optuna.logging._get_library_root_logger().handlers == handlers
+            """
+        )
+        subprocess.run([sys.executable, "-c", checker, *modules], check=True)
+
+    def test_quiet_optuna(self):
+        verbosity = optuna.logging.get_verbosity()
+        filters = list(warnings.filters)
+        with _quiet_optuna():
+            with _quiet_optuna():
+                assert optuna.logging.get_verbosity() == optuna.logging.WARNING
+            assert optuna.logging.get_verbosity() == optuna.logging.WARNING
+        assert optuna.logging.get_verbosity() == verbosity
+        assert warnings.filters == filters
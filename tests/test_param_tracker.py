@@ -4,6 +4,7 @@
 
 from covsirphy.phase.phase_unit import PhaseUnit
 import warnings
+import pandas as pd
 import pytest
 from covsirphy import SIRF, PhaseSeries, ParamTracker
 
@@ -105,7 +106,24 @@ class TestParamTracker(object):
             tracker.estimate(SIRF, timeout=5, timeout_iteration=5)
 
     def test_simulate(self, tracker):
-        tracker.simulate()
+        sim_df = tracker.simulate()
+        # Memoized until the phases are changed
+        version = tracker.version
+        sim_df.iloc[0, 1] = -1
+        assert tracker.simulate().iloc[0, 1] != -1
+        assert tracker.version == version
+        tracker.disable(phases=["0th"])
+        assert tracker.version != version
+        assert len(tracker.simulate()) < len(sim_df)
+        tracker.enable(phases=["0th"])
+        assert len(tracker.simulate()) == len(sim_df)
+        # Copies have the same version until changed
+        copied = tracker.copy()
+        assert copied.version == tracker.version
+        pd.testing.assert_frame_equal(copied.simulate(), tracker.simulate())
+        copied.disable(phases=["0th"])
+        assert copied.version != tracker.version
+        assert len(copied.simulate()) < len(tracker.simulate())
 
     def test_score(self, tracker):
         # Scores of all phases
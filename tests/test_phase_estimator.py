@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor
+import warnings
+import pandas as pd
+import pytest
+from covsirphy import MPEstimator, PhaseUnit, SIRF, Term, EstimationCheckpoint
+
+
+class TestMPEstimator(object):
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_records(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        unit = PhaseUnit("01May2020", "31May2020", population)
+        unit.set_id(country=country)
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        record_df = estimator._records(unit)
+        assert set(record_df.columns) == set(Term.NLOC_COLUMNS)
+        assert record_df[Term.DATE].min() == Term.date_obj(unit.start_date)
+        assert record_df[Term.DATE].max() == Term.date_obj(unit.end_date)
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_run(self, jhu_data, population_data, country, n_jobs):
+        warnings.simplefilter("ignore", category=UserWarning)
+        population = population_data.value(country)
+        units = [
+            PhaseUnit("01May2020", "31May2020", population).set_id(country=country),
+            PhaseUnit("01Jun2020", "30Jun2020", population).set_id(country=country),
+        ]
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=None)
+        estimator.add(units)
+        results = estimator.run(n_jobs=n_jobs, timeout=1, timeout_iteration=1)
+        assert len(results) == len(units)
+        assert estimator.tau is not None
+        assert all(unit.tau == estimator.tau for unit in results)
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_cost(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        short_unit = PhaseUnit("01May2020", "10May2020", population)
+        long_unit = PhaseUnit("11May2020", "30Jun2020", population)
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        assert estimator._cost(long_unit, tau=1440) > estimator._cost(short_unit, tau=1440)
+        assert estimator._cost(short_unit, tau=360) > estimator._cost(short_unit, tau=1440)
+
+    def test_runtime_cache(self):
+        record_df = pd.DataFrame(
+            {
+                Term.DATE: pd.date_range("01May2020", "10May2020"),
+                Term.C: 10, Term.CI: 5, Term.F: 1, Term.R: 4,
+            }
+        )
+        estimator = MPEstimator(SIRF, record_df=record_df, tau=1440)
+        unit = PhaseUnit("01May2020", "10May2020", 1000).set_ode(tau=1440)
+        heuristic = estimator._cost(unit, tau=1440)
+        unit._runtime = 100.0
+        estimator._record_runtime([unit])
+        assert estimator._cost(unit, tau=1440) == 100.0
+        # Runtime will not be shared with the other instances
+        assert MPEstimator(SIRF, record_df=record_df, tau=1440)._cost(unit, tau=1440) == heuristic
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_split_batch(self, jhu_data, population_data, country):
+        population = population_data.value(country)
+        jobs = [
+            (i, (PhaseUnit(start_date, end_date, population).set_id(country=country), None))
+            for (i, (start_date, end_date)) in enumerate(
+                [("01May2020", "31May2020"), ("01Jun2020", "10Jun2020"), ("11Jun2020", "20Jun2020")])
+        ]
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        batches = estimator._split_batch(jobs, n_batches=2)
+        assert [[index for (index, _) in batch] for batch in batches] == [[0], [1, 2]]
+        assert len(estimator._split_batch(jobs, n_batches=4)) == len(jobs)
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_checkpoint(self, jhu_data, population_data, country, tmp_path):
+        warnings.simplefilter("ignore", category=UserWarning)
+        filename = tmp_path / "checkpoint.jsonl"
+        population = population_data.value(country)
+
+        def create_units():
+            return [
+                PhaseUnit("01May2020", "31May2020", population).set_id(country=country),
+                PhaseUnit("01Jun2020", "30Jun2020", population).set_id(country=country),
+            ]
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        estimator.add(create_units())
+        results = estimator.run(n_jobs=1, checkpoint=filename, timeout=1, timeout_iteration=1)
+        assert len(EstimationCheckpoint(filename)) == len(results)
+        # Rerun: restored from the checkpoint
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        estimator.add(create_units())
+        restored = estimator.run(n_jobs=1, checkpoint=filename, timeout=1, timeout_iteration=1)
+        assert [unit.to_dict() for unit in restored] == [unit.to_dict() for unit in results]
+        assert all(unit.estimator is None for unit in restored)
+        # Results with different configuration will not be restored
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        estimator.add(create_units())
+        estimator.run(n_jobs=1, checkpoint=filename, timeout=2, timeout_iteration=1)
+        assert len(EstimationCheckpoint(filename)) == len(results) * 2
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_errors(self, jhu_data, population_data, country):
+        warnings.simplefilter("ignore", category=UserWarning)
+        population = population_data.value(country)
+        units = [
+            PhaseUnit("01May2020", "31May2020", population).set_id(country=country),
+            PhaseUnit("01Jun2020", "30Jun2020", population).set_id(country="Unknown"),
+        ]
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        estimator.add(units)
+        with pytest.raises(ValueError):
+            estimator.run(n_jobs=1, errors="none")
+        results = estimator.run(n_jobs=1, errors="skip", timeout=1, timeout_iteration=1)
+        assert len(results) == 1
+
+    @pytest.mark.parametrize("country", ["Japan"])
+    @pytest.mark.parametrize("locality", [True, False])
+    def test_executor(self, jhu_data, population_data, country, locality):
+        warnings.simplefilter("ignore", category=UserWarning)
+        population = population_data.value(country)
+        units = [
+            PhaseUnit("01May2020", "31May2020", population).set_id(country=country),
+            PhaseUnit("01Jun2020", "30Jun2020", population).set_id(country=country),
+        ]
+        estimator = MPEstimator(
+            SIRF, jhu_data=jhu_data, population_data=population_data, tau=1440)
+        estimator.add(units)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = estimator.run(
+                executor=executor, locality=locality, timeout=1, timeout_iteration=1)
+        assert [str(unit) for unit in results] == [str(unit) for unit in units]
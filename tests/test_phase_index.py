@@ -0,0 +1,40 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+from covsirphy import PhaseIndex, PhaseSeries, PhaseUnit
+
+
+class TestPhaseIndex(object):
+    def test_query(self):
+        units = [
+            PhaseUnit("01Jan2020", "31Jan2020", 1000),
+            PhaseUnit("01Feb2020", "29Feb2020", 1000),
+            PhaseUnit("01Apr2020", "30Apr2020", 1000),
+        ]
+        index = PhaseIndex(units)
+        assert len(index) == 3
+        assert index.find("01Jan2020") == 0
+        assert index.find("29Feb2020") == 1
+        assert index.find("15Mar2020") is None
+        assert index.find("01May2020") is None
+        assert index.between("20Jan2020", "01Feb2020") == [0, 1]
+        assert index.between("01Mar2020", "31Mar2020") == []
+        assert index.between(start_date="01Feb2020") == [1, 2]
+        dates = ["31Dec2019", "01Feb2020", "15Mar2020", "30Apr2020"]
+        assert index.locate(dates).tolist() == [-1, 1, -1, 2]
+        date_index = pd.DatetimeIndex(pd.to_datetime(dates, format=PhaseIndex.DATE_FORMAT))
+        assert index.locate(date_index).tolist() == [-1, 1, -1, 2]
+        assert PhaseIndex([]).locate(dates).tolist() == [-1] * 4
+        with pytest.raises(ValueError):
+            PhaseIndex(units[::-1])
+
+    def test_series(self):
+        series = PhaseSeries("01Jan2020", "30Apr2020", 1000)
+        series.add(end_date="31Jan2020")
+        assert series.phase_index.find("01Feb2020") is None
+        series.add(end_date="29Feb2020")
+        assert series.phase_index.find("01Feb2020") == 1
+        series.delete("last")
+        assert series.phase_index.find("01Feb2020") is None
@@ -18,6 +18,26 @@ class TestPhaseSeries(object):
         assert not series
         assert series.summary().empty
 
+    def test_copy(self):
+        series = PhaseSeries("01Apr2020", "01Aug2020", 1000)
+        series.add(end_date="22Apr2020").add()
+        copied = series.copy()
+        assert copied.unit("0th") is series.unit("0th")
+        assert copied.version == series.version
+        # Copy-on-write
+        copied.disable("0th")
+        assert copied.unit("0th") is not series.unit("0th")
+        assert bool(series.unit("0th"))
+        # Versions
+        assert copied.version != series.version
+        version = series.version
+        series.enable("0th")
+        assert series.version != version
+        copied.add(days=10)
+        assert len(copied) == 2
+        assert len(series) == 2
+        assert len(list(copied)) == 3
+
     @pytest.mark.parametrize("country", ["Japan"])
     def test_add_phase(self, jhu_data, population_data, country):
         # Setting
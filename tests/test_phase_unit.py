@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from datetime import datetime
+import pandas as pd
 import pytest
 from covsirphy import PhaseUnit
 from covsirphy import Term, SIR, Estimator, UnExecutedError
@@ -27,6 +29,11 @@ class TestPhaseUnit(object):
         assert "15Jan2020" in unit
         assert "01Feb2020" in unit
         assert "01Mar2020" not in unit
+        # Dates as ordinals
+        assert unit.start_ordinal == datetime(2020, 1, 1).toordinal()
+        assert unit.end_ordinal - unit.start_ordinal == 31
+        assert Term.ordinal_date(unit.end_ordinal) == unit.end_date
+        assert Term.date_ordinal("02Feb2020") == unit.end_ordinal + 1
 
     def test_sort(self):
         unit1 = PhaseUnit("01Jan2020", "01Feb2020", 1000)
@@ -58,6 +65,35 @@ class TestPhaseUnit(object):
         unit.enable()
         assert bool(unit)
 
+    def test_copy(self):
+        unit = PhaseUnit("01Jan2020", "01Feb2020", 1000)
+        unit.set_ode(model=SIR, tau=1440, rho=0.2, sigma=0.075)
+        copied = unit.copy()
+        assert copied == unit
+        assert copied.to_dict() == unit.to_dict()
+        assert copied.estimator is unit.estimator
+        copied.set_ode(rho=0.1).set_id(phase="1st")
+        copied.disable()
+        assert unit.to_dict()["rho"] == 0.2
+        assert unit.id_dict is None
+        assert bool(unit)
+
+    def test_record(self):
+        unit = PhaseUnit("01Jan2020", "01Feb2020", 1000)
+        restored = PhaseUnit.from_record(unit.to_record())
+        assert restored.to_dict() == unit.to_dict()
+        unit.set_ode(model=SIR, tau=1440, rho=0.2, sigma=0.075).set_id(phase="1st")
+        unit.est_dict.update({Term.RMSLE: 0.1, Term.TRIALS: 10})
+        unit.disable()
+        restored = PhaseUnit.from_record(unit.to_record())
+        assert restored.to_dict() == unit.to_dict()
+        assert restored.id_dict == {"phase": "1st"}
+        assert not restored
+        record = unit.to_record()
+        record[Term.ODE] = "Unknown"
+        with pytest.raises(KeyError):
+            PhaseUnit.from_record(record)
+
     def test_definition_property(self):
         unit = PhaseUnit("01Jan2020", "01Feb2020", 1000)
         assert unit.start_date == "01Jan2020"
@@ -119,6 +155,26 @@ class TestPhaseUnit(object):
         assert set(cols).issubset(unit.to_dict())
         assert None not in unit.to_dict().values()
 
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_detach_estimator(self, jhu_data, population_data, country, tmp_path):
+        # Dataset
+        population = population_data.value(country)
+        record_df = jhu_data.subset(country, population=population)
+        # Parameter estimation
+        unit = PhaseUnit("27May2020", "27Jun2020", population)
+        unit.set_ode(model=SIR)
+        unit.estimate(record_df=record_df, timeout=10)
+        summary_dict = unit.to_dict()
+        # Detach the estimator
+        filename = tmp_path.joinpath("history.csv")
+        unit.detach_estimator(filename=filename)
+        assert unit.estimator is None
+        assert unit.record_df.empty
+        assert unit.to_dict() == summary_dict
+        assert unit.runtime > 0
+        assert len(pd.read_csv(filename)) == summary_dict[Term.TRIALS]
+        assert not hasattr(unit, "__dict__")
+
     @pytest.mark.parametrize("country", ["Japan"])
     def test_estimate_with_fixed(self, jhu_data, population_data, country):
         # Dataset
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
 import warnings
 import pandas as pd
 import pytest
-from covsirphy import PolicyMeasures
-from covsirphy import SIRF, Scenario
+from covsirphy import EstimationTelemetry, PolicyMeasures
+from covsirphy import SIR, SIRF, Scenario, Term
 
 
 class TestPolicyMeasures(object):
@@ -16,6 +19,8 @@ class TestPolicyMeasures(object):
             jhu_data, population_data, oxcgrt_data, tau=360)
         # List of countries
         assert isinstance(analyser.countries, list)
+        # Scenarios will be created when accessed
+        assert not analyser.scenario_dict.loaded()
         # Return Scenario class
         assert isinstance(analyser.scenario("Japan"), Scenario)
         with pytest.raises(KeyError):
@@ -61,6 +66,87 @@ class TestPolicyMeasures(object):
         with pytest.raises(TypeError):
             analyser.summary(countries="Poland")
 
+    def test_estimate_cancel(self, jhu_data, population_data, oxcgrt_data):
+        warnings.simplefilter("ignore", category=UserWarning)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360)
+        analyser.countries = ["Italy", "Japan"]
+        analyser.trend(min_len=1)
+        # Cancel after estimation of a phase started
+        started = threading.Event()
+        telemetry = EstimationTelemetry(
+            callbacks=[lambda event: event["event"] == EstimationTelemetry.UNIT_START and started.set()])
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = analyser.estimate_async(
+                SIRF, n_jobs=1, executor=executor, telemetry=telemetry, timeout=60, timeout_iteration=1)
+            assert started.wait(60)
+            assert future.cancel()
+        # The results will not be registered when cancelled
+        assert Term.ODE not in analyser.summary().columns
+        # Retry
+        analyser.estimate(SIRF, timeout=1, timeout_iteration=1)
+        assert (analyser.summary()[Term.ODE] == SIRF.NAME).all()
+
+    def test_estimate_another_model(self, jhu_data, population_data, oxcgrt_data):
+        warnings.simplefilter("ignore", category=UserWarning)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360)
+        analyser.countries = ["Japan"]
+        analyser.trend(min_len=1)
+        analyser.estimate(SIR, n_jobs=1, timeout=1, timeout_iteration=1)
+        summary_df = analyser.summary()
+        # Phases estimated with another model will not be skipped silently
+        with pytest.raises(ValueError, match="another model"):
+            analyser.estimate(SIRF, n_jobs=1, timeout=1, timeout_iteration=1)
+        assert analyser.model is SIR
+        pd.testing.assert_frame_equal(analyser.summary(), summary_df)
+        # Nothing will be changed when all phases have been estimated with the model
+        analyser.estimate(SIR, n_jobs=1, timeout=1, timeout_iteration=1)
+        assert analyser.tau == 360
+        pd.testing.assert_frame_equal(analyser.summary(), summary_df)
+
+    def test_estimate_shared_units(self, jhu_data, population_data, oxcgrt_data):
+        warnings.simplefilter("ignore", category=UserWarning)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360)
+        analyser.countries = ["Japan"]
+        analyser.trend(min_len=1)
+        # Scenario sharing the phase units with the main scenario
+        snl = analyser.scenario("Japan")
+        snl.clear(name="Clone", template="Main")
+        clone_df = snl.summary(name="Clone")
+        analyser.estimate(SIRF, n_jobs=1, timeout=1, timeout_iteration=1)
+        pd.testing.assert_frame_equal(snl.summary(name="Clone"), clone_df)
+        assert all(unit.id_dict is None and unit.model is None for unit in snl["Clone"])
+        assert (snl.summary(name="Main")[Term.ODE] == SIRF.NAME).all()
+
+    def test_max_scenarios(self, jhu_data, population_data, oxcgrt_data):
+        warnings.simplefilter("ignore", category=UserWarning)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360, max_scenarios=1)
+        analyser.countries = ["Italy", "Japan"]
+        analyser.scenario("Italy").trend(show_figure=False)
+        italy_df = analyser.scenario("Italy").summary()
+        analyser.scenario("Japan").trend(show_figure=False)
+        assert analyser.scenario_dict.loaded() == ["Japan"]
+        pd.testing.assert_frame_equal(analyser.scenario("Italy").summary(), italy_df)
+        assert analyser.scenario_dict.loaded() == ["Italy"]
+        with pytest.raises(ValueError):
+            PolicyMeasures(jhu_data, population_data, oxcgrt_data, max_scenarios=0)
+
+    def test_trend_parallel(self, jhu_data, population_data, oxcgrt_data):
+        warnings.simplefilter("ignore", category=UserWarning)
+        countries = ["Italy", "Japan", "Greece"]
+        serial = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360)
+        serial.countries = countries
+        serial.trend(min_len=1, n_jobs=1)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360, max_scenarios=1)
+        analyser.countries = countries
+        analyser.trend(min_len=1, n_jobs=2)
+        assert analyser.countries == serial.countries
+        pd.testing.assert_frame_equal(analyser.summary(), serial.summary(), check_like=True)
+        # Failed countries will be reported and un-registered with their phases unchanged
+        with pytest.warns(UserWarning, match="S-R trend analysis failed"):
+            analyser.trend(min_size=100_000)
+        assert not analyser.countries
+        pd.testing.assert_frame_equal(analyser.summary(countries=serial.countries), serial.summary(), check_like=True)
+
     def test_error(self, jhu_data, population_data, oxcgrt_data):
         warnings.simplefilter("ignore", category=UserWarning)
         warnings.simplefilter("error", category=RuntimeWarning)
@@ -70,3 +156,40 @@ class TestPolicyMeasures(object):
         # Register countries
         with pytest.raises(KeyError):
             analyser.countries = ["Moon"]
+
+    def test_save_load(self, jhu_data, population_data, oxcgrt_data, tmp_path):
+        warnings.simplefilter("ignore", category=UserWarning)
+        analyser = PolicyMeasures(jhu_data, population_data, oxcgrt_data, tau=360)
+        analyser.countries = ["Italy", "Japan"]
+        analyser.trend()
+        created = analyser.scenario_dict.loaded()
+        analyser.save(tmp_path)
+        assert analyser.scenario_dict.loaded() == created
+        manifest_dict = json.loads(tmp_path.joinpath("manifest.json").read_text())
+        assert set(manifest_dict["scenarios"]) == set(created)
+        assert not set(manifest_dict["uncreated"]) & set(created)
+        loaded = PolicyMeasures.load(tmp_path, countries=["Japan"])
+        assert loaded.countries == ["Japan"]
+        assert not loaded.scenario_dict.loaded()
+        pd.testing.assert_frame_equal(loaded.summary(), analyser.summary(countries=["Japan"]))
+        assert loaded.scenario_dict.loaded() == ["Japan"]
+        with pytest.raises(KeyError):
+            PolicyMeasures.load(tmp_path, countries=["Moon"])
+        uncreated = manifest_dict["uncreated"][0]
+        assert uncreated not in PolicyMeasures.load(tmp_path).scenario_dict
+        loaded = PolicyMeasures.load(tmp_path, jhu_data, population_data)
+        assert uncreated in loaded.scenario_dict
+        assert not loaded.scenario_dict.loaded()
+        # Files of another scenario will not remain when saved again
+        loaded = PolicyMeasures.load(tmp_path, countries=["Japan"])
+        stale = tmp_path.joinpath("copied", "country_0", "stale.txt")
+        stale.parent.mkdir(parents=True)
+        stale.write_text("")
+        loaded.save(tmp_path.joinpath("copied"))
+        assert not stale.exists()
+        loaded.save(tmp_path)
+        assert not loaded.scenario_dict.loaded()
+        for directory in (tmp_path, tmp_path.joinpath("copied")):
+            pd.testing.assert_frame_equal(
+                PolicyMeasures.load(directory).summary(), analyser.summary(countries=["Japan"]))
+        pd.testing.assert_frame_equal(loaded.summary(), analyser.summary(countries=["Japan"]))
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import os
+import pandas as pd
+import pytest
+from covsirphy import SharedRecordStore, Term
+from covsirphy.phase import record_store
+
+
+class TestSharedRecordStore(object):
+    @pytest.mark.parametrize("country", ["Japan"])
+    @pytest.mark.parametrize("memmap", [False, True])
+    def test_records(self, jhu_data, country, memmap, tmp_path):
+        df = jhu_data.cleaned()
+        df = df.loc[df[Term.COUNTRY] == country]
+        filename = tmp_path / "records.npy" if memmap else None
+        with SharedRecordStore.from_dataframe(df, filename=filename) as store:
+            key = (country, Term.UNKNOWN)
+            assert key in store
+            worker_store = SharedRecordStore.attach(store.handle())
+            record_df = worker_store.records(
+                key, start_date="01May2020", end_date="31May2020")
+            worker_store.close()
+        assert set(record_df.columns) == set(Term.NLOC_COLUMNS)
+        assert record_df[Term.DATE].min() == Term.date_obj("01May2020")
+        assert record_df[Term.DATE].max() == Term.date_obj("31May2020")
+        assert not (tmp_path / "records.npy").exists()
+
+    @pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="/proc/self/fd is not available")
+    def test_temporary_file(self, monkeypatch):
+        # Temporary memory-mapped file will be used with Python 3.7 or older
+        monkeypatch.setattr(record_store, "shared_memory", None)
+        record_df = pd.DataFrame(
+            {
+                Term.DATE: pd.date_range("01May2020", "03May2020"),
+                Term.C: [3, 4, 5], Term.CI: [2, 2, 3], Term.F: [0, 1, 1], Term.R: [1, 1, 1],
+            }
+        )
+        n_fds = len(os.listdir("/proc/self/fd"))
+        for _ in range(5):
+            with SharedRecordStore({"A": record_df}) as store:
+                filename = store.handle()["filename"]
+                assert store.records("A")[Term.C].tolist() == [3, 4, 5]
+            assert not os.path.exists(filename)
+        assert len(os.listdir("/proc/self/fd")) == n_fds
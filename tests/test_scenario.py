@@ -6,7 +6,7 @@ import warnings
 import pandas as pd
 import pytest
 from covsirphy import ScenarioNotFoundError
-from covsirphy import Scenario, DataHandler
+from covsirphy import Scenario, DataHandler, ExampleData, PopulationData
 from covsirphy import Term, PhaseSeries, SIR, SIRF
 
 
@@ -295,6 +295,24 @@ class TestScenario(object):
             "01May2020", model=SIRF, control="Main", target="Retrospective",
             timeout=1, timeout_iteration=1)
 
+    @pytest.mark.parametrize("country", ["Japan"])
+    def test_what_if(self, jhu_data, population_data, country):
+        snl = Scenario(jhu_data, population_data, country)
+        snl.first_date = "01Apr2020"
+        snl.last_date = "01Jun2020"
+        snl.trend(show_figure=False)
+        with pytest.raises(ValueError):
+            snl.what_if({"rho": [0.9]})
+        snl.estimate(SIRF, timeout=1, timeout_iteration=1)
+        df = snl.what_if({"rho": [0.5, 1.0], "sigma": [1.0, 1.2, 1.5]}, days=60, relative=True)
+        assert len(df) == 6
+        assert df.loc[3, "rho"] == pytest.approx(snl.get("rho"))
+        assert set(["max(Infected)", "argmax(Infected)", "Fatal on 31Jul2020"]).issubset(df.columns)
+        with pytest.raises(KeyError):
+            snl.what_if({"omega": [0.1]}, days=60)
+        with pytest.raises(ValueError):
+            snl.what_if({"rho": [0.1]}, date="01Jan2021", days=60)
+
     @pytest.mark.parametrize("country", ["Italy"])
     def test_score(self, jhu_data, population_data, country):
         snl = Scenario(jhu_data, population_data, country, tau=360)
@@ -313,3 +331,23 @@ class TestScenario(object):
         snl.score(past_days=60)
         with pytest.raises(ValueError):
             snl.score(phases=["1st"], past_days=60)
+
+    def test_save_load(self, tmp_path):
+        example_data = ExampleData(tau=1440, start_date="01Jan2020")
+        example_data.add(SIRF, step_n=60, country="Theoretical")
+        population_data = PopulationData(filename=None)
+        population_data.update(SIRF.EXAMPLE["population"], country="Theoretical")
+        snl = Scenario(example_data, population_data, country="Theoretical", tau=1440, auto_complement=False)
+        snl.add(end_date="31Jan2020").add()
+        snl.estimate(SIRF, n_jobs=1, timeout=1, timeout_iteration=1)
+        snl.add(name="Lockdown", days=30, rho=0.01)
+        snl.save(tmp_path)
+        loaded = Scenario.load(tmp_path)
+        assert loaded.area == snl.area
+        assert loaded.last_date == snl.last_date
+        pd.testing.assert_frame_equal(loaded.record_df, snl.record_df, check_dtype=False)
+        pd.testing.assert_frame_equal(loaded.summary(), snl.summary(), check_like=True)
+        pd.testing.assert_frame_equal(
+            loaded.simulate(name="Lockdown", show_figure=False), snl.simulate(name="Lockdown", show_figure=False))
+        with pytest.raises(IndexError):
+            loaded.estimate(SIRF)
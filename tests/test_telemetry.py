@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import json
+from covsirphy import EstimationTelemetry, JSONLinesSink, PrometheusSink, PhaseUnit, Term
+
+
+class TestEstimationTelemetry(object):
+    def test_events(self, tmp_path):
+        events = []
+        json_file, prom_file = tmp_path / "events.jsonl", tmp_path / "metrics.prom"
+        telemetry = EstimationTelemetry(
+            callbacks=[events.append, JSONLinesSink(json_file), PrometheusSink(prom_file)])
+        units = [
+            PhaseUnit("01May2020", "31May2020", 1000).set_id(country="Japan"),
+            PhaseUnit("01Jun2020", "30Jun2020", 1000).set_id(country="Italy"),
+        ]
+        queue = telemetry.start(n_units=len(units))
+        EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_START, units[0])
+        EstimationTelemetry.send(
+            queue, EstimationTelemetry.UNIT_FINISH, units[0],
+            **{Term.TRIALS: 10, Term.RUNTIME: 2.0, Term.RMSLE: 0.1, "trials_per_sec": 5.0})
+        EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_START, units[1])
+        EstimationTelemetry.send(queue, EstimationTelemetry.UNIT_FAIL, units[1], error="ValueError")
+        summary_dict = telemetry.stop()
+        assert summary_dict["finished"] == 1
+        assert summary_dict["failed"] == 1
+        assert [event["event"] for event in events] == [
+            "run_start", "unit_start", "unit_finish", "unit_start", "unit_fail", "run_finish"]
+        assert events[2]["queue_depth"] == 1
+        assert len(json_file.read_text().splitlines()) == len(events)
+        saved = json.loads(json_file.read_text().splitlines()[2])
+        assert saved[Term.RMSLE] == 0.1
+        metrics = prom_file.read_text()
+        assert "covsirphy_estimation_units_finished 1" in metrics
+        assert "covsirphy_estimation_units_failed 1" in metrics
+        assert 'covsirphy_estimation_best_rmsle{unit="Japan phase (01May2020 - 31May2020)"} 0.1' in metrics
@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+from covsirphy import WorkerPool
+
+
+def _square(x):
+    return x ** 2
+
+
+def _power(x, y):
+    return x ** y
+
+
+class TestWorkerPool(object):
+    def test_pool(self):
+        with WorkerPool(n_jobs=2) as pool:
+            assert pool.n_jobs == 2
+            assert pool.map(_square, [1, 2, 3]) == [1, 4, 9]
+            assert pool.starmap(_power, [(2, 3), (3, 2)]) == [8, 9]
+        assert pool.closed
+        with pytest.raises(ValueError):
+            pool.map(_square, [1])
+        with pytest.raises(ValueError):
+            WorkerPool(n_jobs=0)